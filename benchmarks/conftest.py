@@ -0,0 +1,35 @@
+import django
+import pytest
+from django.conf import settings
+
+
+def pytest_configure(config):
+    if settings.configured:
+        return
+    settings.configure(
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"},
+        },
+        SECRET_KEY="not very secret in benchmarks",
+        USE_TZ=True,
+        INSTALLED_APPS=(
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "rest_framework",
+            "benchmarks",
+        ),
+    )
+    django.setup()
+
+
+@pytest.fixture(scope="session")
+def db():
+    from django.apps import apps
+    from django.db import connection
+
+    from benchmarks.models import create_rows
+
+    with connection.schema_editor() as schema_editor:
+        for model in apps.get_app_config("benchmarks").get_models():
+            schema_editor.create_model(model)
+    create_rows()
@@ -0,0 +1,56 @@
+import datetime
+import decimal
+import uuid
+
+from django.db import models
+
+ROWS = 1000
+
+
+class Category(models.Model):
+    name = models.CharField(max_length=100)
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=100)
+
+
+class Product(models.Model):
+    name = models.CharField(max_length=100)
+    sku = models.UUIDField(default=uuid.uuid4)
+    description = models.TextField(blank=True)
+    price = models.DecimalField(max_digits=10, decimal_places=2)
+    stock = models.IntegerField()
+    rating = models.FloatField()
+    active = models.BooleanField(default=True)
+    created = models.DateTimeField()
+    category = models.ForeignKey(Category, on_delete=models.CASCADE)
+    tags = models.ManyToManyField(Tag)
+
+
+def create_rows():
+    categories = Category.objects.bulk_create([Category(name="category%d" % i) for i in range(10)])
+    tags = Tag.objects.bulk_create([Tag(name="tag%d" % i) for i in range(5)])
+    created = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+    products = Product.objects.bulk_create(
+        [
+            Product(
+                name="product%d" % i,
+                description="description of product %d" % i,
+                price=decimal.Decimal("%d.99" % i),
+                stock=i,
+                rating=i / 7,
+                created=created + datetime.timedelta(minutes=i),
+                category=categories[i % len(categories)],
+            )
+            for i in range(ROWS)
+        ]
+    )
+    through = Product.tags.through
+    through.objects.bulk_create(
+        [
+            through(product_id=product.pk, tag_id=tag.pk)
+            for product in products
+            for tag in tags[: product.pk % len(tags)]
+        ]
+    )
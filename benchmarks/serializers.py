@@ -0,0 +1,134 @@
+"""
+Equivalent drf-turbo and DRF serializers used by the benchmarks.
+"""
+import datetime
+import decimal
+
+from rest_framework import serializers
+
+import drf_turbo as dt
+
+from benchmarks.models import Product
+
+
+class Address:
+    def __init__(self, i):
+        self.street = "%d Main Street" % i
+        self.city = "Springfield"
+        self.zip_code = "%05d" % i
+
+
+class User:
+    def __init__(self, i):
+        self.id = i
+        self.username = "user%d" % i
+        self.email = "user%d@example.com" % i
+        self.age = 20 + i % 50
+        self.score = i / 3
+        self.balance = decimal.Decimal("%d.50" % i)
+        self.is_active = i % 2 == 0
+        self.joined = datetime.datetime(2022, 1, 1, tzinfo=datetime.timezone.utc)
+        self.address = Address(i)
+        self.addresses = [Address(i), Address(i + 1)]
+
+
+def make_users(count):
+    return [User(i) for i in range(count)]
+
+
+def user_data(i):
+    return {
+        "id": i,
+        "username": "user%d" % i,
+        "email": "user%d@example.com" % i,
+        "age": 20 + i % 50,
+        "score": i / 3,
+        "balance": "%d.50" % i,
+        "is_active": i % 2 == 0,
+        "joined": "2022-01-01T00:00:00Z",
+        "address": {"street": "%d Main Street" % i, "city": "Springfield", "zip_code": "%05d" % i},
+        "addresses": [{"street": "%d Main Street" % i, "city": "Springfield", "zip_code": "%05d" % i}],
+    }
+
+
+class TurboAddressSerializer(dt.Serializer):
+    street = dt.StrField()
+    city = dt.StrField()
+    zip_code = dt.StrField()
+
+
+class TurboUserSerializer(dt.Serializer):
+    id = dt.IntField()
+    username = dt.StrField()
+    email = dt.EmailField()
+    age = dt.IntField()
+    score = dt.FloatField()
+    balance = dt.DecimalField(max_digits=10, decimal_places=2)
+    is_active = dt.BoolField()
+    joined = dt.DateTimeField()
+
+
+class TurboNestedUserSerializer(TurboUserSerializer):
+    address = TurboAddressSerializer()
+    addresses = TurboAddressSerializer(many=True)
+    city = dt.StrField(attr="address.city")
+    display = dt.MethodField()
+
+    def get_display(self, obj):
+        return "%s <%s>" % (obj.username, obj.email)
+
+
+class DRFAddressSerializer(serializers.Serializer):
+    street = serializers.CharField()
+    city = serializers.CharField()
+    zip_code = serializers.CharField()
+
+
+class DRFUserSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    username = serializers.CharField()
+    email = serializers.EmailField()
+    age = serializers.IntegerField()
+    score = serializers.FloatField()
+    balance = serializers.DecimalField(max_digits=10, decimal_places=2)
+    is_active = serializers.BooleanField()
+    joined = serializers.DateTimeField()
+
+
+class DRFNestedUserSerializer(DRFUserSerializer):
+    address = DRFAddressSerializer()
+    addresses = DRFAddressSerializer(many=True)
+    city = serializers.CharField(source="address.city", read_only=True)
+    display = serializers.SerializerMethodField()
+
+    def get_display(self, obj):
+        return "%s <%s>" % (obj.username, obj.email)
+
+
+class TurboProductSerializer(dt.ModelSerializer):
+    class Meta:
+        model = Product
+        fields = (
+            "id", "name", "sku", "description", "price", "stock", "rating", "active", "created", "category", "tags",
+        )
+
+
+class TurboValuesProductSerializer(dt.ModelSerializer):
+    class Meta:
+        model = Product
+        fields = ("id", "name", "sku", "description", "price", "stock", "rating", "active", "created", "category")
+        use_values_list = True
+
+
+class DRFProductSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Product
+        fields = (
+            "id", "name", "sku", "description", "price", "stock", "rating", "active", "created", "category", "tags",
+        )
+
+
+SERIALIZERS = {
+    "drf-turbo": {"flat": TurboUserSerializer, "nested": TurboNestedUserSerializer},
+    "drf": {"flat": DRFUserSerializer, "nested": DRFNestedUserSerializer},
+}
@@ -0,0 +1,188 @@
+"""
+Per-field benchmarks: ``serialize`` / ``to_representation`` and
+``run_validation`` for every field class, against the matching DRF field.
+"""
+import datetime
+import decimal
+import uuid
+
+import pytest
+from rest_framework import serializers
+
+import drf_turbo as dt
+
+
+class File:
+    name = "file.txt"
+    url = "/media/file.txt"
+
+
+NOW = datetime.datetime(2022, 1, 1, 12, 30, tzinfo=datetime.timezone.utc)
+UUID = uuid.UUID("12345678123456781234567812345678")
+
+# name: (drf-turbo field, DRF field, native value, primitive data).
+# `None` data skips the validation benchmark.
+FIELDS = {
+    "StrField": (lambda: dt.StrField(), lambda: serializers.CharField(), "hello", "hello"),
+    "EmailField": (
+        lambda: dt.EmailField(),
+        lambda: serializers.EmailField(),
+        "user@example.com",
+        "user@example.com",
+    ),
+    "URLField": (
+        lambda: dt.URLField(),
+        lambda: serializers.URLField(),
+        "https://example.com/path",
+        "https://example.com/path",
+    ),
+    "RegexField": (
+        lambda: dt.RegexField(r"^[a-z]+\d+$"),
+        lambda: serializers.RegexField(r"^[a-z]+\d+$"),
+        "abc123",
+        "abc123",
+    ),
+    "IPField": (lambda: dt.IPField(), lambda: serializers.IPAddressField(), "10.0.0.1", "10.0.0.1"),
+    "PasswordField": (lambda: dt.PasswordField(), lambda: serializers.CharField(), "s3cret!", "s3cret!"),
+    "UUIDField": (lambda: dt.UUIDField(), lambda: serializers.UUIDField(), UUID, str(UUID)),
+    "SlugField": (lambda: dt.SlugField(), lambda: serializers.SlugField(), "a-slug", "a-slug"),
+    "IntField": (lambda: dt.IntField(), lambda: serializers.IntegerField(), 42, "42"),
+    "FloatField": (lambda: dt.FloatField(), lambda: serializers.FloatField(), 1.5, "1.5"),
+    "DecimalField": (
+        lambda: dt.DecimalField(max_digits=10, decimal_places=2),
+        lambda: serializers.DecimalField(max_digits=10, decimal_places=2),
+        decimal.Decimal("123.45"),
+        "123.45",
+    ),
+    "BoolField": (lambda: dt.BoolField(), lambda: serializers.BooleanField(), True, "true"),
+    "ChoiceField": (
+        lambda: dt.ChoiceField(choices=["a", "b", "c"]),
+        lambda: serializers.ChoiceField(choices=["a", "b", "c"]),
+        "b",
+        "b",
+    ),
+    "MultipleChoiceField": (
+        lambda: dt.MultipleChoiceField(choices=["a", "b", "c"]),
+        lambda: serializers.MultipleChoiceField(choices=["a", "b", "c"]),
+        {"a", "c"},
+        ["a", "c"],
+    ),
+    "DateTimeField": (
+        lambda: dt.DateTimeField(),
+        lambda: serializers.DateTimeField(),
+        NOW,
+        "2022-01-01T12:30:00Z",
+    ),
+    "DateField": (lambda: dt.DateField(), lambda: serializers.DateField(), NOW.date(), "2022-01-01"),
+    "TimeField": (lambda: dt.TimeField(), lambda: serializers.TimeField(), NOW.time(), "12:30:00"),
+    "FileField": (lambda: dt.FileField(), lambda: serializers.FileField(), File(), None),
+    "ArrayField": (
+        lambda: dt.ArrayField(child=dt.IntField()),
+        lambda: serializers.ListField(child=serializers.IntegerField()),
+        list(range(20)),
+        [str(i) for i in range(20)],
+    ),
+    "DictField": (
+        lambda: dt.DictField(child=dt.IntField()),
+        lambda: serializers.DictField(child=serializers.IntegerField()),
+        {str(i): i for i in range(20)},
+        {str(i): str(i) for i in range(20)},
+    ),
+    "JSONField": (
+        lambda: dt.JSONField(),
+        lambda: serializers.JSONField(),
+        {"a": [1, 2, {"b": None}]},
+        {"a": [1, 2, {"b": None}]},
+    ),
+    "ConstantField": (
+        lambda: dt.ConstantField(constant="v1"),
+        lambda: serializers.CharField(),
+        "v1",
+        "v1",
+    ),
+}
+
+IMPLEMENTATIONS = ["drf-turbo", "drf"]
+
+
+def make_field(name, implementation):
+    turbo, drf, _, _ = FIELDS[name]
+    if implementation == "drf-turbo":
+        field = turbo()
+        field.bind(name.lower(), None)
+    else:
+        field = drf()
+        field.bind(name.lower(), serializers.Serializer())
+    return field
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+@pytest.mark.parametrize("name", list(FIELDS))
+def test_serialize(benchmark, name, implementation):
+    benchmark.group = "field-serialize-%s" % name
+    field = make_field(name, implementation)
+    value = FIELDS[name][2]
+    if implementation == "drf-turbo":
+        benchmark(field.serialize, value, {})
+    else:
+        benchmark(field.to_representation, value)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+@pytest.mark.parametrize("name", [name for name, case in FIELDS.items() if case[3] is not None])
+def test_validate(benchmark, name, implementation):
+    benchmark.group = "field-validate-%s" % name
+    field = make_field(name, implementation)
+    data = FIELDS[name][3]
+    if implementation == "drf-turbo":
+        benchmark(field.run_validation, data, {})
+    else:
+        benchmark(field.run_validation, data)
+
+
+# Payload benchmarks: validating 100k values with one field instance.
+PAYLOAD = ["abc%d" % i for i in range(100000)]
+SLUG_PAYLOAD = ["a-slug-%d" % i for i in range(100000)]
+# A pattern with catastrophic backtracking under `re`, linear under `re2`.
+BACKTRACKING_REGEX = r"^(a+)+$"
+BACKTRACKING_VALUE = "a" * 22 + "b"
+
+
+def validate_all(field, values, implementation):
+    if implementation == "drf":
+        return [field.run_validation(value) for value in values]
+    return [field.run_validation(value, {}) for value in values]
+
+
+@pytest.mark.parametrize("implementation", ["drf-turbo", "drf-turbo-re2", "drf"])
+def test_validate_regex_payload(benchmark, implementation):
+    benchmark.group = "field-validate-payload-RegexField"
+    if implementation == "drf-turbo-re2":
+        pytest.importorskip("re2")
+        field = dt.RegexField(r"^[a-z]+\d+$", use_re2=True)
+        field.bind("regexfield", None)
+    else:
+        field = make_field("RegexField", implementation)
+    benchmark.pedantic(validate_all, (field, PAYLOAD, implementation), rounds=5)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+def test_validate_slug_payload(benchmark, implementation):
+    benchmark.group = "field-validate-payload-SlugField"
+    field = make_field("SlugField", implementation)
+    benchmark.pedantic(validate_all, (field, SLUG_PAYLOAD, implementation), rounds=5)
+
+
+@pytest.mark.parametrize("use_re2", [False, True], ids=["re", "re2"])
+def test_validate_backtracking_regex(benchmark, use_re2):
+    benchmark.group = "field-validate-backtracking-RegexField"
+    if use_re2:
+        pytest.importorskip("re2")
+    field = dt.RegexField(BACKTRACKING_REGEX, use_re2=use_re2)
+    field.bind("regexfield", None)
+
+    def reject():
+        with pytest.raises(dt.ValidationError):
+            field.run_validation(BACKTRACKING_VALUE, {})
+
+    benchmark.pedantic(reject, rounds=3)
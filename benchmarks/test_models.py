@@ -0,0 +1,60 @@
+"""
+ModelSerializer benchmarks against an in-memory SQLite database, including
+the query optimizer and the ``values_list()`` mode.
+"""
+import pytest
+
+from benchmarks.models import Category, Product, Tag
+from benchmarks.serializers import (DRFProductSerializer,
+                                    TurboProductSerializer,
+                                    TurboValuesProductSerializer)
+
+pytestmark = pytest.mark.usefixtures("db")
+
+
+@pytest.mark.parametrize(
+    "implementation",
+    ["drf-turbo", "drf-turbo-optimized", "drf-turbo-values", "drf"],
+)
+def test_serialize_queryset(benchmark, implementation):
+    benchmark.group = "model-serialize-queryset"
+    if implementation == "drf":
+        benchmark(lambda: DRFProductSerializer(Product.objects.all(), many=True).data)
+    elif implementation == "drf-turbo-optimized":
+        benchmark(
+            lambda: TurboProductSerializer(
+                TurboProductSerializer.optimize_queryset(Product.objects.all()), many=True
+            ).data
+        )
+    elif implementation == "drf-turbo-values":
+        benchmark(lambda: TurboValuesProductSerializer(Product.objects.all(), many=True).data)
+    else:
+        benchmark(lambda: TurboProductSerializer(Product.objects.all(), many=True).data)
+
+
+@pytest.mark.parametrize("implementation", ["drf-turbo", "drf"])
+def test_is_valid_related(benchmark, implementation):
+    benchmark.group = "model-is-valid-related"
+    category = Category.objects.first()
+    tags = list(Tag.objects.values_list("pk", flat=True))
+    data = [
+        {
+            "name": "product%d" % i,
+            "description": "description",
+            "price": "1.99",
+            "stock": i,
+            "rating": 1.5,
+            "active": True,
+            "created": "2022-01-01T00:00:00Z",
+            "category": category.pk,
+            "tags": tags,
+        }
+        for i in range(100)
+    ]
+    serializer_class = TurboProductSerializer if implementation == "drf-turbo" else DRFProductSerializer
+
+    def run():
+        serializer = serializer_class(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+
+    benchmark(run)
@@ -0,0 +1,91 @@
+"""
+Serializer benchmarks: serialization, deserialization and ``is_valid`` of flat
+and nested serializers, ``many=True`` lists of 1 / 100 / 10k rows and
+``only`` / ``exclude`` selections, against the equivalent DRF serializers.
+"""
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from benchmarks.serializers import SERIALIZERS, make_users, user_data
+
+IMPLEMENTATIONS = ["drf-turbo", "drf"]
+SIZES = [1, 100, 10000]
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+@pytest.mark.parametrize("kind", ["flat", "nested"])
+def test_serialize_one(benchmark, kind, implementation):
+    benchmark.group = "serialize-one-%s" % kind
+    serializer_class = SERIALIZERS[implementation][kind]
+    user = make_users(1)[0]
+    benchmark(lambda: serializer_class(user).data)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kind", ["flat", "nested"])
+def test_serialize_many(benchmark, kind, size, implementation):
+    benchmark.group = "serialize-many-%s-%d" % (kind, size)
+    serializer_class = SERIALIZERS[implementation][kind]
+    users = make_users(size)
+    benchmark(lambda: serializer_class(users, many=True).data)
+
+
+@pytest.mark.parametrize("implementation", ["drf-turbo-json-bytes", "drf-turbo", "drf"])
+@pytest.mark.parametrize("size", SIZES)
+def test_render_many(benchmark, size, implementation):
+    benchmark.group = "render-many-nested-%d" % size
+    serializer_class = SERIALIZERS[implementation.replace("-json-bytes", "")]["nested"]
+    users = make_users(size)
+    renderer = JSONRenderer()
+    if implementation == "drf-turbo-json-bytes":
+        benchmark(lambda: serializer_class(users, many=True).json_bytes)
+    else:
+        benchmark(lambda: renderer.render(serializer_class(users, many=True).data))
+
+
+@pytest.mark.parametrize("selection", ["only", "exclude"])
+@pytest.mark.parametrize("size", [1, 100])
+def test_serialize_selection(benchmark, size, selection):
+    benchmark.group = "serialize-%s-%d" % (selection, size)
+    serializer_class = SERIALIZERS["drf-turbo"]["nested"]
+    users = make_users(size)
+    kwargs = {selection: ("id", "username", "address__city")}
+    benchmark(lambda: serializer_class(users, many=True, **kwargs).data)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+@pytest.mark.parametrize("kind", ["flat", "nested"])
+def test_is_valid_one(benchmark, kind, implementation):
+    benchmark.group = "is-valid-one-%s" % kind
+    serializer_class = SERIALIZERS[implementation][kind]
+    data = user_data(1)
+
+    def run():
+        serializer = serializer_class(data=data)
+        assert serializer.is_valid(), serializer.errors
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("implementation", IMPLEMENTATIONS)
+@pytest.mark.parametrize("size", SIZES)
+@pytest.mark.parametrize("kind", ["flat", "nested"])
+def test_is_valid_many(benchmark, kind, size, implementation):
+    benchmark.group = "is-valid-many-%s-%d" % (kind, size)
+    serializer_class = SERIALIZERS[implementation][kind]
+    data = [user_data(i) for i in range(size)]
+
+    def run():
+        serializer = serializer_class(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+
+    benchmark(run)
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_deserialize_many(benchmark, size):
+    benchmark.group = "deserialize-many-flat-%d" % size
+    serializer = SERIALIZERS["drf-turbo"]["flat"](many=True)
+    data = [user_data(i) for i in range(size)]
+    benchmark(serializer.deserialize, data, {})
@@ -0,0 +1,359 @@
+import uuid
+import weakref
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+
+from drf_turbo.utils import LRUCache
+
+# The result caches in use, for the writes that send no model signals.
+_result_caches = weakref.WeakSet()
+
+
+def invalidate_rows(model, pks, through=None):
+    """
+    Call :meth:`BaseResultCache.invalidate_rows` on every result cache.
+    """
+    for cache in list(_result_caches):
+        cache.invalidate_rows(model, pks, through)
+
+
+class BaseResultCache:
+    """
+    Base class for caches of serialized model instances.
+
+    Set an instance as ``Meta.result_cache`` on a serializer to have it look up
+    the representation of each model instance before serializing its fields.
+    Entries are keyed by the serializer class, the field selection, the
+    instance pk and, if ``version_field`` is set, the value of that field
+    (e.g. an ``updated_at`` column). The entries of an instance are dropped
+    when it is saved or deleted, and when the related rows it is serialized
+    from change: those of nested serializers, dotted sources and to-many
+    fields, including many-to-many additions and removals. Rows read by
+    method fields or properties are not tracked; use ``version_field`` or
+    :meth:`invalidate` for those. ``many=True`` saves with
+    ``Meta.bulk_save`` invalidate the rows they write with
+    :meth:`invalidate_rows`, as bulk writes send no model signals; call it
+    after other bulk writes.
+
+    Only cache serializers whose output does not depend on the context (e.g.
+    the request user). Nested values of cached representations are shared
+    between hits and should not be modified.
+
+    Backends store all the entries of an instance under a single key and
+    implement :meth:`get_entries`, :meth:`set_entries`, :meth:`delete_entries`
+    and :meth:`clear`.
+
+    :param version_field: The name of a model field whose value changes
+        whenever the instance does.
+    """
+
+    def __init__(self, version_field=None):
+        self.version_field = version_field
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._models = set()
+        self._relations = {}
+        self._through = {}
+        _result_caches.add(self)
+
+    def get_entries(self, key):
+        """
+        Return the dict of entries stored for the instance `key`, or ``None``.
+        """
+        raise NotImplementedError('`get_entries()` must be implemented.')
+
+    def set_entries(self, key, entries):
+        """
+        Store the dict of entries of the instance `key`.
+        """
+        raise NotImplementedError('`set_entries()` must be implemented.')
+
+    def delete_entries(self, key):
+        """
+        Drop the entries of the instance `key`.
+        """
+        raise NotImplementedError('`delete_entries()` must be implemented.')
+
+    def clear(self):
+        """
+        Drop all the entries of the cache.
+        """
+        raise NotImplementedError('`clear()` must be implemented.')
+
+    @property
+    def evictions(self):
+        """
+        The number of instances evicted to respect the size bound.
+        """
+        return 0
+
+    @property
+    def hit_rate(self):
+        """
+        The fraction of lookups that were hits.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        """
+        Return the counters of the cache as a dict.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hit_rate,
+            'evictions': self.evictions,
+            'invalidations': self.invalidations,
+        }
+
+    def instance_key(self, model, pk):
+        return '%s:%s' % (model._meta.label_lower, pk)
+
+    def version(self, instance):
+        if self.version_field is None:
+            return None
+        return getattr(instance, self.version_field)
+
+    def get(self, serializer_key, instance):
+        """
+        Return the cached representation of `instance`, or ``None``.
+
+        :param serializer_key: The serializer class and field selection.
+        :param instance: The model instance.
+        """
+        entries = self.get_entries(self.instance_key(type(instance), instance.pk))
+        if entries is not None:
+            value = entries.get((serializer_key, self.version(instance)))
+            if value is not None:
+                self.hits += 1
+                return value
+        self.misses += 1
+        return None
+
+    def set(self, serializer_key, instance, value):
+        """
+        Cache the representation of `instance`.
+
+        :param serializer_key: The serializer class and field selection.
+        :param instance: The model instance.
+        :param value: The serialized representation.
+        """
+        model = type(instance)
+        if model not in self._models:
+            self.connect(model)
+        key = self.instance_key(model, instance.pk)
+        version = self.version(instance)
+        entries = self.get_entries(key) or {}
+        # Entries of older versions are never read again.
+        entries = {
+            entry_key: entry for entry_key, entry in entries.items()
+            if entry_key[1] == version
+        }
+        entries[(serializer_key, version)] = value
+        self.set_entries(key, entries)
+
+    def invalidate(self, model, pk):
+        """
+        Drop the cached representations of the instance of `model` with `pk`.
+        """
+        self.invalidations += 1
+        self.delete_entries(self.instance_key(model, pk))
+
+    def invalidate_rows(self, model, pks, through=None):
+        """
+        Drop the entries that read the rows of `model` with `pks`, for writes
+        that send no model signals such as `bulk_create` and `bulk_update`.
+        Call it before and after updates, to cover the rows that a change
+        detaches as well as the ones it attaches.
+
+        :param model: The model of the written rows.
+        :param pks: The primary keys of the written rows.
+        :param through: The many-to-many through model whose rows were
+            written for the `model` instances, if any.
+        """
+        if through is not None:
+            for root, source, source_lookup, target, target_lookup in self._through.get(through, ()):
+                if issubclass(model, source):
+                    self._invalidate_related(root, source_lookup, pks)
+                if issubclass(model, target):
+                    self._invalidate_related(root, target_lookup, pks)
+            return
+        if model in self._models:
+            for pk in pks:
+                self.invalidate(model, pk)
+        for root, lookup in self._relations.get(model, ()):
+            self._invalidate_related(root, lookup, pks)
+
+    def connect(self, model):
+        """
+        Invalidate the entries of `model` instances when they are saved or
+        deleted.
+        """
+        self._models.add(model)
+        post_save.connect(self._receiver, sender=model, weak=False, dispatch_uid=(id(self), model))
+        post_delete.connect(self._receiver, sender=model, weak=False, dispatch_uid=(id(self), model))
+
+    def connect_relations(self, model, related=(), through=()):
+        """
+        Invalidate the entries of `model` instances when the related rows they
+        are serialized from are saved or deleted, or when many-to-many rows are
+        added or removed.
+
+        :param model: The model of the cached instances.
+        :param related: ``(related model, lookup)`` pairs, where `lookup` is
+            the query lookup from `model` to the related model.
+        :param through: ``(through model, source model, source lookup, target
+            model, target lookup)`` tuples for many-to-many relations, with the
+            lookups from `model` to each side (``''`` for `model` itself).
+        """
+        for related_model, lookup in related:
+            self._relations.setdefault(related_model, set()).add((model, lookup))
+            uid = (id(self), 'related', related_model)
+            pre_save.connect(self._related_receiver, sender=related_model, weak=False, dispatch_uid=uid)
+            post_save.connect(self._related_receiver, sender=related_model, weak=False, dispatch_uid=uid)
+            pre_delete.connect(self._related_receiver, sender=related_model, weak=False, dispatch_uid=uid)
+        for relation in through:
+            self._through.setdefault(relation[0], set()).add((model,) + tuple(relation[1:]))
+            m2m_changed.connect(
+                self._m2m_receiver, sender=relation[0], weak=False, dispatch_uid=(id(self), 'through', relation[0]),
+            )
+
+    def disconnect(self):
+        """
+        Stop listening to model signals, e.g. before discarding the cache.
+        """
+        for model in self._models:
+            post_save.disconnect(sender=model, dispatch_uid=(id(self), model))
+            post_delete.disconnect(sender=model, dispatch_uid=(id(self), model))
+        for related_model in self._relations:
+            uid = (id(self), 'related', related_model)
+            for signal in (pre_save, post_save, pre_delete):
+                signal.disconnect(sender=related_model, dispatch_uid=uid)
+        for through_model in self._through:
+            m2m_changed.disconnect(sender=through_model, dispatch_uid=(id(self), 'through', through_model))
+        self._models = set()
+        self._relations = {}
+        self._through = {}
+
+    def _receiver(self, sender, instance, **kwargs):
+        self.invalidate(sender, instance.pk)
+
+    def _invalidate_related(self, model, lookup, pks):
+        """
+        Invalidate the instances of `model` whose `lookup` is in `pks`.
+        """
+        if lookup:
+            pks = model._default_manager.filter(**{lookup + '__in': pks}).values_list('pk', flat=True)
+        for pk in pks:
+            self.invalidate(model, pk)
+
+    def _related_receiver(self, sender, instance, **kwargs):
+        # Called before and after saves, to cover rows that a change
+        # detaches as well as the ones it attaches.
+        if instance.pk is None or kwargs.get('raw'):
+            return
+        for model, lookup in self._relations.get(sender, ()):
+            self._invalidate_related(model, lookup, [instance.pk])
+
+    def _m2m_receiver(self, sender, instance, action, model, pk_set, **kwargs):
+        if action not in ('post_add', 'post_remove', 'pre_clear'):
+            return
+        for root, source, source_lookup, target, target_lookup in self._through.get(sender, ()):
+            if isinstance(instance, source) and issubclass(model, target):
+                self._invalidate_related(root, source_lookup, [instance.pk])
+            elif pk_set is not None:
+                # Changed from the target side: `pk_set` are the sources.
+                self._invalidate_related(root, source_lookup, list(pk_set))
+            else:
+                self._invalidate_related(root, target_lookup, [instance.pk])
+
+
+class ResultCache(BaseResultCache):
+    """
+    An in-process result cache that keeps the most recently used instances.
+
+    :param maxsize: The maximum number of instances to keep.
+    :param version_field: The name of a model field whose value changes
+        whenever the instance does.
+    """
+
+    def __init__(self, maxsize=1024, version_field=None):
+        super().__init__(version_field=version_field)
+        self._data = LRUCache(maxsize=maxsize)
+
+    def get_entries(self, key):
+        return self._data.get(key)
+
+    def set_entries(self, key, entries):
+        self._data.set(key, entries)
+
+    def delete_entries(self, key):
+        self._data.pop(key)
+
+    def clear(self):
+        self._data.clear()
+
+    @property
+    def evictions(self):
+        return self._data.evictions
+
+    def __len__(self):
+        return len(self._data)
+
+
+class DjangoResultCache(BaseResultCache):
+    """
+    A result cache stored in a Django cache backend, shared between processes.
+    Evictions are left to the backend and are not counted. Keys include a
+    namespace stored under the prefix, which :meth:`clear` replaces instead
+    of flushing the backend; the old entries expire with their timeout.
+
+    :param alias: The alias of the cache in ``settings.CACHES``.
+    :param timeout: The timeout of the entries, defaults to the backend's.
+    :param prefix: A prefix for the keys of the entries.
+    :param version_field: The name of a model field whose value changes
+        whenever the instance does.
+    """
+
+    def __init__(self, alias=DEFAULT_CACHE_ALIAS, timeout=DEFAULT_TIMEOUT, prefix='drf_turbo', version_field=None):
+        super().__init__(version_field=version_field)
+        self.alias = alias
+        self.timeout = timeout
+        self.prefix = prefix
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    @property
+    def namespace_key(self):
+        return '%s:namespace' % self.prefix
+
+    def namespace(self):
+        """
+        Return the current namespace of the keys.
+        """
+        namespace = self.cache.get(self.namespace_key)
+        if namespace is None:
+            self.cache.add(self.namespace_key, uuid.uuid4().hex, None)
+            namespace = self.cache.get(self.namespace_key)
+        return namespace
+
+    def instance_key(self, model, pk):
+        return '%s:%s:%s' % (self.prefix, self.namespace(), super().instance_key(model, pk))
+
+    def get_entries(self, key):
+        return self.cache.get(key)
+
+    def set_entries(self, key, entries):
+        self.cache.set(key, entries, self.timeout)
+
+    def delete_entries(self, key):
+        self.cache.delete(key)
+
+    def clear(self):
+        self.cache.set(self.namespace_key, uuid.uuid4().hex, None)
@@ -0,0 +1,18 @@
+cdef class JSONWriter:
+    cdef:
+        char* buf
+        Py_ssize_t length
+        Py_ssize_t capacity
+        int depth
+        readonly bint allow_nan
+
+    cdef int _reserve(self, Py_ssize_t size) except -1
+    cdef int write(self, const char* data, Py_ssize_t size) except -1
+    cdef int write_char(self, char c) except -1
+    cdef int write_str(self, object value) except -1
+    cdef int write_int(self, object value) except -1
+    cdef int write_float(self, double value) except -1
+    cdef int write_float_key(self, double value) except -1
+    cdef int write_key(self, object key) except -1
+    cdef int write_value(self, object value) except -1
+    cpdef object getvalue(self)
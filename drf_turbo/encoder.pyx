@@ -0,0 +1,263 @@
+# cython: language_level=3
+
+from cpython.conversion cimport Py_DTSF_ADD_DOT_0, PyOS_double_to_string
+from cpython.long cimport PY_LONG_LONG
+from cpython.mem cimport PyMem_Free, PyMem_Malloc, PyMem_Realloc
+from cpython.memoryview cimport PyMemoryView_FromMemory
+from cpython.buffer cimport PyBUF_READ
+from libc.math cimport isfinite
+from libc.stdio cimport snprintf
+from libc.string cimport memcpy
+
+from rest_framework.utils.encoders import JSONEncoder
+
+cimport cython
+
+
+cdef extern from "Python.h":
+    const char* PyUnicode_AsUTF8AndSize(object unicode, Py_ssize_t *size) except NULL
+    PY_LONG_LONG PyLong_AsLongLongAndOverflow(object pylong, int *overflow) except? -1
+
+
+# Objects the encoder has no native representation for are converted the
+# same way DRF's `JSONRenderer` does it.
+cdef object _default = JSONEncoder().default
+
+cdef const char* HEX_DIGITS = b'0123456789abcdef'
+cdef int MAX_DEPTH = 1000
+
+
+class RawJSON(bytes):
+    """
+    UTF-8 bytes holding an already encoded JSON value. The encoder writes
+    instances verbatim, so they can be nested inside other data, e.g. a
+    paginated response.
+    """
+
+
+cdef class JSONWriter:
+    """
+    Writes compact UTF-8 JSON into a growable byte buffer.
+
+    :param capacity: The initial size of the buffer.
+    :param allow_nan: Whether to write ``NaN`` and ``Infinity`` for
+        non-finite floats instead of raising ``ValueError``.
+    """
+
+    def __cinit__(self, Py_ssize_t capacity=4096, bint allow_nan=False):
+        self.buf = <char*>PyMem_Malloc(capacity)
+        if self.buf is NULL:
+            raise MemoryError()
+        self.length = 0
+        self.capacity = capacity
+        self.depth = 0
+        self.allow_nan = allow_nan
+
+    def __dealloc__(self):
+        PyMem_Free(self.buf)
+
+    cdef int _reserve(self, Py_ssize_t size) except -1:
+        cdef Py_ssize_t capacity = self.capacity
+        cdef char* buf
+        if self.length + size <= capacity:
+            return 0
+        while self.length + size > capacity:
+            capacity *= 2
+        buf = <char*>PyMem_Realloc(self.buf, capacity)
+        if buf is NULL:
+            raise MemoryError()
+        self.buf = buf
+        self.capacity = capacity
+        return 0
+
+    cdef int write(self, const char* data, Py_ssize_t size) except -1:
+        self._reserve(size)
+        memcpy(self.buf + self.length, data, size)
+        self.length += size
+        return 0
+
+    cdef int write_char(self, char c) except -1:
+        self._reserve(1)
+        self.buf[self.length] = c
+        self.length += 1
+        return 0
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef int write_str(self, object value) except -1:
+        """
+        Write a quoted, escaped JSON string. Non-ASCII characters are kept as
+        UTF-8 except U+2028 and U+2029, which are escaped like DRF does.
+        """
+        cdef Py_ssize_t size, i, start = 0
+        cdef const char* data = PyUnicode_AsUTF8AndSize(value, &size)
+        cdef unsigned char c
+        cdef char escape[6]
+        self._reserve(size + 2)
+        self.buf[self.length] = b'"'
+        self.length += 1
+        for i in range(size):
+            c = <unsigned char>data[i]
+            if c >= 0x20 and c != b'"' and c != b'\\' and c != 0xE2:
+                continue
+            if (
+                c == 0xE2
+                and not (
+                    i + 2 < size
+                    and <unsigned char>data[i + 1] == 0x80
+                    and (<unsigned char>data[i + 2] == 0xA8 or <unsigned char>data[i + 2] == 0xA9)
+                )
+            ):
+                continue
+            self.write(data + start, i - start)
+            if c == b'"':
+                self.write(b'\\"', 2)
+            elif c == b'\\':
+                self.write(b'\\\\', 2)
+            elif c == b'\n':
+                self.write(b'\\n', 2)
+            elif c == b'\r':
+                self.write(b'\\r', 2)
+            elif c == b'\t':
+                self.write(b'\\t', 2)
+            elif c == 0x08:
+                self.write(b'\\b', 2)
+            elif c == 0x0C:
+                self.write(b'\\f', 2)
+            elif c == 0xE2:
+                # U+2028 / U+2029: the escape replaces all three bytes.
+                self.write(b'\\u202', 5)
+                self.write_char(b'8' if <unsigned char>data[i + 2] == 0xA8 else b'9')
+                start = i + 3
+                continue
+            else:
+                escape[0] = b'\\'
+                escape[1] = b'u'
+                escape[2] = b'0'
+                escape[3] = b'0'
+                escape[4] = HEX_DIGITS[c >> 4]
+                escape[5] = HEX_DIGITS[c & 0xF]
+                self.write(escape, 6)
+            start = i + 1
+        if start < size:
+            self.write(data + start, size - start)
+        self.write_char(b'"')
+        return 0
+
+    cdef int write_int(self, object value) except -1:
+        cdef int overflow = 0
+        cdef PY_LONG_LONG number = PyLong_AsLongLongAndOverflow(value, &overflow)
+        cdef char digits[24]
+        cdef int size
+        if overflow:
+            text = int.__repr__(value).encode('ascii')
+            return self.write(text, len(text))
+        size = snprintf(digits, sizeof(digits), b'%lld', number)
+        return self.write(digits, size)
+
+    cdef int write_float(self, double value) except -1:
+        cdef char* text
+        if not isfinite(value):
+            if not self.allow_nan:
+                raise ValueError('Out of range float values are not JSON compliant')
+            if value != value:
+                return self.write(b'NaN', 3)
+            if value > 0:
+                return self.write(b'Infinity', 8)
+            return self.write(b'-Infinity', 9)
+        text = PyOS_double_to_string(value, b'r', 0, Py_DTSF_ADD_DOT_0, NULL)
+        try:
+            self.write(text, len(text))
+        finally:
+            PyMem_Free(text)
+        return 0
+
+    cdef int write_float_key(self, double value) except -1:
+        if isfinite(value):
+            return self.write_str(float.__repr__(value))
+        if not self.allow_nan:
+            raise ValueError('Out of range float values are not JSON compliant')
+        if value != value:
+            return self.write(b'"NaN"', 5)
+        if value > 0:
+            return self.write(b'"Infinity"', 10)
+        return self.write(b'"-Infinity"', 11)
+
+    cdef int write_key(self, object key) except -1:
+        if isinstance(key, str):
+            self.write_str(key)
+        elif key is True:
+            self.write(b'"true"', 6)
+        elif key is False:
+            self.write(b'"false"', 7)
+        elif key is None:
+            self.write(b'"null"', 6)
+        elif isinstance(key, int):
+            self.write_str(int.__repr__(key))
+        elif isinstance(key, float):
+            self.write_float_key(key)
+        else:
+            raise TypeError(
+                'keys must be str, int, float, bool or None, not %s' % type(key).__name__
+            )
+        return self.write_char(b':')
+
+    cdef int write_value(self, object value) except -1:
+        cdef bint first = True
+        if value is None:
+            return self.write(b'null', 4)
+        if value is True:
+            return self.write(b'true', 4)
+        if value is False:
+            return self.write(b'false', 5)
+        if isinstance(value, str):
+            return self.write_str(value)
+        if isinstance(value, int):
+            return self.write_int(value)
+        if isinstance(value, float):
+            return self.write_float(value)
+        if isinstance(value, RawJSON):
+            return self.write(value, len(value))
+
+        self.depth += 1
+        if self.depth > MAX_DEPTH:
+            raise ValueError('Circular reference detected')
+        if isinstance(value, dict):
+            self.write_char(b'{')
+            for key, item in (<dict>value).items():
+                if not first:
+                    self.write_char(b',')
+                first = False
+                self.write_key(key)
+                self.write_value(item)
+            self.write_char(b'}')
+        elif isinstance(value, (list, tuple)):
+            self.write_char(b'[')
+            for item in value:
+                if not first:
+                    self.write_char(b',')
+                first = False
+                self.write_value(item)
+            self.write_char(b']')
+        else:
+            self.write_value(_default(value))
+        self.depth -= 1
+        return 0
+
+    cpdef object getvalue(self):
+        """
+        Return the written JSON as :class:`RawJSON`.
+        """
+        return RawJSON(PyMemoryView_FromMemory(self.buf, self.length, PyBUF_READ))
+
+
+def encode_json(object value, bint allow_nan=False):
+    """
+    Encode a value to compact UTF-8 JSON, matching DRF's `JSONRenderer` output.
+
+    :param value: The value to encode.
+    :param allow_nan: Whether to allow non-finite floats.
+    """
+    cdef JSONWriter writer = JSONWriter(allow_nan=allow_nan)
+    writer.write_value(value)
+    return writer.getvalue()
@@ -931,10 +931,12 @@ struct __pyx_obj_9drf_turbo_10exceptions_ValidationError;
  */
 struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException {
   PyBaseExceptionObject __pyx_base;
+  PyObject *_detail;
+  int _normalized;
 };
 
 
-/* "drf_turbo/exceptions.pyx":25
+/* "drf_turbo/exceptions.pyx":43
  *         return str(self.detail)
  * 
  * cdef class ValidationError(DrfTurboException):             # <<<<<<<<<<<<<<
@@ -1135,15 +1137,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject
 /* PyObjectCallOneArg.proto */
 static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
 
-/* PyObjectSetAttrStr.proto */
-#if CYTHON_USE_TYPE_SLOTS
-#define __Pyx_PyObject_DelAttrStr(o,n) __Pyx_PyObject_SetAttrStr(o, n, NULL)
-static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value);
-#else
-#define __Pyx_PyObject_DelAttrStr(o,n)   PyObject_DelAttr(o,n)
-#define __Pyx_PyObject_SetAttrStr(o,n,v) PyObject_SetAttr(o,n,v)
-#endif
-
 /* PyThreadStateGet.proto */
 #if CYTHON_FAST_THREAD_STATE
 #define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
@@ -1310,6 +1303,7 @@ static const char __pyx_k_prepare[] = "__prepare__";
 static const char __pyx_k_getstate[] = "__getstate__";
 static const char __pyx_k_qualname[] = "__qualname__";
 static const char __pyx_k_setstate[] = "__setstate__";
+static const char __pyx_k_ErrorList[] = "ErrorList";
 static const char __pyx_k_TypeError[] = "TypeError";
 static const char __pyx_k_metaclass[] = "__metaclass__";
 static const char __pyx_k_reduce_ex[] = "__reduce_ex__";
@@ -1331,6 +1325,7 @@ static const char __pyx_k_StringNotCollectionError[] = "StringNotCollectionError
 static const char __pyx_k_no_default___reduce___due_to_non[] = "no default __reduce__ due to non-trivial __cinit__";
 static PyObject *__pyx_kp_u_A_server_error_occurred;
 static PyObject *__pyx_n_s_DrfTurboException;
+static PyObject *__pyx_n_s_ErrorList;
 static PyObject *__pyx_kp_u_Invalid_input;
 static PyObject *__pyx_n_s_OnlyAndExcludeError;
 static PyObject *__pyx_n_s_StringNotCollectionError;
@@ -1364,6 +1359,8 @@ static PyObject *__pyx_n_s_setstate_cython;
 static PyObject *__pyx_n_s_status_code;
 static PyObject *__pyx_n_s_test;
 static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException___cinit__(struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *__pyx_v_self, PyObject *__pyx_v_detail, PyObject *__pyx_v_code); /* proto */
+static PyObject *__pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_6detail___get__(struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *__pyx_v_self); /* proto */
+static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_6detail_2__set__(struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
 static PyObject *__pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_2__str__(struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_4__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *__pyx_v_self); /* proto */
 static PyObject *__pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_6__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
@@ -1379,8 +1376,8 @@ static PyObject *__pyx_tuple__3;
 static PyObject *__pyx_tuple__4;
 /* Late includes */
 
-/* "drf_turbo/exceptions.pyx":14
- *     default_code = 'error'
+/* "drf_turbo/exceptions.pyx":17
+ *     cdef bint _normalized
  * 
  *     def __cinit__(self, detail=None, code=None) -> None:             # <<<<<<<<<<<<<<
  *         if detail is None:
@@ -1429,7 +1426,7 @@ static int __pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_1__cinit__(PyObj
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 14, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 17, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1446,7 +1443,7 @@ static int __pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_1__cinit__(PyObj
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 14, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 17, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("drf_turbo.exceptions.DrfTurboException.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1465,8 +1462,6 @@ static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException___cinit__(struct
   int __pyx_t_1;
   int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1474,7 +1469,7 @@ static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException___cinit__(struct
   __Pyx_INCREF(__pyx_v_detail);
   __Pyx_INCREF(__pyx_v_code);
 
-  /* "drf_turbo/exceptions.pyx":15
+  /* "drf_turbo/exceptions.pyx":18
  * 
  *     def __cinit__(self, detail=None, code=None) -> None:
  *         if detail is None:             # <<<<<<<<<<<<<<
@@ -1485,19 +1480,19 @@ static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException___cinit__(struct
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "drf_turbo/exceptions.pyx":16
+    /* "drf_turbo/exceptions.pyx":19
  *     def __cinit__(self, detail=None, code=None) -> None:
  *         if detail is None:
  *             detail = self.default_detail             # <<<<<<<<<<<<<<
  *         if code is None:
  *             code = self.default_code
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_default_detail); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 16, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_default_detail); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 19, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF_SET(__pyx_v_detail, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "drf_turbo/exceptions.pyx":15
+    /* "drf_turbo/exceptions.pyx":18
  * 
  *     def __cinit__(self, detail=None, code=None) -> None:
  *         if detail is None:             # <<<<<<<<<<<<<<
@@ -1506,7 +1501,7 @@ static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException___cinit__(struct
  */
   }
 
-  /* "drf_turbo/exceptions.pyx":17
+  /* "drf_turbo/exceptions.pyx":20
  *         if detail is None:
  *             detail = self.default_detail
  *         if code is None:             # <<<<<<<<<<<<<<
@@ -1517,19 +1512,19 @@ static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException___cinit__(struct
   __pyx_t_1 = (__pyx_t_2 != 0);
   if (__pyx_t_1) {
 
-    /* "drf_turbo/exceptions.pyx":18
+    /* "drf_turbo/exceptions.pyx":21
  *             detail = self.default_detail
  *         if code is None:
  *             code = self.default_code             # <<<<<<<<<<<<<<
  * 
- *         self.detail = get_execption_detail(detail)
+ *         self._detail = detail
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_default_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 18, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_default_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 21, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF_SET(__pyx_v_code, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "drf_turbo/exceptions.pyx":17
+    /* "drf_turbo/exceptions.pyx":20
  *         if detail is None:
  *             detail = self.default_detail
  *         if code is None:             # <<<<<<<<<<<<<<
@@ -1538,35 +1533,21 @@ static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException___cinit__(struct
  */
   }
 
-  /* "drf_turbo/exceptions.pyx":20
+  /* "drf_turbo/exceptions.pyx":23
  *             code = self.default_code
  * 
- *         self.detail = get_execption_detail(detail)             # <<<<<<<<<<<<<<
+ *         self._detail = detail             # <<<<<<<<<<<<<<
  * 
- *     def __str__(self) -> str:
+ *     @property
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_get_execption_detail); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
-    __pyx_t_5 = PyMethod_GET_SELF(__pyx_t_4);
-    if (likely(__pyx_t_5)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
-      __Pyx_INCREF(__pyx_t_5);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_4, function);
-    }
-  }
-  __pyx_t_3 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_5, __pyx_v_detail) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_v_detail);
-  __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_detail, __pyx_t_3) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __Pyx_INCREF(__pyx_v_detail);
+  __Pyx_GIVEREF(__pyx_v_detail);
+  __Pyx_GOTREF(__pyx_v_self->_detail);
+  __Pyx_DECREF(__pyx_v_self->_detail);
+  __pyx_v_self->_detail = __pyx_v_detail;
 
-  /* "drf_turbo/exceptions.pyx":14
- *     default_code = 'error'
+  /* "drf_turbo/exceptions.pyx":17
+ *     cdef bint _normalized
  * 
  *     def __cinit__(self, detail=None, code=None) -> None:             # <<<<<<<<<<<<<<
  *         if detail is None:
@@ -1578,8 +1559,6 @@ static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException___cinit__(struct
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
-  __Pyx_XDECREF(__pyx_t_4);
-  __Pyx_XDECREF(__pyx_t_5);
   __Pyx_AddTraceback("drf_turbo.exceptions.DrfTurboException.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __pyx_r = -1;
   __pyx_L0:;
@@ -1589,8 +1568,194 @@ static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException___cinit__(struct
   return __pyx_r;
 }
 
-/* "drf_turbo/exceptions.pyx":22
- *         self.detail = get_execption_detail(detail)
+/* "drf_turbo/exceptions.pyx":26
+ * 
+ *     @property
+ *     def detail(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         The error detail, normalized to strings the first time it is read.
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_6detail_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_6detail_1__get__(PyObject *__pyx_v_self) {
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_6detail___get__(((struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_6detail___get__(struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "drf_turbo/exceptions.pyx":30
+ *         The error detail, normalized to strings the first time it is read.
+ *         """
+ *         if not self._normalized:             # <<<<<<<<<<<<<<
+ *             self._detail = get_execption_detail(self._detail)
+ *             self._normalized = True
+ */
+  __pyx_t_1 = ((!(__pyx_v_self->_normalized != 0)) != 0);
+  if (__pyx_t_1) {
+
+    /* "drf_turbo/exceptions.pyx":31
+ *         """
+ *         if not self._normalized:
+ *             self._detail = get_execption_detail(self._detail)             # <<<<<<<<<<<<<<
+ *             self._normalized = True
+ *         return self._detail
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_get_execption_detail); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 31, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __pyx_t_4 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
+      __pyx_t_4 = PyMethod_GET_SELF(__pyx_t_3);
+      if (likely(__pyx_t_4)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_4);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_3, function);
+      }
+    }
+    __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_v_self->_detail) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_self->_detail);
+    __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 31, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __Pyx_GIVEREF(__pyx_t_2);
+    __Pyx_GOTREF(__pyx_v_self->_detail);
+    __Pyx_DECREF(__pyx_v_self->_detail);
+    __pyx_v_self->_detail = __pyx_t_2;
+    __pyx_t_2 = 0;
+
+    /* "drf_turbo/exceptions.pyx":32
+ *         if not self._normalized:
+ *             self._detail = get_execption_detail(self._detail)
+ *             self._normalized = True             # <<<<<<<<<<<<<<
+ *         return self._detail
+ * 
+ */
+    __pyx_v_self->_normalized = 1;
+
+    /* "drf_turbo/exceptions.pyx":30
+ *         The error detail, normalized to strings the first time it is read.
+ *         """
+ *         if not self._normalized:             # <<<<<<<<<<<<<<
+ *             self._detail = get_execption_detail(self._detail)
+ *             self._normalized = True
+ */
+  }
+
+  /* "drf_turbo/exceptions.pyx":33
+ *             self._detail = get_execption_detail(self._detail)
+ *             self._normalized = True
+ *         return self._detail             # <<<<<<<<<<<<<<
+ * 
+ *     @detail.setter
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->_detail);
+  __pyx_r = __pyx_v_self->_detail;
+  goto __pyx_L0;
+
+  /* "drf_turbo/exceptions.pyx":26
+ * 
+ *     @property
+ *     def detail(self):             # <<<<<<<<<<<<<<
+ *         """
+ *         The error detail, normalized to strings the first time it is read.
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_AddTraceback("drf_turbo.exceptions.DrfTurboException.detail.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "drf_turbo/exceptions.pyx":36
+ * 
+ *     @detail.setter
+ *     def detail(self, value):             # <<<<<<<<<<<<<<
+ *         self._detail = value
+ *         self._normalized = False
+ */
+
+/* Python wrapper */
+static int __pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_6detail_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_6detail_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_6detail_2__set__(((struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_6detail_2__set__(struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 0);
+
+  /* "drf_turbo/exceptions.pyx":37
+ *     @detail.setter
+ *     def detail(self, value):
+ *         self._detail = value             # <<<<<<<<<<<<<<
+ *         self._normalized = False
+ * 
+ */
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->_detail);
+  __Pyx_DECREF(__pyx_v_self->_detail);
+  __pyx_v_self->_detail = __pyx_v_value;
+
+  /* "drf_turbo/exceptions.pyx":38
+ *     def detail(self, value):
+ *         self._detail = value
+ *         self._normalized = False             # <<<<<<<<<<<<<<
+ * 
+ *     def __str__(self) -> str:
+ */
+  __pyx_v_self->_normalized = 0;
+
+  /* "drf_turbo/exceptions.pyx":36
+ * 
+ *     @detail.setter
+ *     def detail(self, value):             # <<<<<<<<<<<<<<
+ *         self._detail = value
+ *         self._normalized = False
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "drf_turbo/exceptions.pyx":40
+ *         self._normalized = False
  * 
  *     def __str__(self) -> str:             # <<<<<<<<<<<<<<
  *         return str(self.detail)
@@ -1620,7 +1785,7 @@ static PyObject *__pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_2__str__(s
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("__str__", 0);
 
-  /* "drf_turbo/exceptions.pyx":23
+  /* "drf_turbo/exceptions.pyx":41
  * 
  *     def __str__(self) -> str:
  *         return str(self.detail)             # <<<<<<<<<<<<<<
@@ -1628,17 +1793,17 @@ static PyObject *__pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_2__str__(s
  * cdef class ValidationError(DrfTurboException):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_detail); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_detail); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(((PyObject *)(&PyUnicode_Type)), __pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 41, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_r = __pyx_t_2;
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "drf_turbo/exceptions.pyx":22
- *         self.detail = get_execption_detail(detail)
+  /* "drf_turbo/exceptions.pyx":40
+ *         self._normalized = False
  * 
  *     def __str__(self) -> str:             # <<<<<<<<<<<<<<
  *         return str(self.detail)
@@ -1770,7 +1935,7 @@ static PyObject *__pyx_pf_9drf_turbo_10exceptions_17DrfTurboException_6__setstat
   return __pyx_r;
 }
 
-/* "drf_turbo/exceptions.pyx":29
+/* "drf_turbo/exceptions.pyx":47
  *     default_code = 'invalid'
  * 
  *     def __cinit__(self, detail=None, code=None) -> None:             # <<<<<<<<<<<<<<
@@ -1820,7 +1985,7 @@ static int __pyx_pw_9drf_turbo_10exceptions_15ValidationError_1__cinit__(PyObjec
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 29, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "__cinit__") < 0)) __PYX_ERR(0, 47, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -1837,7 +2002,7 @@ static int __pyx_pw_9drf_turbo_10exceptions_15ValidationError_1__cinit__(PyObjec
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 29, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("__cinit__", 0, 0, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 47, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("drf_turbo.exceptions.ValidationError.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
@@ -1856,9 +2021,10 @@ static int __pyx_pf_9drf_turbo_10exceptions_15ValidationError___cinit__(struct _
   int __pyx_t_1;
   int __pyx_t_2;
   PyObject *__pyx_t_3 = NULL;
-  int __pyx_t_4;
+  PyObject *__pyx_t_4 = NULL;
   PyObject *__pyx_t_5 = NULL;
   PyObject *__pyx_t_6 = NULL;
+  int __pyx_t_7;
   int __pyx_lineno = 0;
   const char *__pyx_filename = NULL;
   int __pyx_clineno = 0;
@@ -1866,7 +2032,7 @@ static int __pyx_pf_9drf_turbo_10exceptions_15ValidationError___cinit__(struct _
   __Pyx_INCREF(__pyx_v_detail);
   __Pyx_INCREF(__pyx_v_code);
 
-  /* "drf_turbo/exceptions.pyx":30
+  /* "drf_turbo/exceptions.pyx":48
  * 
  *     def __cinit__(self, detail=None, code=None) -> None:
  *         if detail is None:             # <<<<<<<<<<<<<<
@@ -1877,19 +2043,19 @@ static int __pyx_pf_9drf_turbo_10exceptions_15ValidationError___cinit__(struct _
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "drf_turbo/exceptions.pyx":31
+    /* "drf_turbo/exceptions.pyx":49
  *     def __cinit__(self, detail=None, code=None) -> None:
  *         if detail is None:
  *             detail = self.default_detail             # <<<<<<<<<<<<<<
  *         if code is None:
  *             code = self.default_code
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_default_detail); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 31, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_default_detail); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 49, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF_SET(__pyx_v_detail, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "drf_turbo/exceptions.pyx":30
+    /* "drf_turbo/exceptions.pyx":48
  * 
  *     def __cinit__(self, detail=None, code=None) -> None:
  *         if detail is None:             # <<<<<<<<<<<<<<
@@ -1898,7 +2064,7 @@ static int __pyx_pf_9drf_turbo_10exceptions_15ValidationError___cinit__(struct _
  */
   }
 
-  /* "drf_turbo/exceptions.pyx":32
+  /* "drf_turbo/exceptions.pyx":50
  *         if detail is None:
  *             detail = self.default_detail
  *         if code is None:             # <<<<<<<<<<<<<<
@@ -1909,19 +2075,19 @@ static int __pyx_pf_9drf_turbo_10exceptions_15ValidationError___cinit__(struct _
   __pyx_t_1 = (__pyx_t_2 != 0);
   if (__pyx_t_1) {
 
-    /* "drf_turbo/exceptions.pyx":33
+    /* "drf_turbo/exceptions.pyx":51
  *             detail = self.default_detail
  *         if code is None:
  *             code = self.default_code             # <<<<<<<<<<<<<<
  * 
- *         if isinstance(detail, tuple):
+ *         if type(detail) is str:
  */
-    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_default_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 33, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_default_code); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 51, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF_SET(__pyx_v_code, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "drf_turbo/exceptions.pyx":32
+    /* "drf_turbo/exceptions.pyx":50
  *         if detail is None:
  *             detail = self.default_detail
  *         if code is None:             # <<<<<<<<<<<<<<
@@ -1930,67 +2096,142 @@ static int __pyx_pf_9drf_turbo_10exceptions_15ValidationError___cinit__(struct _
  */
   }
 
-  /* "drf_turbo/exceptions.pyx":35
+  /* "drf_turbo/exceptions.pyx":53
  *             code = self.default_code
  * 
- *         if isinstance(detail, tuple):             # <<<<<<<<<<<<<<
- *             detail = list(detail)
- *         elif not isinstance(detail, dict) and not isinstance(detail, list):
+ *         if type(detail) is str:             # <<<<<<<<<<<<<<
+ *             # The common case of a single message is already normalized.
+ *             self._detail = ErrorList([detail])
  */
-  __pyx_t_1 = PyTuple_Check(__pyx_v_detail); 
+  __pyx_t_1 = (((PyObject *)Py_TYPE(__pyx_v_detail)) == ((PyObject *)(&PyUnicode_Type)));
   __pyx_t_2 = (__pyx_t_1 != 0);
   if (__pyx_t_2) {
 
-    /* "drf_turbo/exceptions.pyx":36
+    /* "drf_turbo/exceptions.pyx":55
+ *         if type(detail) is str:
+ *             # The common case of a single message is already normalized.
+ *             self._detail = ErrorList([detail])             # <<<<<<<<<<<<<<
+ *             self._normalized = True
+ *             return
+ */
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_ErrorList); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 55, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_5 = PyList_New(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 55, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_INCREF(__pyx_v_detail);
+    __Pyx_GIVEREF(__pyx_v_detail);
+    PyList_SET_ITEM(__pyx_t_5, 0, __pyx_v_detail);
+    __pyx_t_6 = NULL;
+    if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_4))) {
+      __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_4);
+      if (likely(__pyx_t_6)) {
+        PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_4);
+        __Pyx_INCREF(__pyx_t_6);
+        __Pyx_INCREF(function);
+        __Pyx_DECREF_SET(__pyx_t_4, function);
+      }
+    }
+    __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_6, __pyx_t_5) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_5);
+    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 55, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_GIVEREF(__pyx_t_3);
+    __Pyx_GOTREF(__pyx_v_self->__pyx_base._detail);
+    __Pyx_DECREF(__pyx_v_self->__pyx_base._detail);
+    __pyx_v_self->__pyx_base._detail = __pyx_t_3;
+    __pyx_t_3 = 0;
+
+    /* "drf_turbo/exceptions.pyx":56
+ *             # The common case of a single message is already normalized.
+ *             self._detail = ErrorList([detail])
+ *             self._normalized = True             # <<<<<<<<<<<<<<
+ *             return
+ *         if isinstance(detail, tuple):
+ */
+    __pyx_v_self->__pyx_base._normalized = 1;
+
+    /* "drf_turbo/exceptions.pyx":57
+ *             self._detail = ErrorList([detail])
+ *             self._normalized = True
+ *             return             # <<<<<<<<<<<<<<
+ *         if isinstance(detail, tuple):
+ *             detail = list(detail)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "drf_turbo/exceptions.pyx":53
+ *             code = self.default_code
  * 
+ *         if type(detail) is str:             # <<<<<<<<<<<<<<
+ *             # The common case of a single message is already normalized.
+ *             self._detail = ErrorList([detail])
+ */
+  }
+
+  /* "drf_turbo/exceptions.pyx":58
+ *             self._normalized = True
+ *             return
+ *         if isinstance(detail, tuple):             # <<<<<<<<<<<<<<
+ *             detail = list(detail)
+ *         elif not isinstance(detail, dict) and not isinstance(detail, list):
+ */
+  __pyx_t_2 = PyTuple_Check(__pyx_v_detail); 
+  __pyx_t_1 = (__pyx_t_2 != 0);
+  if (__pyx_t_1) {
+
+    /* "drf_turbo/exceptions.pyx":59
+ *             return
  *         if isinstance(detail, tuple):
  *             detail = list(detail)             # <<<<<<<<<<<<<<
  *         elif not isinstance(detail, dict) and not isinstance(detail, list):
  *             detail = [detail]
  */
-    __pyx_t_3 = PySequence_List(__pyx_v_detail); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 36, __pyx_L1_error)
+    __pyx_t_3 = PySequence_List(__pyx_v_detail); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 59, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF_SET(__pyx_v_detail, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "drf_turbo/exceptions.pyx":35
- *             code = self.default_code
- * 
+    /* "drf_turbo/exceptions.pyx":58
+ *             self._normalized = True
+ *             return
  *         if isinstance(detail, tuple):             # <<<<<<<<<<<<<<
  *             detail = list(detail)
  *         elif not isinstance(detail, dict) and not isinstance(detail, list):
  */
-    goto __pyx_L5;
+    goto __pyx_L6;
   }
 
-  /* "drf_turbo/exceptions.pyx":37
+  /* "drf_turbo/exceptions.pyx":60
  *         if isinstance(detail, tuple):
  *             detail = list(detail)
  *         elif not isinstance(detail, dict) and not isinstance(detail, list):             # <<<<<<<<<<<<<<
  *             detail = [detail]
  * 
  */
-  __pyx_t_1 = PyDict_Check(__pyx_v_detail); 
-  __pyx_t_4 = ((!(__pyx_t_1 != 0)) != 0);
-  if (__pyx_t_4) {
+  __pyx_t_2 = PyDict_Check(__pyx_v_detail); 
+  __pyx_t_7 = ((!(__pyx_t_2 != 0)) != 0);
+  if (__pyx_t_7) {
   } else {
-    __pyx_t_2 = __pyx_t_4;
-    goto __pyx_L6_bool_binop_done;
+    __pyx_t_1 = __pyx_t_7;
+    goto __pyx_L7_bool_binop_done;
   }
-  __pyx_t_4 = PyList_Check(__pyx_v_detail); 
-  __pyx_t_1 = ((!(__pyx_t_4 != 0)) != 0);
-  __pyx_t_2 = __pyx_t_1;
-  __pyx_L6_bool_binop_done:;
-  if (__pyx_t_2) {
+  __pyx_t_7 = PyList_Check(__pyx_v_detail); 
+  __pyx_t_2 = ((!(__pyx_t_7 != 0)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_1) {
 
-    /* "drf_turbo/exceptions.pyx":38
+    /* "drf_turbo/exceptions.pyx":61
  *             detail = list(detail)
  *         elif not isinstance(detail, dict) and not isinstance(detail, list):
  *             detail = [detail]             # <<<<<<<<<<<<<<
  * 
- *         self.detail = get_execption_detail(detail)
+ *         self._detail = detail
  */
-    __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 38, __pyx_L1_error)
+    __pyx_t_3 = PyList_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 61, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_INCREF(__pyx_v_detail);
     __Pyx_GIVEREF(__pyx_v_detail);
@@ -1998,7 +2239,7 @@ static int __pyx_pf_9drf_turbo_10exceptions_15ValidationError___cinit__(struct _
     __Pyx_DECREF_SET(__pyx_v_detail, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "drf_turbo/exceptions.pyx":37
+    /* "drf_turbo/exceptions.pyx":60
  *         if isinstance(detail, tuple):
  *             detail = list(detail)
  *         elif not isinstance(detail, dict) and not isinstance(detail, list):             # <<<<<<<<<<<<<<
@@ -2006,36 +2247,31 @@ static int __pyx_pf_9drf_turbo_10exceptions_15ValidationError___cinit__(struct _
  * 
  */
   }
-  __pyx_L5:;
+  __pyx_L6:;
 
-  /* "drf_turbo/exceptions.pyx":40
+  /* "drf_turbo/exceptions.pyx":63
  *             detail = [detail]
  * 
- *         self.detail = get_execption_detail(detail)             # <<<<<<<<<<<<<<
+ *         self._detail = detail             # <<<<<<<<<<<<<<
+ *         self._normalized = False
+ * 
+ */
+  __Pyx_INCREF(__pyx_v_detail);
+  __Pyx_GIVEREF(__pyx_v_detail);
+  __Pyx_GOTREF(__pyx_v_self->__pyx_base._detail);
+  __Pyx_DECREF(__pyx_v_self->__pyx_base._detail);
+  __pyx_v_self->__pyx_base._detail = __pyx_v_detail;
+
+  /* "drf_turbo/exceptions.pyx":64
+ * 
+ *         self._detail = detail
+ *         self._normalized = False             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_get_execption_detail); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 40, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_6 = NULL;
-  if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_5))) {
-    __pyx_t_6 = PyMethod_GET_SELF(__pyx_t_5);
-    if (likely(__pyx_t_6)) {
-      PyObject* function = PyMethod_GET_FUNCTION(__pyx_t_5);
-      __Pyx_INCREF(__pyx_t_6);
-      __Pyx_INCREF(function);
-      __Pyx_DECREF_SET(__pyx_t_5, function);
-    }
-  }
-  __pyx_t_3 = (__pyx_t_6) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_6, __pyx_v_detail) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_v_detail);
-  __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 40, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_3);
-  __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (__Pyx_PyObject_SetAttrStr(((PyObject *)__pyx_v_self), __pyx_n_s_detail, __pyx_t_3) < 0) __PYX_ERR(0, 40, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+  __pyx_v_self->__pyx_base._normalized = 0;
 
-  /* "drf_turbo/exceptions.pyx":29
+  /* "drf_turbo/exceptions.pyx":47
  *     default_code = 'invalid'
  * 
  *     def __cinit__(self, detail=None, code=None) -> None:             # <<<<<<<<<<<<<<
@@ -2048,6 +2284,7 @@ static int __pyx_pf_9drf_turbo_10exceptions_15ValidationError___cinit__(struct _
   goto __pyx_L0;
   __pyx_L1_error:;
   __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
   __Pyx_XDECREF(__pyx_t_5);
   __Pyx_XDECREF(__pyx_t_6);
   __Pyx_AddTraceback("drf_turbo.exceptions.ValidationError.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
@@ -2173,8 +2410,11 @@ static PyObject *__pyx_pf_9drf_turbo_10exceptions_15ValidationError_4__setstate_
 }
 
 static PyObject *__pyx_tp_new_9drf_turbo_10exceptions_DrfTurboException(PyTypeObject *t, PyObject *a, PyObject *k) {
+  struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *p;
   PyObject *o = (&((PyTypeObject*)PyExc_Exception)[0])->tp_new(t, a, k);
   if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *)o);
+  p->_detail = Py_None; Py_INCREF(Py_None);
   if (unlikely(__pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_1__cinit__(o, a, k) < 0)) goto bad;
   return o;
   bad:
@@ -2183,33 +2423,63 @@ static PyObject *__pyx_tp_new_9drf_turbo_10exceptions_DrfTurboException(PyTypeOb
 }
 
 static void __pyx_tp_dealloc_9drf_turbo_10exceptions_DrfTurboException(PyObject *o) {
+  struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *p = (struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *)o;
   #if CYTHON_USE_TP_FINALIZE
   if (unlikely(PyType_HasFeature(Py_TYPE(o), Py_TPFLAGS_HAVE_FINALIZE) && Py_TYPE(o)->tp_finalize) && !_PyGC_FINALIZED(o)) {
     if (PyObject_CallFinalizerFromDealloc(o)) return;
   }
   #endif
   PyObject_GC_UnTrack(o);
+  Py_CLEAR(p->_detail);
   PyObject_GC_Track(o);
   (&((PyTypeObject*)PyExc_Exception)[0])->tp_dealloc(o);
 }
 
 static int __pyx_tp_traverse_9drf_turbo_10exceptions_DrfTurboException(PyObject *o, visitproc v, void *a) {
   int e;
+  struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *p = (struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *)o;
   if (!(&((PyTypeObject*)PyExc_Exception)[0])->tp_traverse); else { e = (&((PyTypeObject*)PyExc_Exception)[0])->tp_traverse(o,v,a); if (e) return e; }
+  if (p->_detail) {
+    e = (*v)(p->_detail, a); if (e) return e;
+  }
   return 0;
 }
 
 static int __pyx_tp_clear_9drf_turbo_10exceptions_DrfTurboException(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *p = (struct __pyx_obj_9drf_turbo_10exceptions_DrfTurboException *)o;
   if (!(&((PyTypeObject*)PyExc_Exception)[0])->tp_clear); else (&((PyTypeObject*)PyExc_Exception)[0])->tp_clear(o);
+  tmp = ((PyObject*)p->_detail);
+  p->_detail = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
   return 0;
 }
 
+static PyObject *__pyx_getprop_9drf_turbo_10exceptions_17DrfTurboException_detail(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_6detail_1__get__(o);
+}
+
+static int __pyx_setprop_9drf_turbo_10exceptions_17DrfTurboException_detail(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_6detail_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
 static PyMethodDef __pyx_methods_9drf_turbo_10exceptions_DrfTurboException[] = {
   {"__reduce_cython__", (PyCFunction)__pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_5__reduce_cython__, METH_NOARGS, 0},
   {"__setstate_cython__", (PyCFunction)__pyx_pw_9drf_turbo_10exceptions_17DrfTurboException_7__setstate_cython__, METH_O, 0},
   {0, 0, 0, 0}
 };
 
+static struct PyGetSetDef __pyx_getsets_9drf_turbo_10exceptions_DrfTurboException[] = {
+  {(char *)"detail", __pyx_getprop_9drf_turbo_10exceptions_17DrfTurboException_detail, __pyx_setprop_9drf_turbo_10exceptions_17DrfTurboException_detail, (char *)"\n        The error detail, normalized to strings the first time it is read.\n        ", 0},
+  {0, 0, 0, 0, 0}
+};
+
 static PyTypeObject __pyx_type_9drf_turbo_10exceptions_DrfTurboException = {
   PyVarObject_HEAD_INIT(0, 0)
   "drf_turbo.exceptions.DrfTurboException", /*tp_name*/
@@ -2250,7 +2520,7 @@ static PyTypeObject __pyx_type_9drf_turbo_10exceptions_DrfTurboException = {
   0, /*tp_iternext*/
   __pyx_methods_9drf_turbo_10exceptions_DrfTurboException, /*tp_methods*/
   0, /*tp_members*/
-  0, /*tp_getset*/
+  __pyx_getsets_9drf_turbo_10exceptions_DrfTurboException, /*tp_getset*/
   0, /*tp_base*/
   0, /*tp_dict*/
   0, /*tp_descr_get*/
@@ -2422,6 +2692,7 @@ static struct PyModuleDef __pyx_moduledef = {
 static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_kp_u_A_server_error_occurred, __pyx_k_A_server_error_occurred, sizeof(__pyx_k_A_server_error_occurred), 0, 1, 0, 0},
   {&__pyx_n_s_DrfTurboException, __pyx_k_DrfTurboException, sizeof(__pyx_k_DrfTurboException), 0, 0, 1, 1},
+  {&__pyx_n_s_ErrorList, __pyx_k_ErrorList, sizeof(__pyx_k_ErrorList), 0, 0, 1, 1},
   {&__pyx_kp_u_Invalid_input, __pyx_k_Invalid_input, sizeof(__pyx_k_Invalid_input), 0, 1, 0, 0},
   {&__pyx_n_s_OnlyAndExcludeError, __pyx_k_OnlyAndExcludeError, sizeof(__pyx_k_OnlyAndExcludeError), 0, 0, 1, 1},
   {&__pyx_n_s_StringNotCollectionError, __pyx_k_StringNotCollectionError, sizeof(__pyx_k_StringNotCollectionError), 0, 0, 1, 1},
@@ -2457,7 +2728,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_builtin_TypeError = __Pyx_GetBuiltinName(__pyx_n_s_TypeError); if (!__pyx_builtin_TypeError) __PYX_ERR(0, 67, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -2570,15 +2841,15 @@ static int __Pyx_modinit_type_init_code(void) {
   if (__Pyx_setup_reduce((PyObject*)&__pyx_type_9drf_turbo_10exceptions_DrfTurboException) < 0) __PYX_ERR(0, 6, __pyx_L1_error)
   __pyx_ptype_9drf_turbo_10exceptions_DrfTurboException = &__pyx_type_9drf_turbo_10exceptions_DrfTurboException;
   __pyx_type_9drf_turbo_10exceptions_ValidationError.tp_base = __pyx_ptype_9drf_turbo_10exceptions_DrfTurboException;
-  if (PyType_Ready(&__pyx_type_9drf_turbo_10exceptions_ValidationError) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (PyType_Ready(&__pyx_type_9drf_turbo_10exceptions_ValidationError) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
   #if PY_VERSION_HEX < 0x030800B1
   __pyx_type_9drf_turbo_10exceptions_ValidationError.tp_print = 0;
   #endif
   if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_type_9drf_turbo_10exceptions_ValidationError.tp_dictoffset && __pyx_type_9drf_turbo_10exceptions_ValidationError.tp_getattro == PyObject_GenericGetAttr)) {
     __pyx_type_9drf_turbo_10exceptions_ValidationError.tp_getattro = __Pyx_PyObject_GenericGetAttr;
   }
-  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_ValidationError, (PyObject *)&__pyx_type_9drf_turbo_10exceptions_ValidationError) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
-  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_9drf_turbo_10exceptions_ValidationError) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_n_s_ValidationError, (PyObject *)&__pyx_type_9drf_turbo_10exceptions_ValidationError) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject*)&__pyx_type_9drf_turbo_10exceptions_ValidationError) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
   __pyx_ptype_9drf_turbo_10exceptions_ValidationError = &__pyx_type_9drf_turbo_10exceptions_ValidationError;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -2817,18 +3088,25 @@ if (!__Pyx_RefNanny) {
   /* "drf_turbo/exceptions.pyx":3
  * # cython: language_level=3
  * 
- * from drf_turbo.utils import get_execption_detail             # <<<<<<<<<<<<<<
+ * from drf_turbo.utils import ErrorList, get_execption_detail             # <<<<<<<<<<<<<<
  * 
  * 
  */
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 3, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_INCREF(__pyx_n_s_ErrorList);
+  __Pyx_GIVEREF(__pyx_n_s_ErrorList);
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_ErrorList);
   __Pyx_INCREF(__pyx_n_s_get_execption_detail);
   __Pyx_GIVEREF(__pyx_n_s_get_execption_detail);
-  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_get_execption_detail);
+  PyList_SET_ITEM(__pyx_t_1, 1, __pyx_n_s_get_execption_detail);
   __pyx_t_2 = __Pyx_Import(__pyx_n_s_drf_turbo_utils, __pyx_t_1, 0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 3, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_ErrorList); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_ErrorList, __pyx_t_1) < 0) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_get_execption_detail); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 3, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_get_execption_detail, __pyx_t_1) < 0) __PYX_ERR(0, 3, __pyx_L1_error)
@@ -2860,39 +3138,39 @@ if (!__Pyx_RefNanny) {
  *     default_detail = 'A server error occurred.'
  *     default_code = 'error'             # <<<<<<<<<<<<<<
  * 
- *     def __cinit__(self, detail=None, code=None) -> None:
+ *     cdef object _detail
  */
   if (PyDict_SetItem((PyObject *)__pyx_ptype_9drf_turbo_10exceptions_DrfTurboException->tp_dict, __pyx_n_s_default_code, __pyx_n_u_error) < 0) __PYX_ERR(0, 12, __pyx_L1_error)
   PyType_Modified(__pyx_ptype_9drf_turbo_10exceptions_DrfTurboException);
 
-  /* "drf_turbo/exceptions.pyx":26
+  /* "drf_turbo/exceptions.pyx":44
  * 
  * cdef class ValidationError(DrfTurboException):
  *     default_detail = 'Invalid input.'             # <<<<<<<<<<<<<<
  *     default_code = 'invalid'
  * 
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9drf_turbo_10exceptions_ValidationError->tp_dict, __pyx_n_s_default_detail, __pyx_kp_u_Invalid_input) < 0) __PYX_ERR(0, 26, __pyx_L1_error)
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9drf_turbo_10exceptions_ValidationError->tp_dict, __pyx_n_s_default_detail, __pyx_kp_u_Invalid_input) < 0) __PYX_ERR(0, 44, __pyx_L1_error)
   PyType_Modified(__pyx_ptype_9drf_turbo_10exceptions_ValidationError);
 
-  /* "drf_turbo/exceptions.pyx":27
+  /* "drf_turbo/exceptions.pyx":45
  * cdef class ValidationError(DrfTurboException):
  *     default_detail = 'Invalid input.'
  *     default_code = 'invalid'             # <<<<<<<<<<<<<<
  * 
  *     def __cinit__(self, detail=None, code=None) -> None:
  */
-  if (PyDict_SetItem((PyObject *)__pyx_ptype_9drf_turbo_10exceptions_ValidationError->tp_dict, __pyx_n_s_default_code, __pyx_n_u_invalid) < 0) __PYX_ERR(0, 27, __pyx_L1_error)
+  if (PyDict_SetItem((PyObject *)__pyx_ptype_9drf_turbo_10exceptions_ValidationError->tp_dict, __pyx_n_s_default_code, __pyx_n_u_invalid) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
   PyType_Modified(__pyx_ptype_9drf_turbo_10exceptions_ValidationError);
 
-  /* "drf_turbo/exceptions.pyx":43
+  /* "drf_turbo/exceptions.pyx":67
  * 
  * 
  * class StringNotCollectionError(DrfTurboException, TypeError):             # <<<<<<<<<<<<<<
  *     pass
  * 
  */
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_ptype_9drf_turbo_10exceptions_DrfTurboException));
   __Pyx_GIVEREF(((PyObject *)__pyx_ptype_9drf_turbo_10exceptions_DrfTurboException));
@@ -2900,36 +3178,36 @@ if (!__Pyx_RefNanny) {
   __Pyx_INCREF(__pyx_builtin_TypeError);
   __Pyx_GIVEREF(__pyx_builtin_TypeError);
   PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_builtin_TypeError);
-  __pyx_t_1 = __Pyx_CalculateMetaclass(NULL, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_CalculateMetaclass(NULL, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_Py3MetaclassPrepare(__pyx_t_1, __pyx_t_2, __pyx_n_s_StringNotCollectionError, __pyx_n_s_StringNotCollectionError, (PyObject *) NULL, __pyx_n_s_drf_turbo_exceptions, (PyObject *) NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_Py3MetaclassPrepare(__pyx_t_1, __pyx_t_2, __pyx_n_s_StringNotCollectionError, __pyx_n_s_StringNotCollectionError, (PyObject *) NULL, __pyx_n_s_drf_turbo_exceptions, (PyObject *) NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_Py3ClassCreate(__pyx_t_1, __pyx_n_s_StringNotCollectionError, __pyx_t_2, __pyx_t_3, NULL, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_Py3ClassCreate(__pyx_t_1, __pyx_n_s_StringNotCollectionError, __pyx_t_2, __pyx_t_3, NULL, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_StringNotCollectionError, __pyx_t_4) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_StringNotCollectionError, __pyx_t_4) < 0) __PYX_ERR(0, 67, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "drf_turbo/exceptions.pyx":47
+  /* "drf_turbo/exceptions.pyx":71
  * 
  * 
  * class OnlyAndExcludeError(DrfTurboException):             # <<<<<<<<<<<<<<
  *     pass
  */
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 71, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_ptype_9drf_turbo_10exceptions_DrfTurboException));
   __Pyx_GIVEREF(((PyObject *)__pyx_ptype_9drf_turbo_10exceptions_DrfTurboException));
   PyTuple_SET_ITEM(__pyx_t_2, 0, ((PyObject *)__pyx_ptype_9drf_turbo_10exceptions_DrfTurboException));
-  __pyx_t_1 = __Pyx_CalculateMetaclass(NULL, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_CalculateMetaclass(NULL, __pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 71, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_Py3MetaclassPrepare(__pyx_t_1, __pyx_t_2, __pyx_n_s_OnlyAndExcludeError, __pyx_n_s_OnlyAndExcludeError, (PyObject *) NULL, __pyx_n_s_drf_turbo_exceptions, (PyObject *) NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_Py3MetaclassPrepare(__pyx_t_1, __pyx_t_2, __pyx_n_s_OnlyAndExcludeError, __pyx_n_s_OnlyAndExcludeError, (PyObject *) NULL, __pyx_n_s_drf_turbo_exceptions, (PyObject *) NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 71, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_4 = __Pyx_Py3ClassCreate(__pyx_t_1, __pyx_n_s_OnlyAndExcludeError, __pyx_t_2, __pyx_t_3, NULL, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 47, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_Py3ClassCreate(__pyx_t_1, __pyx_n_s_OnlyAndExcludeError, __pyx_t_2, __pyx_t_3, NULL, 0, 0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 71, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_OnlyAndExcludeError, __pyx_t_4) < 0) __PYX_ERR(0, 47, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_OnlyAndExcludeError, __pyx_t_4) < 0) __PYX_ERR(0, 71, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
@@ -2938,7 +3216,7 @@ if (!__Pyx_RefNanny) {
   /* "drf_turbo/exceptions.pyx":1
  * # cython: language_level=3             # <<<<<<<<<<<<<<
  * 
- * from drf_turbo.utils import get_execption_detail
+ * from drf_turbo.utils import ErrorList, get_execption_detail
  */
   __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
@@ -3472,20 +3750,6 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObjec
 }
 #endif
 
-/* PyObjectSetAttrStr */
-#if CYTHON_USE_TYPE_SLOTS
-static CYTHON_INLINE int __Pyx_PyObject_SetAttrStr(PyObject* obj, PyObject* attr_name, PyObject* value) {
-    PyTypeObject* tp = Py_TYPE(obj);
-    if (likely(tp->tp_setattro))
-        return tp->tp_setattro(obj, attr_name, value);
-#if PY_MAJOR_VERSION < 3
-    if (likely(tp->tp_setattr))
-        return tp->tp_setattr(obj, PyString_AS_STRING(attr_name), value);
-#endif
-    return PyObject_SetAttr(obj, attr_name, value);
-}
-#endif
-
 /* PyErrFetchRestore */
 #if CYTHON_FAST_THREAD_STATE
 static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
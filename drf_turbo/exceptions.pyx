@@ -1,6 +1,6 @@
 # cython: language_level=3
 
-from drf_turbo.utils import get_execption_detail
+from drf_turbo.utils import ErrorList, get_execption_detail
 
 
 cdef class DrfTurboException(Exception):
@@ -11,13 +11,31 @@ cdef class DrfTurboException(Exception):
     default_detail = 'A server error occurred.'
     default_code = 'error'
 
+    cdef object _detail
+    cdef bint _normalized
+
     def __cinit__(self, detail=None, code=None) -> None:
         if detail is None:
             detail = self.default_detail
         if code is None:
             code = self.default_code
 
-        self.detail = get_execption_detail(detail)
+        self._detail = detail
+
+    @property
+    def detail(self):
+        """
+        The error detail, normalized to strings the first time it is read.
+        """
+        if not self._normalized:
+            self._detail = get_execption_detail(self._detail)
+            self._normalized = True
+        return self._detail
+
+    @detail.setter
+    def detail(self, value):
+        self._detail = value
+        self._normalized = False
 
     def __str__(self) -> str:
         return str(self.detail)
@@ -32,12 +50,18 @@ cdef class ValidationError(DrfTurboException):
         if code is None:
             code = self.default_code
 
+        if type(detail) is str:
+            # The common case of a single message is already normalized.
+            self._detail = ErrorList([detail])
+            self._normalized = True
+            return
         if isinstance(detail, tuple):
             detail = list(detail)
         elif not isinstance(detail, dict) and not isinstance(detail, list):
             detail = [detail]
 
-        self.detail = get_execption_detail(detail)
+        self._detail = detail
+        self._normalized = False
 
 
 class StringNotCollectionError(DrfTurboException, TypeError):
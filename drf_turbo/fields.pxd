@@ -32,6 +32,9 @@ cdef class Field :
     cpdef get_default_value(self)
     cpdef tuple validate_empty_values(self, data)
     cpdef long validate_or_raise(self,value) except -1
+    cpdef tuple deserialize_many(self, list values, dict context)
+    cpdef tuple run_validation_many(self, list values, dict context)
+    cdef object error_message(self, object key, dict kwargs)
 
 
 cdef class StrField(Field):
@@ -48,9 +51,19 @@ cdef class EmailField(StrField):
 cdef class URLField(StrField):
     pass
 
+cdef class CompiledRegex:
+    cdef readonly:
+        object regex
+        bint use_re2
+        object pattern
+        object search
+
+cpdef CompiledRegex compile_regex(regex, bint use_re2=*)
+
 cdef class RegexField(StrField):
     cdef public:
         regex
+        CompiledRegex compiled
 
 cdef class IPField(StrField):
     pass
@@ -84,8 +97,12 @@ cdef class DecimalField(Field):
         rounding
         coerce_to_string
         max_whole_digits
-    
+    cdef:
+        readonly object quantum
+        object context
+
     cdef validate_precision(self,value)
+    cdef check_digits(self,total_digits,whole_digits,decimal_places)
     cdef quantize(self,value)
 
 cdef class BoolField(Field):
@@ -97,6 +114,17 @@ cdef class ChoiceField(Field):
         choice_strings_to_values
         choice_strings_to_display
         allow_blank
+    cdef readonly:
+        object output
+    cdef:
+        dict string_outputs
+        dict outputs
+        dict values
+        dict json_outputs
+        frozenset choice_types
+    cdef object build_output(self, value, display)
+    cdef object json_output(self, value)
+    cdef object to_choice(self, data)
 
 cdef class MultipleChoiceField(ChoiceField):
         cdef public:
@@ -104,23 +132,32 @@ cdef class MultipleChoiceField(ChoiceField):
             
 cdef class DateTimeField(Field):
     cdef public:
-        format
-        input_formats
         default_timezone
-        timezone
+    cdef:
+        object _format
+        object _input_formats
+        object _timezone
+        readonly bint iso_format
+        readonly tuple parse_formats
+        dict serialize_cache
 
     cpdef get_default_timezone(self)
     cpdef enforce_timezone(self, value)
+    cdef object format_value(self, value)
 
 cdef class DateField(Field):
-    cdef public:
-        format
-        input_formats
+    cdef:
+        object _format
+        object _input_formats
+        readonly bint iso_format
+        readonly tuple parse_formats
 
 cdef class TimeField(Field):
-    cdef public:
-        format
-        input_formats
+    cdef:
+        object _format
+        object _input_formats
+        readonly bint iso_format
+        readonly tuple parse_formats
 
 cdef class FileField(Field):
     cdef public :
@@ -134,8 +171,14 @@ cdef class ArrayField(Field):
         min_items
         max_items
         exact_items
+        vectorize
+        output
+        max_errors
 
     cpdef run_child_validation(self,data,dict context)
+    cdef object run_vectorized_validation(self, data)
+    cdef object to_output(self, list result)
+    cdef void check_int64_range(self, list result) except *
 
 cdef class DictField(Field):
     cdef public :
@@ -156,6 +199,11 @@ cdef class RelatedField(Field):
     cdef public:
         queryset
 
+    cdef object to_pk(self, value)
+    cdef dict pks(self, object values)
+    cpdef dict resolve(self, object values)
+    cdef lookup(self, data, dict resolved)
+
 cdef class ManyRelatedField(Field):
     cdef public :
         child_relation
@@ -177,3 +225,7 @@ cdef class MethodField(Field):
     cdef public :
         method_name
 
+
+
+cdef dict resolved_objects(RelatedField field, dict context)
+cpdef dict resolve_related_objects(dict fields, object rows, dict context)
@@ -1,5 +1,6 @@
 # cython: language_level=3
 
+import array
 import copy
 import datetime
 import decimal
@@ -7,6 +8,7 @@ import ipaddress
 import json
 import re
 import uuid
+from collections.abc import Mapping
 
 from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
@@ -17,10 +19,32 @@ from pytz.exceptions import InvalidTimeError
 from rest_framework import ISO_8601
 from rest_framework.settings import api_settings
 
+from drf_turbo.encoder import encode_json
 from drf_turbo.exceptions import *
 from drf_turbo.utils import (force_str, get_attribute, get_error_detail,
-                             is_collection, is_iterable_and_not_string)
+                             get_execption_detail, is_collection,
+                             is_iterable_and_not_string)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 cimport cython
+from cpython.datetime cimport (PyDateTime_CheckExact, datetime_day,
+                               datetime_hour, datetime_microsecond,
+                               datetime_minute, datetime_month,
+                               datetime_second, datetime_year,
+                               import_datetime, timedelta_days,
+                               timedelta_microseconds, timedelta_seconds)
+from libc.stdio cimport snprintf
+
+import_datetime()
 
 EMAIL_REGEX = re.compile(
     r"(^[-!#$%&'*+/=?^_`{}|~0-9A-Z]+(\.[-!#$%&'*+/=?^_`{}|~0-9A-Z]+)*"
@@ -37,9 +61,28 @@ URL_REGEX = re.compile(
     r'(?::\d+)?'  # optional port
     r'(?:/?|[/?]\S+)$', re.IGNORECASE)
 
+SLUG_REGEX = re.compile(r'^[-a-zA-Z0-9_]+$')
+
+SLUG_UNICODE_REGEX = re.compile(r'^[-\w]+\Z', re.UNICODE)
+
 
 cdef object NO_DEFAULT = object()
 
+# Context key under which `resolve_related_objects` passes prefetched objects.
+cdef str RELATED_OBJECTS = '_related_objects'
+
+# Default error messages merged along the MRO, computed once per field class.
+cdef dict _default_error_messages = {}
+
+DECIMAL = decimal.Decimal
+
+# The bounds of `np.int64` and of the ``'q'`` `array.array` typecode.
+INT64_MAX = 2 ** 63 - 1
+INT64_MIN = -2 ** 63
+
+# Compiled `RegexField` patterns, keyed by (regex, use_re2).
+cdef dict _compiled_regexes = {}
+
 
 cdef class SkipField(Exception):
     pass
@@ -124,23 +167,37 @@ cdef class Field :
                 "or a collection of callables."
             )
 
-        messages = {}
-        for cls in reversed(self.__class__.__mro__):
-            messages.update(getattr(cls, 'default_error_messages', {}))
-        messages.update(error_messages or {})
+        defaults = _default_error_messages.get(self.__class__)
+        if defaults is None:
+            defaults = {}
+            for cls in reversed(self.__class__.__mro__):
+                defaults.update(getattr(cls, 'default_error_messages', {}))
+            _default_error_messages[self.__class__] = defaults
+        messages = dict(defaults)
+        if error_messages:
+            messages.update(error_messages)
         self.error_messages = messages
 
     def raise_if_fail(self, key: str, **kwargs) :
         """Helper method to make a `ValidationError` with an error message
         from ``self.error_messages``.
         """
+        return ValidationError(self.error_message(key, kwargs))
+
+    def error_detail(self, key: str, **kwargs):
+        """Return the error detail of a `ValidationError` made by
+        :meth:`raise_if_fail`, without making the exception.
+        """
+        return get_execption_detail([self.error_message(key, kwargs)])
+
+    cdef object error_message(self, object key, dict kwargs):
         try:
             msg = self.error_messages[key]
         except KeyError as error:
             raise AssertionError(error)
         if isinstance(msg, (str, bytes)):
             msg = msg.format(**kwargs)
-        return ValidationError(msg)
+        return msg
 
     cpdef serialize(self, value, dict context):
         """
@@ -263,13 +320,16 @@ cdef class Field :
         if is_empty_value:
             return data
         value = self.deserialize(data, context)
-        self.validate_or_raise(value)
+        if self.validators:
+            self.validate_or_raise(value)
         return value
 
     cpdef long validate_or_raise(self, value) except -1 :
         """
         Validate the value and raise a `ValidationError` if validation fails.
         """
+        if not self.validators:
+            return 0
         cdef list errors = []
         for validator in self.validators :
             try :
@@ -283,6 +343,104 @@ cdef class Field :
         if errors:
             raise ValidationError(errors)
 
+    cpdef tuple deserialize_many(self, list values, dict context):
+        """
+        Transform a column of *incoming* primitive data into native values.
+
+        Returns ``(results, errors)``: `results` holds one value per item
+        (``NO_DEFAULT`` where it failed) and `errors` maps the index of
+        every failed item to its error detail.
+
+        :param values: The incoming data, one item per row.
+        :param context: The context for the request.
+        """
+        cdef Py_ssize_t i, n = len(values)
+        cdef list results = [NO_DEFAULT] * n
+        cdef dict errors = {}
+        for i in range(n):
+            try:
+                results[i] = self.deserialize(values[i], context)
+            except ValidationError as exc:
+                errors[i] = exc.detail
+            except DjangoValidationError as exc:
+                errors[i] = get_error_detail(exc)
+            except SkipField:
+                pass
+        return results, errors
+
+    cpdef tuple run_validation_many(self, list values, dict context):
+        """
+        Validate a column of input data, as :meth:`run_validation` does for
+        every item of it.
+
+        Returns ``(results, errors)``: `results` holds one validated value
+        per item (``NO_DEFAULT`` where it was skipped or failed) and `errors`
+        maps the index of every failed item to its error detail.
+
+        :param values: The incoming data, one item per row.
+        :param context: The context for the request.
+        """
+        cdef Py_ssize_t i, j, n = len(values)
+        cdef list results = [NO_DEFAULT] * n
+        cdef dict errors = {}
+        cdef list indexes = []
+        cdef list pending = []
+        cdef list converted
+        cdef dict failed
+        cdef bint is_empty_value
+        cdef bint direct = type(self).validate_empty_values is Field.validate_empty_values
+        if type(self).run_validation is not Field.run_validation:
+            # Custom validation is applied item by item.
+            for i in range(n):
+                try:
+                    results[i] = self.run_validation(values[i], context)
+                except ValidationError as exc:
+                    errors[i] = exc.detail
+                except DjangoValidationError as exc:
+                    errors[i] = get_error_detail(exc)
+                except SkipField:
+                    pass
+            return results, errors
+
+        for i in range(n):
+            value = values[i]
+            if direct and value is not NO_DEFAULT and value is not None:
+                indexes.append(i)
+                pending.append(value)
+                continue
+            try:
+                (is_empty_value, value) = self.validate_empty_values(value)
+            except ValidationError as exc:
+                errors[i] = exc.detail
+                continue
+            except SkipField:
+                continue
+            if is_empty_value:
+                results[i] = value
+            else:
+                indexes.append(i)
+                pending.append(value)
+        if not pending:
+            return results, errors
+
+        (converted, failed) = self.deserialize_many(pending, context)
+        for j in range(len(indexes)):
+            i = indexes[j]
+            if failed and j in failed:
+                errors[i] = failed[j]
+                continue
+            value = converted[j]
+            if value is NO_DEFAULT:
+                continue
+            if self.validators:
+                try:
+                    self.validate_or_raise(value)
+                except ValidationError as exc:
+                    errors[i] = exc.detail
+                    continue
+            results[i] = value
+        return results, errors
+
 cdef class StrField(Field):
     """"
     A field that validates input as an string.
@@ -381,12 +539,61 @@ cdef class URLField(StrField):
         return data
 
 
+@cython.final
+cdef class CompiledRegex:
+    """
+    A compiled regular expression, shared by every field (and every copy of
+    a field) that uses the same pattern.
+
+    :param regex: A pattern string or a compiled :mod:`re` pattern.
+    :param use_re2: Compile pattern strings with ``re2`` when it is installed.
+        Patterns ``re2`` does not support fall back to :mod:`re`.
+    """
+
+    def __init__(self, regex, bint use_re2=False):
+        self.regex = regex
+        self.use_re2 = use_re2
+        pattern = None
+        if use_re2 and re2 is not None and isinstance(regex, str):
+            try:
+                pattern = re2.compile(regex)
+            except re2.error:
+                pass
+        if pattern is None:
+            pattern = re.compile(regex)
+        self.pattern = pattern
+        self.search = pattern.search
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (compile_regex, (self.regex, self.use_re2))
+
+
+cpdef CompiledRegex compile_regex(regex, bint use_re2=False):
+    """
+    Return the shared :class:`CompiledRegex` for `regex`.
+    """
+    key = (regex, use_re2)
+    compiled = _compiled_regexes.get(key)
+    if compiled is None:
+        compiled = _compiled_regexes[key] = CompiledRegex(regex, use_re2)
+    return compiled
+
+
 @cython.final
 cdef class RegexField(StrField):
     """
     A field that validates input against a given regular expression.
 
     :param regex: The regular expression to use for validation.
+    :param use_re2: Match with ``re2`` when it is installed and supports the pattern.
+        ``re2`` matches in linear time, which guards patterns prone to
+        catastrophic backtracking, at a higher cost per call than :mod:`re`.
     :param kwargs: The same keyword arguments that :class:`Field` receives.
     """
 
@@ -394,16 +601,16 @@ cdef class RegexField(StrField):
         'invalid': 'This value does not match the required pattern.'
     }
 
-    def __init__(self, regex, **kwargs):
+    def __init__(self, regex, use_re2=False, **kwargs):
         self.regex = regex
+        self.compiled = compile_regex(regex, use_re2)
         super().__init__(**kwargs)
 
     cpdef inline deserialize(self, data, dict context):
-        compiled = re.compile(self.regex, flags=0)
-        match = compiled.search(str(data))
-        if not match:
+        data = str(data)
+        if not self.compiled.search(data):
             raise self.raise_if_fail("invalid")
-        return str(data)
+        return data
 
 
 @cython.final
@@ -469,6 +676,24 @@ cdef class UUIDField(StrField):
         except Exception:
             raise self.raise_if_fail('invalid')
 
+    cpdef tuple deserialize_many(self, list values, dict context):
+        cdef Py_ssize_t i, n = len(values)
+        cdef list results = [NO_DEFAULT] * n
+        cdef dict errors = {}
+        UUID = uuid.UUID
+        for i in range(n):
+            data = values[i]
+            try:
+                if type(data) is str:
+                    results[i] = UUID(hex=data)
+                else:
+                    results[i] = self.deserialize(data, context)
+            except ValidationError as exc:
+                errors[i] = exc.detail
+            except Exception:
+                errors[i] = self.error_detail('invalid')
+        return results, errors
+
 
 @cython.final
 cdef class SlugField(Field):
@@ -488,17 +713,13 @@ cdef class SlugField(Field):
         super().__init__(**kwargs)
 
     cpdef inline deserialize(self, data, dict context):
-        if self.allow_unicode :
-            regex = re.compile(r'^[-\w]+\Z', re.UNICODE)
-        else:
-            regex = re.compile(r'^[-a-zA-Z0-9_]+$')
-        compiled = re.compile(regex, flags=0)
-        match = compiled.search(str(data))
-        if not match and not self.allow_unicode:
+        data = str(data)
+        if self.allow_unicode:
+            if not SLUG_UNICODE_REGEX.search(data):
+                raise self.raise_if_fail("invalid_unicode")
+        elif not SLUG_REGEX.search(data):
             raise self.raise_if_fail("invalid")
-        elif not match and self.allow_unicode:
-            raise self.raise_if_fail("invalid_unicode")
-        return str(data)
+        return data
 
 
 @cython.final
@@ -537,6 +758,29 @@ cdef class IntField(Field):
 
         return data
 
+    cpdef tuple deserialize_many(self, list values, dict context):
+        cdef Py_ssize_t i, n = len(values)
+        cdef list results = [NO_DEFAULT] * n
+        cdef dict errors = {}
+        min_value = self.min_value
+        max_value = self.max_value
+        re_decimal = self.re_decimal
+        for i in range(n):
+            data = values[i]
+            if type(data) is not int:
+                try:
+                    data = int(re_decimal.sub('', str(data)))
+                except (ValueError, TypeError):
+                    errors[i] = self.error_detail('invalid')
+                    continue
+            if min_value is not None and data < min_value:
+                errors[i] = self.error_detail("min_value", min_value=min_value)
+            elif max_value is not None and data > max_value:
+                errors[i] = self.error_detail("max_value", max_value=max_value)
+            else:
+                results[i] = data
+        return results, errors
+
 
 @cython.final
 cdef class FloatField(Field):
@@ -573,6 +817,28 @@ cdef class FloatField(Field):
             raise self.raise_if_fail("max_value", max_value=self.max_value)
         return data
 
+    cpdef tuple deserialize_many(self, list values, dict context):
+        cdef Py_ssize_t i, n = len(values)
+        cdef list results = [NO_DEFAULT] * n
+        cdef dict errors = {}
+        min_value = self.min_value
+        max_value = self.max_value
+        for i in range(n):
+            data = values[i]
+            if type(data) is not float:
+                try:
+                    data = float(data)
+                except (TypeError, ValueError):
+                    errors[i] = self.error_detail('invalid')
+                    continue
+            if min_value is not None and data < min_value:
+                errors[i] = self.error_detail("min_value", min_value=min_value)
+            elif max_value is not None and data > max_value:
+                errors[i] = self.error_detail("max_value", max_value=max_value)
+            else:
+                results[i] = data
+        return results, errors
+
 
 @cython.final
 cdef class DecimalField(Field):
@@ -627,6 +893,15 @@ cdef class DecimalField(Field):
             assert rounding in valid_roundings, (
                 'Invalid rounding option %s. Valid values for rounding are: %s' % (rounding, valid_roundings))
         self.rounding = rounding
+        # The quantization exponent and context, computed once per field.
+        if self.decimal_places is not None:
+            self.quantum = decimal.Decimal((0, (1,), -self.decimal_places))
+            self.context = decimal.getcontext().copy()
+            if self.max_digits is not None:
+                self.context.prec = self.max_digits
+        else:
+            self.quantum = None
+            self.context = None
 
     cpdef inline serialize(self, value, dict context):
         if value is None:
@@ -634,12 +909,16 @@ cdef class DecimalField(Field):
                 return ''
             else:
                 return None
-        if not isinstance(value, decimal.Decimal):
-            value = decimal.Decimal(str(value).strip())
+        if type(value) is not DECIMAL and not isinstance(value, decimal.Decimal):
+            value = DECIMAL(str(value).strip())
 
         quantized = self.quantize(value)
         if not self.coerce_to_string:
             return quantized
+        # Quantized values have a non-positive exponent, for which `str()`
+        # only switches to exponent notation below 1e-6.
+        if self.quantum is not None and quantized.adjusted() >= -6:
+            return str(quantized)
         return '{:f}'.format(quantized)
 
     cpdef inline deserialize(self, data, dict context):
@@ -655,14 +934,18 @@ cdef class DecimalField(Field):
             value = decimal.Decimal(data)
         except decimal.DecimalException:
             raise self.raise_if_fail('invalid')
-        if value.is_nan():
-            raise self.raise_if_fail('invalid')
-        if value in (decimal.Decimal('Inf'), decimal.Decimal('-Inf')):
+        if not value.is_finite():
             raise self.raise_if_fail('invalid')
         if self.min_value is not None and value < self.min_value:
             raise self.raise_if_fail("min_value", min_value=self.min_value)
         if self.max_value is not None and value > self.max_value:
             raise self.raise_if_fail("max_value", max_value=self.max_value)
+        if self.quantum is not None and value.same_quantum(self.quantum):
+            # Already at the configured exponent: only the digit counts are
+            # checked and quantizing would return the value unchanged.
+            whole_digits = max(value.adjusted() + 1, 0)
+            self.check_digits(whole_digits + self.decimal_places, whole_digits, self.decimal_places)
+            return value
         return self.quantize(self.validate_precision(value))
 
     cdef inline validate_precision(self, value):
@@ -690,6 +973,10 @@ cdef class DecimalField(Field):
             whole_digits = 0
             decimal_places = total_digits
 
+        self.check_digits(total_digits, whole_digits, decimal_places)
+        return value
+
+    cdef inline check_digits(self, total_digits, whole_digits, decimal_places):
         if self.max_digits is not None and total_digits > self.max_digits:
             raise self.raise_if_fail('max_digits', max_digits=self.max_digits)
         if self.decimal_places is not None and decimal_places > self.decimal_places:
@@ -697,23 +984,18 @@ cdef class DecimalField(Field):
         if self.max_whole_digits is not None and whole_digits > self.max_whole_digits:
             raise self.raise_if_fail('max_whole_digits', max_whole_digits=self.max_whole_digits)
 
-        return value
-
     cdef inline quantize(self, value):
         """
         Quantize the decimal value to the configured precision.
         """
-        if self.decimal_places is None:
+        if self.quantum is None:
             return value
-
-        context = decimal.getcontext().copy()
-        if self.max_digits is not None:
-            context.prec = self.max_digits
-        return value.quantize(
-            decimal.Decimal('.1') ** self.decimal_places,
-            rounding=self.rounding,
-            context=context
-        )
+        if value.same_quantum(self.quantum) and (
+            self.max_digits is None or value.adjusted() < self.max_digits - self.decimal_places
+        ):
+            # Values read from a column of the same precision are already quantized.
+            return value
+        return value.quantize(self.quantum, rounding=self.rounding, context=self.context)
 
 
 @cython.final
@@ -768,18 +1050,67 @@ cdef class BoolField(Field):
             raise self.raise_if_fail('invalid')
         return data
 
+    cpdef tuple deserialize_many(self, list values, dict context):
+        cdef Py_ssize_t i, n = len(values)
+        cdef list results = [NO_DEFAULT] * n
+        cdef dict errors = {}
+        cdef bint allow_null = self.allow_null
+        coerce_values = self.coerce_values
+        coerce_null_values = self.coerce_null_values
+        for i in range(n):
+            data = values[i]
+            if data is True or data is False:
+                results[i] = data
+                continue
+            try:
+                if allow_null and data in coerce_null_values:
+                    results[i] = None
+                else:
+                    results[i] = coerce_values[data]
+            except (KeyError, TypeError):
+                errors[i] = self.error_detail('invalid')
+        return results, errors
+
+class ChoiceOutput(dict):
+    """
+    The read-only ``{'value': ..., 'display': ...}`` output of a choice,
+    built once per choice and shared by every serialized value.
+    """
+    __slots__ = ()
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError('%s is read-only' % type(self).__name__)
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+# Choice values that are encoded to JSON once, when the field is built.
+# Anything else (lazy translations in particular) is encoded per request.
+JSON_CHOICE_TYPES = (str, int, float, bool, type(None))
+
+
 cdef class ChoiceField(Field):
     """
     Choice field type.
 
     :param choices(required): A list of valid choices.
+    :param output: What a choice serializes to: ``'both'`` for a
+        ``{'value': ..., 'display': ...}`` mapping, ``'value'`` or ``'display'``
+        for just one of them.
     :param kwargs: The same keyword arguments that :class:`Field` receives.
     """
     default_error_messages = {
         'invalid_choice': '"{input}" is not a valid choice.'
     }
 
-    def __init__(self, choices, **kwargs):
+    def __init__(self, choices, output='both', **kwargs):
+        assert output in ('both', 'value', 'display'), (
+            '`output` must be one of "both", "value" or "display".'
+        )
         pairs = [
             isinstance(item, (list, tuple)) and len(item) == 2
             for item in choices
@@ -797,26 +1128,100 @@ cdef class ChoiceField(Field):
             (str(key), value) for key, value in self.choices.items()
         ])
 
+        self.output = output
+        self.string_outputs = {
+            key: self.build_output(value, self.choice_strings_to_display[key])
+            for key, value in self.choice_strings_to_values.items()
+        }
+        # The typed tables are keyed by the choices themselves and only
+        # consulted for values of a choice type, so that e.g. ``True`` still
+        # goes through ``str()`` rather than matching a choice of ``1``.
+        self.choice_types = frozenset([type(key) for key in self.choices])
+        self.values = {
+            key: self.choice_strings_to_values[str(key)] for key in self.choices
+        }
+        self.outputs = {
+            key: self.string_outputs[str(key)] for key in self.choices
+        }
+        self.json_outputs = {}
+        for key, output_value in self.outputs.items():
+            if all([type(item) in JSON_CHOICE_TYPES for item in (
+                output_value.values() if type(output_value) is ChoiceOutput else (output_value,)
+            )]):
+                try:
+                    self.json_outputs[key] = encode_json(output_value)
+                except ValueError:
+                    pass
+
         self.allow_blank = kwargs.pop('allow_blank', False)
         super().__init__(**kwargs)
 
+    cdef object build_output(self, value, display):
+        if self.output == 'value':
+            return value
+        if self.output == 'display':
+            return display
+        return ChoiceOutput(value=value, display=display)
+
+    cdef object json_output(self, value):
+        """
+        Return the pre-encoded JSON of the choice `value`, or ``None`` if it
+        has none.
+        """
+        if type(value) in self.choice_types:
+            return self.json_outputs.get(value)
+        return None
+
     cpdef serialize(self, value, dict context):
-        if value in ('', None):
+        if value is None or value == '':
             return value
+        if type(value) in self.choice_types:
+            output = self.outputs.get(value, NO_DEFAULT)
+            if output is not NO_DEFAULT:
+                return output
+        output = self.string_outputs.get(str(value), NO_DEFAULT)
+        if output is not NO_DEFAULT:
+            return output
+        if self.output == 'both':
+            return {'value': value, 'display': value}
+        return value
 
-        return {
-            'value': self.choice_strings_to_values.get(str(value), value),
-            'display': self.choice_strings_to_display.get(str(value), value),
-        }
+    cdef object to_choice(self, data):
+        """
+        Return the choice matching `data`, or raise ``KeyError``.
+        """
+        if type(data) in self.choice_types:
+            value = self.values.get(data, NO_DEFAULT)
+            if value is not NO_DEFAULT:
+                return value
+        return self.choice_strings_to_values[data if type(data) is str else str(data)]
 
     cpdef deserialize(self, data, dict context) :
         if data == '' and self.allow_blank:
             return ''
         try:
-            return self.choice_strings_to_values[str(data)]
+            return self.to_choice(data)
         except Exception:
             raise self.raise_if_fail('invalid_choice', input=data)
 
+    cpdef tuple deserialize_many(self, list values, dict context):
+        if type(self).deserialize is not ChoiceField.deserialize:
+            return Field.deserialize_many(self, values, context)
+        cdef Py_ssize_t i, n = len(values)
+        cdef list results = [NO_DEFAULT] * n
+        cdef dict errors = {}
+        allow_blank = self.allow_blank
+        for i in range(n):
+            data = values[i]
+            if data == '' and allow_blank:
+                results[i] = ''
+                continue
+            try:
+                results[i] = self.to_choice(data)
+            except Exception:
+                errors[i] = self.error_detail('invalid_choice', input=data)
+        return results, errors
+
 
 @cython.final
 cdef class MultipleChoiceField(ChoiceField):
@@ -837,9 +1242,16 @@ cdef class MultipleChoiceField(ChoiceField):
         super().__init__(**kwargs)
 
     cpdef inline serialize(self, value, dict context):
-        return {
-            self.choice_strings_to_values.get(str(item), item) for item in value
-        }
+        cdef set result = set()
+        choice_types = self.choice_types
+        for item in value:
+            if type(item) in choice_types:
+                choice = self.values.get(item, NO_DEFAULT)
+                if choice is not NO_DEFAULT:
+                    result.add(choice)
+                    continue
+            result.add(self.choice_strings_to_values.get(str(item), item))
+        return result
 
     cpdef inline deserialize(self, data, dict context) :
         if isinstance(data, str) or not hasattr(data, '__iter__'):
@@ -852,12 +1264,111 @@ cdef class MultipleChoiceField(ChoiceField):
             if item == '' and self.allow_blank:
                 return ''
             try:
-                new_data.add(self.choice_strings_to_values[str(item)])
+                new_data.add(self.to_choice(item))
             except Exception:
                 raise self.raise_if_fail('invalid_choice', input=item)
         return new_data
 
 
+# Upper bound on the number of values cached by `DateTimeField.serialize`.
+cdef Py_ssize_t SERIALIZE_CACHE_SIZE = 1024
+
+DATETIME = datetime.datetime
+datetime_fromisoformat = datetime.datetime.fromisoformat
+date_fromisoformat = datetime.date.fromisoformat
+time_fromisoformat = datetime.time.fromisoformat
+
+
+cdef bint _is_iso_format(object format):
+    return format is not None and format.lower() == ISO_8601
+
+
+cdef tuple _classify_formats(object formats):
+    """
+    Return `formats` with the ISO 8601 entries replaced by ``None``.
+    """
+    return tuple([None if _is_iso_format(input_format) else input_format for input_format in formats])
+
+
+cdef object _format_iso_datetime(object value):
+    """
+    Format a datetime as ISO 8601 like `isoformat()`, writing a UTC offset as
+    ``Z``. Return ``None`` for offsets that are not whole minutes.
+    """
+    cdef char buf[40]
+    cdef int n
+    cdef long offset
+    cdef char sign = b'+'
+    utcoffset = value.utcoffset()
+    n = snprintf(
+        buf, sizeof(buf), "%04d-%02d-%02dT%02d:%02d:%02d",
+        datetime_year(value), datetime_month(value), datetime_day(value),
+        datetime_hour(value), datetime_minute(value), datetime_second(value),
+    )
+    if datetime_microsecond(value):
+        n += snprintf(buf + n, sizeof(buf) - n, ".%06d", datetime_microsecond(value))
+    if utcoffset is not None:
+        if timedelta_microseconds(utcoffset):
+            return None
+        offset = timedelta_days(utcoffset) * 86400 + timedelta_seconds(utcoffset)
+        if offset % 60:
+            return None
+        if offset == 0:
+            buf[n] = b'Z'
+            n += 1
+        else:
+            if offset < 0:
+                sign = b'-'
+                offset = -offset
+            n += snprintf(buf + n, sizeof(buf) - n, "%c%02ld:%02ld", sign, offset // 3600, offset % 3600 // 60)
+    return buf[:n].decode('ascii')
+
+
+cdef object _parse_iso_datetime(object data):
+    """
+    Parse an ISO 8601 datetime, or return ``None`` if `data` is not one.
+    """
+    if type(data) is str:
+        try:
+            return datetime_fromisoformat(data)
+        except ValueError:
+            pass
+    try:
+        return parse_datetime(data)
+    except (ValueError, TypeError):
+        return None
+
+
+cdef object _parse_iso_date(object data):
+    """
+    Parse an ISO 8601 date, or return ``None`` if `data` is not one.
+    """
+    if type(data) is str:
+        try:
+            return date_fromisoformat(data)
+        except ValueError:
+            pass
+    try:
+        return parse_date(data)
+    except (ValueError, TypeError):
+        return None
+
+
+cdef object _parse_iso_time(object data):
+    """
+    Parse an ISO 8601 time, or return ``None`` if `data` is not one.
+    """
+    if type(data) is str:
+        try:
+            return time_fromisoformat(data).replace(tzinfo=None)
+        except ValueError:
+            pass
+    try:
+        return parse_time(data)
+    except (ValueError, TypeError):
+        return None
+
+
 @cython.final
 cdef class DateTimeField(Field):
     """
@@ -893,6 +1404,34 @@ cdef class DateTimeField(Field):
 
         super().__init__(**kwargs)
 
+    @property
+    def format(self):
+        return self._format
+
+    @format.setter
+    def format(self, value):
+        self._format = value
+        self.iso_format = _is_iso_format(value)
+        self.serialize_cache = {}
+
+    @property
+    def input_formats(self):
+        return self._input_formats
+
+    @input_formats.setter
+    def input_formats(self, value):
+        self._input_formats = value
+        self.parse_formats = _classify_formats(value)
+
+    @property
+    def timezone(self):
+        return self._timezone
+
+    @timezone.setter
+    def timezone(self, value):
+        self._timezone = value
+        self.serialize_cache = {}
+
     cpdef inline get_default_timezone(self):
         return timezone.get_current_timezone() if settings.USE_TZ else None
 
@@ -901,35 +1440,56 @@ cdef class DateTimeField(Field):
         When `self.default_timezone` is `None`, always return naive datetimes.
         When `self.default_timezone` is not `None`, always return aware datetimes.
         """
-        if self.timezone is not None:
-            if timezone.is_aware(value):
+        tz = self._timezone
+        cdef bint aware = value.utcoffset() is not None
+        if tz is not None:
+            if aware:
                 try:
-                    return value.astimezone(self.timezone)
+                    return value.astimezone(tz)
                 except OverflowError:
                     raise self.raise_if_fail('overflow')
             try:
-                return timezone.make_aware(value, self.timezone)
+                return timezone.make_aware(value, tz)
             except InvalidTimeError:
-                raise self.raise_if_fail('make_aware', timezone=self.timezone)
-        elif (self.timezone is None) and timezone.is_aware(value):
+                raise self.raise_if_fail('make_aware', timezone=tz)
+        elif aware:
             return timezone.make_naive(value, timezone.utc)
         return value
 
+    cdef object format_value(self, value):
+        value = self.enforce_timezone(value)
+        if self.iso_format:
+            if PyDateTime_CheckExact(value):
+                formatted = _format_iso_datetime(value)
+                if formatted is not None:
+                    return formatted
+            value = value.isoformat()
+            if value.endswith('+00:00'):
+                value = value[:-6] + 'Z'
+            return value
+        return value.strftime(self._format)
+
     cpdef inline serialize(self, value, dict context):
         if not value:
             return None
 
-        if self.format is None or isinstance(value, str):
+        if self._format is None or isinstance(value, str):
             return value
 
-        value = self.enforce_timezone(value)
-
-        if self.format.lower() == ISO_8601:
-            value = value.isoformat()
-            if value.endswith('+00:00'):
-                value = value[:-6] + 'Z'
-            return value
-        return value.strftime(self.format)
+        # Equal datetimes format to the same string once converted to
+        # `self.timezone`, except for the second of two ambiguous wall times.
+        cdef dict cache = self.serialize_cache
+        cdef bint cacheable = type(value) is DATETIME and not value.fold
+        if cacheable:
+            result = cache.get(value)
+            if result is not None:
+                return result
+        result = self.format_value(value)
+        if cacheable:
+            if len(cache) >= SERIALIZE_CACHE_SIZE:
+                cache.clear()
+            cache[value] = result
+        return result
 
     cpdef inline deserialize(self, data, dict context) :
         if isinstance(data, datetime.date) and not isinstance(data, datetime.datetime):
@@ -938,14 +1498,11 @@ cdef class DateTimeField(Field):
         if isinstance(data, datetime.datetime):
             return self.enforce_timezone(data)
 
-        for input_format in self.input_formats:
-            if input_format.lower() == ISO_8601:
-                try:
-                    parsed = parse_datetime(data)
-                    if parsed is not None:
-                        return self.enforce_timezone(parsed)
-                except (ValueError, TypeError):
-                    pass
+        for input_format in self.parse_formats:
+            if input_format is None:
+                parsed = _parse_iso_datetime(data)
+                if parsed is not None:
+                    return self.enforce_timezone(parsed)
             else:
                 try:
                     parsed = self.datetime_parser(data, input_format)
@@ -955,6 +1512,26 @@ cdef class DateTimeField(Field):
 
         raise self.raise_if_fail('invalid')
 
+    cpdef tuple deserialize_many(self, list values, dict context):
+        cdef Py_ssize_t i, n = len(values)
+        cdef list results = [NO_DEFAULT] * n
+        cdef dict errors = {}
+        # ISO 8601 strings are parsed directly when that format is tried first.
+        cdef bint iso_first = len(self.parse_formats) > 0 and self.parse_formats[0] is None
+        for i in range(n):
+            data = values[i]
+            parsed = None
+            if iso_first and type(data) is str:
+                parsed = _parse_iso_datetime(data)
+            try:
+                if parsed is not None:
+                    results[i] = self.enforce_timezone(parsed)
+                else:
+                    results[i] = self.deserialize(data, context)
+            except ValidationError as exc:
+                errors[i] = exc.detail
+        return results, errors
+
 
 @cython.final
 cdef class DateField(Field):
@@ -972,6 +1549,7 @@ cdef class DateField(Field):
         'invalid': 'Not a valid date.',
         'datetime': 'Expected a date but got a datetime.',
     }
+    datetime_parser = datetime.datetime.strptime
 
     def __init__(self, format=None, input_formats=None, **kwargs):
         if format is None:
@@ -986,6 +1564,24 @@ cdef class DateField(Field):
 
         super().__init__(**kwargs)
 
+    @property
+    def format(self):
+        return self._format
+
+    @format.setter
+    def format(self, value):
+        self._format = value
+        self.iso_format = _is_iso_format(value)
+
+    @property
+    def input_formats(self):
+        return self._input_formats
+
+    @input_formats.setter
+    def input_formats(self, value):
+        self._input_formats = value
+        self.parse_formats = _classify_formats(value)
+
     cpdef inline serialize(self, value, dict context):
         if not value:
             return None
@@ -997,10 +1593,10 @@ cdef class DateField(Field):
             'read-only field and deal with timezone issues explicitly.'
         )
 
-        if self.format.lower() == ISO_8601:
+        if self.iso_format:
             return value.isoformat()
 
-        return value.strftime(self.format)
+        return value.strftime(self._format)
 
     cpdef inline deserialize(self, data, dict context) :
         if isinstance(data, datetime.datetime):
@@ -1009,15 +1605,11 @@ cdef class DateField(Field):
         if isinstance(data, datetime.date):
             return data
 
-        for input_format in self.input_formats:
-            if input_format.lower() == ISO_8601:
-                try:
-                    parsed = parse_date(data)
-                except (ValueError, TypeError):
-                    pass
-                else:
-                    if parsed is not None:
-                        return parsed
+        for input_format in self.parse_formats:
+            if input_format is None:
+                parsed = _parse_iso_date(data)
+                if parsed is not None:
+                    return parsed
             else:
                 try:
                     parsed = self.datetime_parser(data, input_format)
@@ -1056,11 +1648,29 @@ cdef class TimeField(Field):
 
         super().__init__(**kwargs)
 
+    @property
+    def format(self):
+        return self._format
+
+    @format.setter
+    def format(self, value):
+        self._format = value
+        self.iso_format = _is_iso_format(value)
+
+    @property
+    def input_formats(self):
+        return self._input_formats
+
+    @input_formats.setter
+    def input_formats(self, value):
+        self._input_formats = value
+        self.parse_formats = _classify_formats(value)
+
     cpdef inline serialize(self, value, dict context):
         if value in (None, ''):
             return None
 
-        if self.format is None or isinstance(value, str):
+        if self._format is None or isinstance(value, str):
             return value
 
         assert not isinstance(value, datetime.datetime), (
@@ -1069,23 +1679,19 @@ cdef class TimeField(Field):
             'read-only field and deal with timezone issues explicitly.'
         )
 
-        if self.format.lower() == ISO_8601:
+        if self.iso_format:
             return value.isoformat()
-        return value.strftime(self.format)
+        return value.strftime(self._format)
 
     cpdef inline deserialize(self, data, dict context):
         if isinstance(data, datetime.time):
             return data
 
-        for input_format in self.input_formats:
-            if input_format.lower() == ISO_8601:
-                try:
-                    parsed = parse_time(data)
-                except (ValueError, TypeError):
-                    pass
-                else:
-                    if parsed is not None:
-                        return parsed
+        for input_format in self.parse_formats:
+            if input_format is None:
+                parsed = _parse_iso_time(data)
+                if parsed is not None:
+                    return parsed
             else:
                 try:
                     parsed = self.datetime_parser(data, input_format)
@@ -1154,6 +1760,12 @@ cdef class ArrayField(Field):
     :param max_items: The maximum number of items allowed in the array.
     :param min_items: The minimum number of items required in the array.
     :param exac_items: The exact number of items required in the array.
+    :param vectorize: Validate the items of an `IntField` or `FloatField` child
+        with NumPy in one pass. Falls back to item by item validation for
+        input NumPy cannot convert exactly.
+    :param output: The type of the validated value: ``'list'`` (default),
+        ``'ndarray'`` or ``'array'`` (:class:`array.array`).
+    :param max_errors: Report at most this many invalid items.
     :param kwargs: The same keyword arguments that :class:`Field` receives.
     """
 
@@ -1173,12 +1785,24 @@ cdef class ArrayField(Field):
         self.max_items = kwargs.pop('max_items', None)
         self.min_items = kwargs.pop('min_items', None)
         self.exact_items = kwargs.pop('exact_items', None)
+        self.vectorize = kwargs.pop('vectorize', False)
+        self.output = kwargs.pop('output', 'list')
+        self.max_errors = kwargs.pop('max_errors', None)
         super().__init__(**kwargs)
         if self.child is not None:
             self.child.bind(field_name='', root=self)
         if self.exact_items is not None:
             self.min_items = self.exact_items
             self.max_items = self.exact_items
+        assert self.output in ('list', 'ndarray', 'array'), (
+            "`output` must be one of 'list', 'ndarray' or 'array'."
+        )
+        assert np is not None or not (self.vectorize or self.output == 'ndarray'), (
+            'NumPy is required for `vectorize=True` and `output=\'ndarray\'`.'
+        )
+        assert self.output != 'array' or (
+            type(self.child) in (IntField, FloatField) and not self.child.allow_null
+        ), "`output='array'` requires a non-nullable `IntField` or `FloatField` child."
 
     cpdef inline serialize(self, data, dict context):
         """
@@ -1211,17 +1835,105 @@ cdef class ArrayField(Field):
         cdef list result = []
         cdef dict errors = {}
         cdef int idx = 0
+        if self.vectorize:
+            validated = self.run_vectorized_validation(data)
+            if validated is not None:
+                return validated
         for item in data :
             try:
                 result.append(self.child.run_validation(item, context))
             except ValidationError as e:
                 errors[idx] = e.detail
+                if self.max_errors is not None and len(errors) >= self.max_errors:
+                    break
             idx += 1
 
         if not errors:
-            return result
+            return self.to_output(result)
         raise ValidationError(errors)
 
+    cdef object run_vectorized_validation(self, data):
+        """
+        Validate all items of a numeric child with NumPy.
+
+        Returns ``None`` when the items are not plain numbers of the child's
+        type, in which case they are validated one by one.
+        """
+        child = self.child
+        cdef bint is_int = type(child) is IntField
+        if not (is_int or type(child) is FloatField) or child.validators:
+            return None
+        try:
+            values = np.asarray(data)
+        except (ValueError, TypeError, OverflowError):
+            return None
+        kind = values.dtype.kind
+        if values.ndim != 1 or kind not in ('iu' if is_int else 'iufb'):
+            return None
+        if is_int:
+            if kind == 'u' and values.dtype.itemsize == 8:
+                return None
+            if not isinstance(data, np.ndarray):
+                # NumPy reads booleans mixed with integers as 0 and 1.
+                for item in data:
+                    if item is True or item is False:
+                        return None
+            values = values.astype(np.int64, copy=False)
+        else:
+            values = values.astype(np.float64, copy=False)
+
+        cdef dict errors = {}
+        min_value = child.min_value
+        max_value = child.max_value
+        if min_value is not None:
+            for idx in np.flatnonzero(values < min_value)[:self.max_errors]:
+                errors[int(idx)] = child.error_detail('min_value', min_value=min_value)
+        if max_value is not None:
+            for idx in np.flatnonzero(values > max_value)[:self.max_errors]:
+                errors[int(idx)] = child.error_detail('max_value', max_value=max_value)
+        if errors:
+            raise ValidationError({idx: errors[idx] for idx in sorted(errors)[:self.max_errors]})
+
+        if self.output == 'ndarray':
+            return values
+        if self.output == 'array':
+            return array.array('q' if is_int else 'd', values.tobytes())
+        return values.tolist()
+
+    cdef object to_output(self, list result):
+        """
+        Convert the validated items to the configured `output` type.
+        """
+        if self.output == 'list':
+            return result
+        child = self.child
+        cdef bint is_int = type(child) is IntField and not child.allow_null
+        cdef bint is_float = type(child) is FloatField and not child.allow_null
+        if is_int:
+            self.check_int64_range(result)
+        if self.output == 'ndarray':
+            return np.array(result, dtype=np.int64 if is_int else np.float64 if is_float else None)
+        return array.array('q' if is_int else 'd', result)
+
+    cdef void check_int64_range(self, list result) except *:
+        """
+        Raise a `ValidationError` for the integers that do not fit in a
+        64-bit ``ndarray`` or ``array.array``.
+        """
+        cdef dict errors = {}
+        child = self.child
+        for idx, item in enumerate(result):
+            if item > INT64_MAX:
+                errors[idx] = child.error_detail('max_value', max_value=INT64_MAX)
+            elif item < INT64_MIN:
+                errors[idx] = child.error_detail('min_value', min_value=INT64_MIN)
+            else:
+                continue
+            if self.max_errors is not None and len(errors) >= self.max_errors:
+                break
+        if errors:
+            raise ValidationError(errors)
+
 
 @cython.final
 cdef class DictField(Field):
@@ -1332,7 +2044,73 @@ cdef class RelatedField(Field):
         self.queryset = kwargs.pop('queryset', None)
         super().__init__(**kwargs)
 
-    cpdef inline deserialize(self, data, dict context):
+    cdef object to_pk(self, value):
+        """
+        Convert an incoming value to the model's pk type, or return `NO_DEFAULT`
+        when it needs the per-value lookup to report the right error.
+        """
+        if value is None or isinstance(value, bool):
+            return NO_DEFAULT
+        try:
+            return self.queryset.model._meta.pk.to_python(value)
+        except (DjangoValidationError, TypeError, ValueError):
+            return NO_DEFAULT
+
+    cdef dict pks(self, object values):
+        """
+        Return the distinct pks of the incoming `values` that can be fetched
+        in bulk, as dict keys.
+        """
+        cdef dict keys = {}
+        for value in values:
+            key = self.to_pk(value)
+            if key is not NO_DEFAULT:
+                keys[key] = None
+        return keys
+
+    cpdef dict resolve(self, object values):
+        """
+        Fetch the objects for many pk values with a single `in_bulk()` query.
+
+        Return a dict of pk -> object, or `None` for pks that do not exist.
+        Returns `None` if the queryset cannot be queried in bulk.
+
+        :param values: The incoming pk values.
+        """
+        if not hasattr(self.queryset, 'in_bulk'):
+            return None
+        cdef dict keys = self.pks(values)
+        if not keys:
+            return keys
+        objects = self.queryset.in_bulk(list(keys))
+        return {key: objects.get(key) for key in keys}
+
+    async def aresolve(self, object values):
+        """
+        Like :meth:`resolve`, with an `ain_bulk()` query.
+
+        :param values: The incoming pk values.
+        """
+        if not hasattr(self.queryset, 'ain_bulk'):
+            return None
+        keys = self.pks(values)
+        if not keys:
+            return keys
+        objects = await self.queryset.ain_bulk(list(keys))
+        return {key: objects.get(key) for key in keys}
+
+    cdef lookup(self, data, dict resolved):
+        """
+        Return the object for `data`, using the objects fetched by :meth:`resolve`
+        when possible.
+        """
+        if resolved is not None:
+            key = self.to_pk(data)
+            if key is not NO_DEFAULT and key in resolved:
+                instance = resolved[key]
+                if instance is None:
+                    raise self.raise_if_fail('does_not_exist', pk_value=data)
+                return instance
         try:
             if isinstance(data, bool):
                 raise TypeError
@@ -1343,6 +2121,9 @@ cdef class RelatedField(Field):
             raise self.raise_if_fail('incorrect_type', data_type=type(data).__name__)
         return data
 
+    cpdef inline deserialize(self, data, dict context):
+        return self.lookup(data, resolved_objects(self, context))
+
 
 @cython.final
 cdef class ManyRelatedField(Field):
@@ -1364,8 +2145,12 @@ cdef class ManyRelatedField(Field):
         super().__init__(**kwargs)
 
     cpdef inline serialize(self, value, dict context):
-
-        value = value.all() if hasattr(value, 'all') else value
+        # Only managers are resolved here: calling `.all()` again on a
+        # queryset would drop its prefetched results.
+        value = value.all() if hasattr(value, 'get_queryset') else value
+        if hasattr(value, 'values_list') and getattr(value, '_result_cache', None) is None:
+            # Not prefetched: read the pks without instantiating the objects.
+            return list(value.values_list('pk', flat=True))
         return [
             item.pk for item in value
         ]
@@ -1375,10 +2160,119 @@ cdef class ManyRelatedField(Field):
             raise self.raise_if_fail('not_a_list', input_type=type(data).__name__)
         if not self.allow_empty and len(data) == 0:
             raise self.raise_if_fail('empty')
-        return [
-            self.child_relation.deserialize(item, context)
-            for item in data
-        ]
+        if not isinstance(self.child_relation, RelatedField):
+            return [
+                self.child_relation.deserialize(item, context)
+                for item in data
+            ]
+
+        cdef RelatedField child = self.child_relation
+        cdef dict resolved = resolved_objects(child, context)
+        if resolved is None:
+            resolved = child.resolve(data)
+        cdef list result = []
+        cdef dict errors = {}
+        cdef int idx = 0
+        for item in data:
+            try:
+                result.append(child.lookup(item, resolved))
+            except ValidationError as e:
+                errors[idx] = e.detail
+            idx += 1
+        if errors:
+            raise ValidationError(errors)
+        return result
+
+
+cdef dict resolved_objects(RelatedField field, dict context):
+    """
+    Return the objects prefetched for `field` by `resolve_related_objects`.
+    """
+    if not context:
+        return None
+    cache = context.get(RELATED_OBJECTS)
+    if cache is None:
+        return None
+    return cache.get(id(field))
+
+
+cdef list _related_values(dict fields, object rows, dict context):
+    """
+    Return ``(field, values)`` pairs with the incoming values of each
+    :class:`RelatedField` of `fields` in `rows`, leaving out the fields whose
+    objects `context` already carries.
+    """
+    cdef list pairs = []
+    cdef list values
+    cdef dict cache = context.get(RELATED_OBJECTS) if context else None
+    for name, field in fields.items():
+        values = []
+        if isinstance(field, ManyRelatedField):
+            field = (<ManyRelatedField>field).child_relation
+            for row in rows:
+                if isinstance(row, Mapping):
+                    items = row.get(name)
+                    if isinstance(items, (list, tuple)):
+                        values.extend(items)
+        elif isinstance(field, RelatedField):
+            for row in rows:
+                if isinstance(row, Mapping) and name in row:
+                    values.append(row[name])
+        if not values or not isinstance(field, RelatedField):
+            continue
+        if cache and id(field) in cache:
+            continue
+        pairs.append((field, values))
+    return pairs
+
+
+cdef dict _with_related_objects(dict context, dict cache):
+    """
+    Return a copy of `context` that carries the related objects of `cache`.
+    """
+    if not cache:
+        return context
+    context = dict(context) if context else {}
+    context[RELATED_OBJECTS] = {**context.get(RELATED_OBJECTS, {}), **cache}
+    return context
+
+
+cpdef dict resolve_related_objects(dict fields, object rows, dict context):
+    """
+    Fetch the related objects referenced by all rows of a ``many=True``
+    payload, with one query per related field, and return a context that
+    carries them to :class:`RelatedField` and :class:`ManyRelatedField`.
+
+    :param fields: The writable fields of the serializer.
+    :param rows: The incoming rows.
+    :param context: The serializer context, which is not modified.
+    """
+    cdef dict cache = {}
+    if not isinstance(rows, (list, tuple)):
+        return context
+    for field, values in _related_values(fields, rows, context):
+        resolved = (<RelatedField>field).resolve(values)
+        if resolved is not None:
+            cache[id(field)] = resolved
+    return _with_related_objects(context, cache)
+
+
+async def aresolve_related_objects(dict fields, object rows, dict context):
+    """
+    Like :func:`resolve_related_objects`, with `ain_bulk()` queries.
+
+    :param fields: The writable fields of the serializer.
+    :param rows: The incoming rows.
+    :param context: The serializer context, which is not modified.
+    """
+    cache = {}
+    if not isinstance(rows, (list, tuple)):
+        return context
+    for field, values in _related_values(fields, rows, context):
+        resolved = await field.aresolve(values)
+        if resolved is not None:
+            cache[id(field)] = resolved
+    return _with_related_objects(context, cache)
 
 
 @cython.final
@@ -0,0 +1,45 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+
+class Command(BaseCommand):
+    help = (
+        "Render the OpenAPI schema to a file, served by drf_turbo.openapi.SchemaGenerator "
+        "instead of generating it at runtime. Pass the same title, url, description and "
+        "version as the schema view."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--file', dest='file', default=None,
+            help='Defaults to settings.DRF_TURBO_SCHEMA_FILE.',
+        )
+        parser.add_argument('--title', dest='title', default=None)
+        parser.add_argument('--url', dest='url', default=None)
+        parser.add_argument('--description', dest='description', default=None)
+        parser.add_argument('--api_version', dest='api_version', default=None)
+        parser.add_argument('--urlconf', dest='urlconf', default=None)
+        parser.add_argument(
+            '--workers', dest='workers', type=int, default=None,
+            help='Generate the schema in this many processes.',
+        )
+        parser.add_argument(
+            '--generator_class', dest='generator_class',
+            default='drf_turbo.openapi.SchemaGenerator',
+        )
+
+    def handle(self, *args, **options):
+        path = options['file'] or getattr(settings, 'DRF_TURBO_SCHEMA_FILE', None)
+        if not path:
+            raise CommandError('Pass --file or set settings.DRF_TURBO_SCHEMA_FILE.')
+        generator_class = import_string(options['generator_class'])
+        generator = generator_class(
+            title=options['title'],
+            url=options['url'],
+            description=options['description'],
+            urlconf=options['urlconf'],
+            version=options['api_version'],
+        )
+        generator.write_schema(path, workers=options['workers'])
+        self.stdout.write('Wrote the schema to %s' % path)
@@ -0,0 +1,13 @@
+class OptimizeQuerysetMixin:
+    """
+    A `GenericAPIView` mixin that applies the serializer class's
+    ``optimize_queryset()`` to ``get_queryset()``, so list and detail views
+    fetch related objects and columns in as few queries as possible.
+    """
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        serializer_class = self.get_serializer_class()
+        if not hasattr(serializer_class, 'optimize_queryset'):
+            return queryset
+        return serializer_class.optimize_queryset(queryset, context=self.get_serializer_context())
@@ -1,18 +1,23 @@
+import hashlib
+import json
+import os
 import re
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from collections import OrderedDict
 from decimal import Decimal
 from operator import attrgetter
 from urllib.parse import urljoin
 
+import django
+from django.conf import settings
 from django.core.validators import (DecimalValidator, EmailValidator,
                                     MaxLengthValidator, MaxValueValidator,
                                     MinLengthValidator, MinValueValidator,
                                     RegexValidator, URLValidator)
 from django.db import models
 from django.utils.encoding import force_str
-from rest_framework import (RemovedInDRF314Warning, exceptions, renderers,
-                            serializers)
+from rest_framework import exceptions, renderers, serializers
 from rest_framework.authentication import (BasicAuthentication,
                                            SessionAuthentication)
 from rest_framework.compat import uritemplate
@@ -21,11 +26,111 @@ from rest_framework.schemas.generators import BaseSchemaGenerator
 from rest_framework.schemas.inspectors import ViewInspector
 from rest_framework.schemas.utils import get_pk_description, is_list_view
 from rest_framework.settings import api_settings
+from rest_framework.utils.encoders import JSONEncoder
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 import drf_turbo as dt
+from drf_turbo.utils import LRUCache
 
-NO_DEFAULT = object()
+try:
+    from rest_framework import RemovedInDRF314Warning
+except ImportError:
+    # DRF >= 3.14
+    RemovedInDRF314Warning = DeprecationWarning
+
+# The `default_value` of drf-turbo fields without a default.
+NO_DEFAULT = dt.Field().default_value
+
+# Schemas that do not depend on the request, keyed by
+# `SchemaGenerator.get_fingerprint()`.
+_schemas = LRUCache(maxsize=32)
+
+# Component schemas of drf-turbo serializers, keyed by the schema class and
+# `_serializer_key()`.
+_components = LRUCache(maxsize=1024)
+
+
+def _qualname(obj):
+    if obj is None:
+        return ""
+    return "%s.%s" % (obj.__module__, obj.__qualname__)
+
+
+def _serializer_key(serializer):
+    """
+    Return a key identifying the component schema of a drf-turbo serializer:
+    its class, ``only`` / ``exclude`` and fields, with nested serializers
+    replaced by their own key. Return ``None`` for other serializers, whose
+    fields are built per instance.
+    """
+    if not isinstance(serializer, dt.Serializer):
+        return None
+    fields = []
+    for name, field in serializer.fields.items():
+        if isinstance(field, dt.Serializer):
+            field = _serializer_key(field)
+        fields.append((name, field))
+    only = tuple(serializer.only) if serializer.only is not None else None
+    exclude = tuple(serializer.exclude) if serializer.exclude is not None else None
+    return (type(serializer), only, exclude, tuple(fields))
+
+
+def _serializer_fingerprint(serializer):
+    """
+    Describe the fields of `serializer` for `SchemaGenerator.get_fingerprint()`:
+    their names, types and flags, with nested serializers described by their
+    own fields.
+    """
+    if isinstance(serializer, serializers.ListSerializer):
+        return ("many", _serializer_fingerprint(serializer.child))
+    fields = getattr(serializer, "fields", None)
+    if fields is None:
+        return _qualname(type(serializer))
+    return (
+        _qualname(type(serializer)),
+        getattr(serializer, "many", False),
+        tuple(
+            (
+                name,
+                _qualname(type(field)),
+                field.required,
+                field.read_only,
+                field.write_only,
+                field.allow_null,
+                _serializer_fingerprint(field)
+                if isinstance(field, (dt.BaseSerializer, serializers.BaseSerializer))
+                else None,
+            )
+            for name, field in fields.items()
+        ),
+    )
+
+
+# The generator of a schema worker process, see `_init_worker()`.
+_worker_generator = None
+
+
+def _init_worker(generator):
+    global _worker_generator
+    # A no-op in forked workers. Spawned ones need DJANGO_SETTINGS_MODULE.
+    django.setup()
+    _worker_generator = generator
+
+
+def _generate_shard(indexes):
+    """
+    Generate the operations of the endpoints at `indexes` in a worker process.
+    """
+    generator = _worker_generator
+    view_endpoints = getattr(generator, "_view_endpoints", None)
+    if view_endpoints is None:
+        generator._initialise_endpoints()
+        _, view_endpoints = generator._get_paths_and_endpoints(None)
+        generator._view_endpoints = view_endpoints
+    return [
+        (index, generator.generate_operation(*view_endpoints[index]))
+        for index in indexes
+    ]
 
 
 class SchemaGenerator(BaseSchemaGenerator):
@@ -61,9 +166,111 @@ class SchemaGenerator(BaseSchemaGenerator):
                     )
                 ids[operation_id] = {"route": route, "method": method}
 
+    def get_fingerprint(self):
+        """
+        Return a hash of the schema info and of the path, method, view class
+        and serializer fields of every endpoint. The serializer is the one
+        the view's ``get_serializer()`` returns, so overridden
+        ``get_serializer_class()`` methods are covered.
+        """
+        fingerprint = getattr(self, "_fingerprint", None)
+        if fingerprint is None:
+            self._initialise_endpoints()
+            parts = [dt.__version__, repr(sorted(self.get_info().items())), self.url or ""]
+            for path, method, callback in self.endpoints:
+                view = self.create_view(callback, method)
+                serializer = None
+                if hasattr(view, "get_serializer"):
+                    try:
+                        serializer = view.get_serializer()
+                    except exceptions.APIException:
+                        pass
+                parts.append(
+                    "%s %s %s %r %r"
+                    % (
+                        path,
+                        method,
+                        _qualname(type(view)),
+                        getattr(callback, "actions", None),
+                        _serializer_fingerprint(serializer),
+                    )
+                )
+            fingerprint = hashlib.sha256("\n".join(parts).encode()).hexdigest()
+            self._fingerprint = fingerprint
+        return fingerprint
+
     def get_schema(self, request=None, public=False):
+        """
+        Return the OpenAPI schema.
+
+        Schemas that do not depend on the request (``public=True`` or no
+        request) are generated once per :meth:`get_fingerprint`, or loaded from
+        ``settings.DRF_TURBO_SCHEMA_FILE`` if it was written for the same
+        fingerprint by the ``prerender_schema`` management command. The cached
+        schema is shared and should not be modified.
+
+        With a request and ``public=False``, the default of DRF's
+        ``get_schema_view()``, the endpoints are filtered by the permissions
+        of the request and the schema is generated for every request; pass
+        ``public=True`` to ``get_schema_view()`` to serve the cached schema.
+        """
+        if request is not None and not public:
+            return self.generate_schema(request, public)
+        fingerprint = self.get_fingerprint()
+        schema = _schemas.get(fingerprint)
+        if schema is None:
+            schema = self.load_schema(fingerprint)
+            if schema is None:
+                schema = self.generate_schema(request, public)
+            _schemas.set(fingerprint, schema)
+        return schema
+
+    def load_schema(self, fingerprint):
+        """
+        Return the schema pre-rendered to ``settings.DRF_TURBO_SCHEMA_FILE``,
+        or ``None`` if there is none for `fingerprint`.
+        """
+        path = getattr(settings, "DRF_TURBO_SCHEMA_FILE", None)
+        if not path or not os.path.exists(path):
+            return None
+        with open(path) as f:
+            content = json.load(f)
+        if content.get("fingerprint") != fingerprint:
+            warnings.warn(
+                '"{}" was rendered for other endpoints or serializers, '
+                "the schema will be generated instead.".format(path)
+            )
+            return None
+        return content["schema"]
+
+    def write_schema(self, path, workers=None):
+        """
+        Render the public schema to `path`, with its fingerprint.
+
+        :param path: The path of the file.
+        :param workers: The number of processes to generate the schema with.
+        """
+        content = {
+            "fingerprint": self.get_fingerprint(),
+            "schema": self.generate_schema(public=True, workers=workers),
+        }
+        with open(path, "w") as f:
+            json.dump(content, f, cls=JSONEncoder)
+
+    def generate_schema(self, request=None, public=False, workers=None):
         """
         Generate a OpenAPI schema.
+
+        With `workers`, the operations of schemas that do not depend on the
+        request are generated in a pool of that many processes, each handling
+        a shard of the endpoints, and merged in the order of the endpoints.
+        Workers are forked where possible; spawned ones set Django up from
+        ``DJANGO_SETTINGS_MODULE`` and need a picklable generator.
+
+        :param request: The request the schema is generated for.
+        :param public: Whether to include the endpoints the request has no
+            permission for.
+        :param workers: The number of processes to generate operations with.
         """
         self._initialise_endpoints()
         components_schemas = {}
@@ -71,12 +278,15 @@ class SchemaGenerator(BaseSchemaGenerator):
         # Iterate endpoints generating per method path operations.
         paths = {}
         _, view_endpoints = self._get_paths_and_endpoints(None if public else request)
-        for path, method, view in view_endpoints:
-            if not self.has_view_permissions(path, method, view):
+        if workers and workers > 1 and (public or request is None):
+            operations = self.generate_operations(len(view_endpoints), workers)
+        else:
+            operations = [self.generate_operation(*endpoint) for endpoint in view_endpoints]
+        for (path, method, view), generated in zip(view_endpoints, operations):
+            if generated is None:
                 continue
 
-            operation = view.schema.get_operation(path, method)
-            components = view.schema.get_components(path, method)
+            operation, components = generated
             for k in components.keys():
                 if k not in components_schemas:
                     continue
@@ -116,6 +326,40 @@ class SchemaGenerator(BaseSchemaGenerator):
 
         return schema
 
+    def generate_operation(self, path, method, view):
+        """
+        Return the operation and components of an endpoint, or ``None`` if
+        the view is not permitted.
+        """
+        if not self.has_view_permissions(path, method, view):
+            return None
+        return view.schema.get_operation(path, method), view.schema.get_components(path, method)
+
+    def generate_operations(self, count, workers):
+        """
+        Return :meth:`generate_operation` for each of the `count` endpoints,
+        generated in a pool of `workers` processes.
+        """
+        generator = type(self)(
+            title=self.title,
+            url=self.url,
+            description=self.description,
+            patterns=self.patterns,
+            urlconf=self.urlconf,
+            version=self.version,
+        )
+        # Several shards per worker even out endpoints of uneven cost.
+        size = max(1, count // (workers * 4))
+        shards = [range(start, min(start + size, count)) for start in range(0, count, size)]
+        operations = [None] * count
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(generator,)
+        ) as executor:
+            for results in executor.map(_generate_shard, shards):
+                for index, generated in results:
+                    operations[index] = generated
+        return operations
+
     def get_security_schemes(self, paths):
         security_schemes = {}
         for path, method in paths.items():
@@ -547,6 +791,22 @@ class AutoSchema(ViewInspector):
             content["minimum"] = field.min_value
 
     def map_serializer(self, serializer):
+        """
+        Return the component schema of `serializer`, memoized for drf-turbo
+        serializers with the same class and fields.
+        """
+        key = _serializer_key(serializer)
+        if key is None:
+            return self.build_serializer_schema(serializer)
+        key = (type(self), key)
+        schema = _components.get(key)
+        if schema is None:
+            schema = self.build_serializer_schema(serializer)
+            _components.set(key, schema)
+        # Callers set keys such as "readOnly" on the returned schema.
+        return dict(schema)
+
+    def build_serializer_schema(self, serializer):
         # Assuming we have a valid serializer instance.
         required = []
         properties = {}
@@ -651,15 +911,24 @@ class AutoSchema(ViewInspector):
         if not hasattr(view, "get_serializer"):
             return None
 
+        # The components, request body and responses of an endpoint all use
+        # the same serializer.
+        key = (view, path, method)
+        if getattr(self, "_serializer_endpoint", None) == key:
+            return self._serializer
+
         try:
-            return view.get_serializer()
+            serializer = view.get_serializer()
         except exceptions.APIException:
             warnings.warn(
                 "{}.get_serializer() raised an exception during "
                 "schema generation. Serializer fields will not be "
                 "generated for {} {}.".format(view.__class__.__name__, method, path)
             )
-            return None
+            serializer = None
+        self._serializer_endpoint = key
+        self._serializer = serializer
+        return serializer
 
     def _get_reference(self, serializer):
         return {
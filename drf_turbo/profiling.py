@@ -0,0 +1,304 @@
+import warnings
+
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections
+
+from drf_turbo.serializer import Serializer, set_profiler
+
+
+class FieldStats:
+    """
+    The counters of one field of a serializer class, for one phase
+    (``'serialize'`` or ``'deserialize'``).
+    """
+
+    __slots__ = ('calls', 'time', 'errors', 'queries')
+
+    def __init__(self):
+        self.calls = 0
+        self.time = 0.0
+        self.errors = 0
+        self.queries = 0
+
+    def as_dict(self):
+        return {
+            'calls': self.calls,
+            'time': self.time,
+            'errors': self.errors,
+            'queries': self.queries,
+        }
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Profiler:
+    """
+    Records, per serializer class and field, the number of times each field
+    is serialized and deserialized, the time spent, the errors raised and the
+    database queries made, e.g. by ``get_attribute`` reading a relation.
+
+    Use it as a context manager around the code to profile::
+
+        with Profiler() as profiler:
+            BookSerializer(books, many=True).data
+        print(profiler.to_prometheus())
+
+    or call :meth:`start` and :meth:`stop`. While a profiler is active, every
+    serializer of the process records calls, time and errors to it, but
+    queries are only counted on the database connections of the thread that
+    called :meth:`start`. The time of a nested serializer is included in that
+    of its field, while its queries are charged to its own fields. Serializers
+    only check whether a profiler is active, so recording costs nothing when
+    none is.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.queries = 0
+        self._previous = None
+
+    def record(self, serializer_class, field, phase, elapsed, queries=0, errors=0, calls=1):
+        """
+        Add a measurement of `field` of `serializer_class`.
+
+        :param serializer_class: The serializer class.
+        :param field: The name of the field.
+        :param phase: ``'serialize'`` or ``'deserialize'``.
+        :param elapsed: The time spent, in seconds.
+        :param queries: The number of database queries made.
+        :param errors: The number of errors raised.
+        :param calls: The number of values processed.
+        """
+        key = (serializer_class, field, phase)
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = FieldStats()
+        stats.calls += calls
+        stats.time += elapsed
+        stats.errors += errors
+        stats.queries += queries
+
+    def begin_list(self):
+        """
+        Called before a ``many=True`` serializer serializes a list. The
+        return value is passed to :meth:`end_list`.
+        """
+        return None
+
+    def end_list(self, serializer, mark, rows):
+        """
+        Called after a ``many=True`` serializer serialized a list.
+
+        :param serializer: The serializer.
+        :param mark: The return value of :meth:`begin_list`.
+        :param rows: The number of rows serialized.
+        """
+
+    def _count_query(self, execute, sql, params, many, context):
+        self.queries += 1
+        return execute(sql, params, many, context)
+
+    def start(self):
+        """
+        Make serializers record to this profiler and count the queries of
+        the database connections of the current thread.
+        """
+        for connection in connections.all():
+            connection.execute_wrappers.append(self._count_query)
+        self._previous = set_profiler(self)
+        return self
+
+    def stop(self):
+        """
+        Stop recording.
+        """
+        set_profiler(self._previous)
+        self._previous = None
+        for connection in connections.all():
+            if self._count_query in connection.execute_wrappers:
+                connection.execute_wrappers.remove(self._count_query)
+
+    def reset(self):
+        """
+        Drop the recorded measurements.
+        """
+        self.stats = {}
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def as_dict(self):
+        """
+        Return the measurements as
+        ``{serializer: {field: {phase: {'calls', 'time', 'errors', 'queries'}}}}``,
+        with serializers named by their dotted path.
+        """
+        ret = {}
+        for (serializer_class, field, phase), stats in self.stats.items():
+            name = '%s.%s' % (serializer_class.__module__, serializer_class.__qualname__)
+            ret.setdefault(name, {}).setdefault(field, {})[phase] = stats.as_dict()
+        return ret
+
+    def to_prometheus(self, prefix='drf_turbo_field'):
+        """
+        Return the measurements in the Prometheus text exposition format, as
+        counters labelled by ``serializer``, ``field`` and ``phase``.
+
+        :param prefix: The prefix of the metric names.
+        """
+        metrics = (
+            ('calls', 'calls_total', 'Number of values processed by the field.'),
+            ('time', 'seconds_total', 'Time spent processing the field.'),
+            ('errors', 'errors_total', 'Number of errors raised by the field.'),
+            ('queries', 'queries_total', 'Number of database queries made by the field.'),
+        )
+        data = self.as_dict()
+        lines = []
+        for attr, suffix, help_text in metrics:
+            name = '%s_%s' % (prefix, suffix)
+            lines.append('# HELP %s %s' % (name, help_text))
+            lines.append('# TYPE %s counter' % name)
+            for serializer, fields in sorted(data.items()):
+                for field, phases in sorted(fields.items(), key=lambda item: str(item[0])):
+                    for phase, stats in sorted(phases.items()):
+                        lines.append('%s{serializer="%s",field="%s",phase="%s"} %r' % (
+                            name, _label(serializer), _label(field), phase, stats[attr],
+                        ))
+        return '\n'.join(lines) + '\n'
+
+
+class NPlusOneError(Exception):
+    """
+    Raised by :class:`NPlusOneDetector` when a field queries the database
+    once per row of a list.
+    """
+
+
+class NPlusOneWarning(UserWarning):
+    """
+    Emitted by :class:`NPlusOneDetector` with ``action='warn'``.
+    """
+
+
+def _relation(model, attr):
+    opts = model._meta
+    try:
+        return opts.get_field(attr)
+    except FieldDoesNotExist:
+        pass
+    for relation in opts.related_objects:
+        if relation.get_accessor_name() == attr:
+            return relation
+    return None
+
+
+def _find_field(serializer, serializer_class, name):
+    """
+    Return ``(serializer, lookup, to_many)`` for the serializer of
+    `serializer_class` nested in `serializer` that has the field `name`, where
+    `lookup` is the list of attributes leading to it and `to_many` whether
+    they cross a to-many relation.
+    """
+    queue = [(serializer, [], False)]
+    seen = set()
+    while queue:
+        current, lookup, to_many = queue.pop(0)
+        if type(current) is serializer_class and name in current.fields:
+            return current, lookup, to_many
+        if type(current) in seen:
+            continue
+        seen.add(type(current))
+        for field in current.fields.values():
+            if isinstance(field, Serializer) and field.attrs:
+                queue.append((field, lookup + field.attrs, to_many or field.many))
+    return None
+
+
+def _suggestion(serializer, serializer_class, name):
+    """
+    Suggest how to fetch field `name` of `serializer_class` for the rows of
+    `serializer`.
+    """
+    found = _find_field(serializer, serializer_class, name)
+    if found is None:
+        return 'Prefetch what the field reads.'
+    current, lookup, to_many = found
+    field = current.fields[name]
+    if field.is_method_field:
+        return 'Annotate the queryset or prefetch what `%s.%s()` reads.' % (
+            serializer_class.__name__, field.method_name or 'get_%s' % name,
+        )
+    model = getattr(getattr(current, 'Meta', None), 'model', None)
+    relation = None
+    for attr in field.attrs:
+        if model is None:
+            relation = None
+            break
+        relation = _relation(model, attr)
+        if relation is None or not relation.is_relation:
+            relation = None
+            break
+        to_many = to_many or relation.one_to_many or relation.many_to_many
+        model = relation.related_model
+    if relation is None:
+        return 'Prefetch what `%s` reads.' % '.'.join(field.attrs)
+    return 'Add `.%s(%r)` to the queryset, or use `%s.optimize_queryset()`.' % (
+        'prefetch_related' if to_many else 'select_related',
+        '__'.join(lookup + field.attrs),
+        type(serializer).__name__,
+    )
+
+
+class NPlusOneDetector(Profiler):
+    """
+    A profiler that raises :class:`NPlusOneError` (or warns with
+    ``action='warn'``) when a field queries the database at least once per
+    row of a list serialized by a ``many=True`` serializer, e.g. a nested
+    serializer or ``ManyRelatedField`` whose relation was not fetched with
+    ``select_related`` / ``prefetch_related``. The message names the
+    serializer, the field and the lookup to fetch.
+
+    Use it in tests::
+
+        with NPlusOneDetector():
+            client.get('/books/')
+
+    :param action: ``'raise'`` or ``'warn'``.
+    :param min_rows: The smallest list checked.
+    """
+
+    def __init__(self, action='raise', min_rows=2):
+        assert action in ('raise', 'warn'), '`action` must be "raise" or "warn".'
+        super().__init__()
+        self.action = action
+        self.min_rows = min_rows
+        self.reports = []
+        self._reported = set()
+
+    def begin_list(self):
+        return {key: stats.queries for key, stats in self.stats.items() if key[2] == 'serialize'}
+
+    def end_list(self, serializer, mark, rows):
+        if rows < self.min_rows:
+            return
+        for key, stats in list(self.stats.items()):
+            serializer_class, name, phase = key
+            if phase != 'serialize' or key in self._reported:
+                continue
+            queries = stats.queries - mark.get(key, 0)
+            if queries < rows:
+                continue
+            self._reported.add(key)
+            message = '%s.%s made %s queries for %s rows of %s. %s' % (
+                serializer_class.__name__, name, queries, rows, type(serializer).__name__,
+                _suggestion(serializer, serializer_class, name),
+            )
+            self.reports.append(message)
+            if self.action == 'raise':
+                raise NPlusOneError(message)
+            warnings.warn(message, NPlusOneWarning)
@@ -0,0 +1,47 @@
+import json
+
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+from drf_turbo.encoder import RawJSON, encode_json
+
+
+def _has_raw_json(data):
+    """
+    Whether `data` is pre-encoded JSON or a dict holding it, as pagination
+    responses do.
+    """
+    if isinstance(data, RawJSON):
+        return True
+    return isinstance(data, dict) and any(isinstance(v, RawJSON) for v in data.values())
+
+
+class TurboJSONRenderer(renderers.JSONRenderer):
+    """
+    A drop-in replacement for DRF's `JSONRenderer` that encodes with the
+    drf_turbo encoder and writes :class:`~drf_turbo.encoder.RawJSON` payloads,
+    such as ``serializer.json_bytes``, verbatim.
+
+    Responses that ask for indentation, non-compact separators, ASCII-only
+    output or a custom encoder class go through `JSONRenderer` unchanged.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render `data` into JSON, returning a bytestring.
+        """
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if (
+            self.get_indent(accepted_media_type, renderer_context) is None
+            and self.compact
+            and not self.ensure_ascii
+            and self.encoder_class is encoders.JSONEncoder
+        ):
+            return bytes(encode_json(data, allow_nan=not self.strict))
+
+        if _has_raw_json(data):
+            data = json.loads(encode_json(data, allow_nan=True))
+        return super().render(data, accepted_media_type, renderer_context)
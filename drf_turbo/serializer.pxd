@@ -1,8 +1,90 @@
 cimport cython_metaclass
 
+from drf_turbo.encoder cimport JSONWriter
+
 from drf_turbo.fields cimport Field
 
 
+cdef class FieldPlan:
+    cdef:
+        readonly object key
+        readonly Field field
+        readonly int kind
+        readonly int encoding
+        bytes json_key
+        object attr
+        list attrs
+        object method
+        bint call
+        bint probe_manager
+
+
+cdef class SerializationPlan:
+    cdef:
+        readonly tuple entries
+        Py_ssize_t size
+        bint many_related
+        dict by_key
+        object result_cache
+        object serializer_path
+        tuple cache_key
+        bint cache_connected
+
+
+cdef class ValidationEntry:
+    cdef:
+        readonly object name
+        readonly object attr
+        readonly Field field
+        readonly object hook
+        bint direct
+
+
+cdef class ValidationPlan:
+    cdef:
+        readonly dict fields
+        readonly tuple entries
+        readonly Py_ssize_t max_errors
+
+
+cdef class ValuesPlan:
+    cdef:
+        readonly tuple entries
+        readonly tuple columns
+        Py_ssize_t size
+
+
+cdef class FieldSet:
+    cdef:
+        readonly dict fields
+        readonly object serializer_class
+        readonly bint instance_bound
+        dict _readable
+        dict _writable
+        SerializationPlan _plan
+        ValidationPlan _validation_plan
+        dict _values_plans
+
+    cdef dict readable(self)
+    cdef dict writable(self)
+    cdef SerializationPlan plan(self)
+    cdef ValidationPlan validation_plan(self)
+    cdef ValuesPlan values_plan(self,object model)
+    cdef FieldSet select(self,object only,object exclude)
+
+
+cdef class BoundFields:
+    cdef:
+        FieldSet _base
+        object _root
+        bint _nested_owned
+
+    cdef FieldSet current(self)
+    cdef dict _copy_for_write(self)
+    cdef dict _own_nested(self)
+
+
+
 cdef class BaseSerializer(Field) :
     cdef:
         object instance
@@ -14,19 +96,65 @@ cdef class BaseSerializer(Field) :
         public bint partial 
 
     cpdef bint is_valid(self,bint raise_exception=*) except -1
+    cdef int _validate(self,dict context) except -1
     cpdef dict get_initial_data(self)
 
 
 
 
 cdef class Serializer(BaseSerializer):
-    cdef inline dict _parse_nested_fields(self,object fields)
-    cdef inline void _select_nested_fields(self,Serializer serializer,object fields,basestring action,bint is_nested=*)
-    cdef inline object _fields_to_include(self,Serializer serializer,object fields)
-    cdef inline object _fields_to_exclude(self,Serializer serializer,object fields,bint is_nested)
-    cdef dict _serialize(self,object instance,dict fields)
+    cdef:
+        BoundFields _fields_view
+        FieldSet _selected
+        FieldSet _selected_base
+        tuple _selected_only
+        tuple _selected_exclude
+
+    cdef FieldSet _class_field_set(self)
+    cdef FieldSet _base_field_set(self)
+    cdef FieldSet _selected_field_set(self)
+    cdef Serializer _select_copy(self,dict tree,bint keep)
+    cdef Serializer _bound_copy(self,object name,object root)
+    cdef object _resolve(self,FieldPlan entry,object instance)
+    cdef tuple _cache_key(self,SerializationPlan plan)
+    cdef void _connect_cache(self,SerializationPlan plan,object model) except *
+    cdef dict _serialize(self,object instance,SerializationPlan plan,dict batched=*)
+    cdef object _serialize_field(self,FieldPlan entry,object instance,dict batched)
+    cdef object _profile_field(self,FieldPlan entry,object instance,dict batched)
+    cdef dict _serialize_profiled(self,object instance,SerializationPlan plan,dict batched)
+    cpdef serialize_lazy(self,object instance)
     cpdef serialize(self,instance,dict context)
-    cdef dict _deserialize(self, object data,dict fields)
+    cdef list _serialize_list(self,object instance,FieldSet field_set)
+    cdef list _serialize_many(self,object instance,SerializationPlan plan)
+    cdef list _serialize_values(self,object queryset,ValuesPlan plan)
+    cpdef list serialize_values(self,object queryset)
+    cdef int _write_object(self,JSONWriter writer,object instance,SerializationPlan plan,dict batched=*) except -1
+    cdef int _write_json(self,JSONWriter writer,object instance) except -1
+    cpdef serialize_json(self,object instance,dict context)
+    cdef dict _deserialize(self,object data,ValidationPlan plan,dict context)
+    cdef list _deserialize_many(self,object data,ValidationPlan plan,dict context)
     cpdef deserialize(self,object data,dict context)
     cpdef run_validation(self,object data,dict context)
     cpdef validate(self,object data)
+
+
+cdef class LazyRows:
+    cdef:
+        SerializationPlan plan
+        list rows
+        dict batched
+
+    cdef dict batch(self)
+
+
+cdef class LazyData:
+    cdef:
+        Serializer serializer
+        object instance
+        SerializationPlan plan
+        LazyRows rows
+        dict cache
+        dict materialized
+
+    cdef object value(self,FieldPlan entry)
+    cpdef dict materialize(self)
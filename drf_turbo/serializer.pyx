@@ -1,17 +1,903 @@
 # cython: language_level=3
-from django.utils.functional import cached_property
+from drf_turbo.fields cimport (NO_DEFAULT, ChoiceField, Field,
+                               ManyRelatedField, RelatedField, SkipField,
+                               resolve_related_objects)
 
-from drf_turbo.fields cimport NO_DEFAULT, Field, RelatedField, SkipField
+from asgiref.sync import sync_to_async
 
+import copy
 import traceback
-from collections.abc import Mapping
+from collections.abc import Mapping, MutableMapping
+from time import perf_counter
 
+from django.core.exceptions import FieldDoesNotExist, ObjectDoesNotExist
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import connections, router
+from django.db.models import Model, Prefetch, prefetch_related_objects
 
+try:
+    from django.db.models import aprefetch_related_objects
+except ImportError:
+    # Django < 5.0
+    aprefetch_related_objects = sync_to_async(prefetch_related_objects)
+
+from drf_turbo.encoder cimport JSONWriter
+
+from drf_turbo.cache import invalidate_rows
+from drf_turbo.encoder import encode_json
 from drf_turbo.exceptions import *
+from drf_turbo.fields import aresolve_related_objects
+from drf_turbo.fields import (BoolField, ConstantField, DateField,
+                              DateTimeField, DecimalField, EmailField,
+                              FileField, FloatField, IntField, IPField,
+                              MultipleChoiceField, PasswordField, RegexField,
+                              SlugField, StrField, TimeField, URLField,
+                              UUIDField)
 from drf_turbo.utils import *
 
 cimport cython
+from cpython.tuple cimport PyTuple_GET_ITEM
+
+
+cdef enum:
+    # How a planned field reads its value from the instance.
+    ACCESS_ATTR = 0     # single attribute or mapping key
+    ACCESS_PATH = 1     # dotted path or custom `get_attribute`
+    ACCESS_FK = 2       # foreign key column (`<attr>_id`)
+    ACCESS_METHOD = 3   # `MethodField` resolved on the serializer class
+
+cdef enum:
+    # How a planned field writes its value in `serialize_json`.
+    ENCODE_GENERIC = 0  # `field.serialize` and then the generic encoder
+    ENCODE_STR = 1      # string fields: `str(value)`
+    ENCODE_INT = 2      # `IntField`: `int(value)`
+    ENCODE_FLOAT = 3    # `FloatField`: `float(value)`
+    ENCODE_NESTED = 4   # nested serializer written in place
+    ENCODE_CHOICE = 5   # `ChoiceField`: pre-encoded output of the choice
+
+# Fields whose values are never related managers, so the per-row
+# `hasattr(result, 'all')` probe can be skipped for them.
+SCALAR_FIELDS = (
+    StrField, SlugField, IntField, FloatField, DecimalField, BoolField,
+    DateTimeField, DateField, TimeField, FileField, ConstantField,
+)
+
+# Field selections (`only` / `exclude`) projected from the per-class tables.
+cdef object _projections = LRUCache(maxsize=512)
+
+# The rows validated between two checks of `Meta.max_errors`.
+MAX_ERRORS_BLOCK = 1000
+
+# Fields whose `serialize` is a plain `str(value)`.
+STR_FIELDS = (StrField, EmailField, URLField, RegexField, IPField, PasswordField, UUIDField)
+
+
+# The active `drf_turbo.profiling.Profiler`, checked once per serialized
+# object so that serializers pay a single branch when profiling is off.
+cdef object _profiler = None
+
+# The queries charged to fields so far, so that a field is not charged for
+# the queries of the fields of its nested serializer (see `_own_queries`).
+cdef Py_ssize_t _charged = 0
+
+
+def set_profiler(profiler):
+    """
+    Make serializers record to `profiler`, or stop recording with ``None``.
+    Returns the previous profiler.
+    """
+    global _profiler
+    previous = _profiler
+    _profiler = profiler
+    return previous
+
+
+cdef Py_ssize_t _own_queries(object profiler, Py_ssize_t queries, Py_ssize_t charged):
+    """
+    Return the queries made since the profiler counted `queries` and the
+    fields were charged `charged` queries, minus those charged to the fields
+    processed in between, and charge them.
+    """
+    global _charged
+    cdef Py_ssize_t made = profiler.queries - queries
+    cdef Py_ssize_t own = made - (_charged - charged)
+    _charged = charged + made
+    return own
+
+
+cdef bint _inherits(object cls, object base, str name):
+    """
+    Whether `cls` uses the implementation of `name` defined on `base`.
+    """
+    return getattr(cls, name) is getattr(base, name)
+
+
+cdef class FieldPlan:
+    """
+    The resolved serialization steps for a single field.
+    """
+
+    def __init__(self, key, Field field, object serializer_class):
+        self.key = key
+        self.field = field
+        self.json_key = encode_json(key) + b':'
+        self.call = field.call
+        self.probe_manager = False
+        self.method = None
+        self.encoding = ENCODE_GENERIC
+        if field.is_method_field:
+            self.kind = ACCESS_METHOD
+            self.method = field.method_getter(key, serializer_class)
+        elif isinstance(field, RelatedField):
+            self.kind = ACCESS_FK
+            self.attrs = [key + '_id']
+        else:
+            self.probe_manager = not isinstance(field, SCALAR_FIELDS) or isinstance(field, MultipleChoiceField)
+            if len(field.attrs) == 1 and _inherits(type(field), Field, 'get_attribute'):
+                self.kind = ACCESS_ATTR
+                self.attr = field.attrs[0]
+            else:
+                self.kind = ACCESS_PATH
+            if type(field) in STR_FIELDS and _inherits(type(field), StrField, 'serialize'):
+                self.encoding = ENCODE_STR
+            elif type(field) is IntField:
+                self.encoding = ENCODE_INT
+            elif type(field) is FloatField:
+                self.encoding = ENCODE_FLOAT
+            elif isinstance(field, Serializer) and _inherits(type(field), Serializer, 'serialize'):
+                self.encoding = ENCODE_NESTED
+            elif type(field) is ChoiceField:
+                self.encoding = ENCODE_CHOICE
+
+
+cdef class SerializationPlan:
+    """
+    An ordered, precompiled list of :class:`FieldPlan` entries, built once per
+    serializer class and field selection.
+    """
+
+    def __init__(self, dict fields, object serializer_class):
+        cdef str name
+        cdef Field field
+        self.entries = tuple([
+            FieldPlan(field.attr if field.attr and '.' not in field.attr else name, field, serializer_class)
+            for name, field in fields.items()
+        ])
+        self.size = len(self.entries)
+        self.many_related = any(isinstance(field, ManyRelatedField) for field in fields.values())
+        # Later entries win for duplicate keys, as in `Serializer._serialize`.
+        self.by_key = {}
+        for entry in self.entries:
+            self.by_key[(<FieldPlan>entry).key] = entry
+        self.result_cache = getattr(getattr(serializer_class, 'Meta', None), 'result_cache', None)
+        self.serializer_path = '%s.%s' % (serializer_class.__module__, serializer_class.__qualname__)
+        self.cache_key = None
+        self.cache_connected = False
+
+
+cdef class ValidationEntry:
+    """
+    The resolved validation steps for a single writable field.
+    """
+
+    def __init__(self, str name, Field field, object serializer_class):
+        self.name = name
+        self.field = field
+        self.attr = field.attr if field.attr and '.' not in field.attr else name
+        hook = 'validate_' + self.attr
+        self.hook = hook if hasattr(serializer_class, hook) else None
+        # Fields with the stock empty-value handling go straight to
+        # `deserialize` for values that are present and not null.
+        self.direct = (
+            _inherits(type(field), Field, 'run_validation')
+            and _inherits(type(field), Field, 'validate_empty_values')
+        )
+
+
+cdef class ValidationPlan:
+    """
+    An ordered, precompiled list of :class:`ValidationEntry` entries, built
+    once per serializer class and field table.
+    """
+
+    def __init__(self, dict fields, object serializer_class):
+        cdef str name
+        cdef Field field
+        self.fields = fields
+        self.entries = tuple([
+            ValidationEntry(name, field, serializer_class)
+            for name, field in fields.items()
+        ])
+        self.max_errors = getattr(getattr(serializer_class, 'Meta', None), 'max_errors', None) or 0
+
+
+cdef class ValuesPlan:
+    """
+    The `values_list()` columns that feed a :class:`SerializationPlan`, one
+    per entry, for plans whose fields can all be read from columns.
+    """
+
+    def __init__(self, tuple entries, tuple columns):
+        self.entries = entries
+        self.columns = columns
+        self.size = len(entries)
+
+
+cdef object _values_column(FieldPlan entry, object model):
+    """
+    Return the `values_list()` lookup that yields the value `entry` reads from
+    a `model` instance, or `None` if it is not a plain column.
+    """
+    cdef Field field = entry.field
+    if (
+        entry.kind == ACCESS_METHOD
+        or entry.call
+        or isinstance(field, (Serializer, ManyRelatedField, FileField))
+        or not _inherits(type(field), Field, 'get_attribute')
+        or not field.attrs
+    ):
+        return None
+    current = model
+    path = []
+    for attr in field.attrs[:-1]:
+        relation = _model_field(current, attr)
+        # `get_attribute` fails on a missing related object, a join yields NULL.
+        if relation is None or not relation.concrete or not relation.many_to_one or relation.null:
+            return None
+        path.append(attr)
+        current = relation.related_model
+    relation = _model_field(current, field.attrs[-1])
+    if relation is None or not relation.concrete:
+        return None
+    if relation.is_relation and not isinstance(field, RelatedField):
+        return None
+    path.append(relation.name)
+    return '__'.join(path)
+
+
+cdef ValuesPlan _values_plan(SerializationPlan plan, object model):
+    cdef FieldPlan entry
+    cdef list columns = []
+    for entry in plan.entries:
+        column = _values_column(entry, model)
+        if column is None:
+            return None
+        columns.append(column)
+    return ValuesPlan(plan.entries, tuple(columns))
+
+
+cdef dict _parse_nested_fields(object fields):
+    """
+    Parse a list of ``parent__child`` field names into a selection tree.
+
+    :param fields: A list of fields to parse.
+    """
+    cdef dict field_object = {"fields": []}
+    cdef str f
+    for f in fields:
+        obj = field_object
+        nested_fields = f.split("__")
+        for v in nested_fields:
+            if v not in obj["fields"]:
+                obj["fields"].append(v)
+            if nested_fields.index(v) < len(nested_fields) - 1:
+                obj[v] = obj.get(v, {"fields": []})
+                obj = obj[v]
+    return field_object
+
+
+cdef dict _project_fields(dict fields, dict tree, bint keep):
+    """
+    Return a new field table filtered by a selection tree.
+
+    :param fields: The field table to filter.
+    :param tree: The selection tree built by `_parse_nested_fields`.
+    :param keep: Whether the tree lists fields to keep or to drop.
+    """
+    cdef dict ret = {}
+    cdef list names = tree["fields"]
+    for name, field in fields.items():
+        if keep:
+            if name not in names:
+                continue
+        elif name in names and name not in tree:
+            continue
+        if name in tree:
+            field = (<Serializer?>field)._select_copy(tree[name], keep)
+        ret[name] = field
+    return ret
+
+
+cdef object _iter_rows(object instance, int chunk_size):
+    """
+    Iterate over `instance`, streaming unevaluated querysets from the database.
+    """
+    if hasattr(instance, 'iterator') and getattr(instance, '_result_cache', None) is None:
+        return instance.iterator(chunk_size=chunk_size)
+    return iter(instance)
+
+
+def _iter_chunks(object instance, int chunk_size):
+    """
+    Iterate over `instance` in lists of `chunk_size` rows, streaming
+    unevaluated querysets from the database.
+    """
+    cdef list chunk = []
+    for o in _iter_rows(instance, chunk_size):
+        chunk.append(o)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+cdef object _model_field(object model, str attr):
+    """
+    Return the model field or reverse relation behind the attribute `attr`, or
+    `None` when `attr` is not a model field (e.g. a property).
+    """
+    opts = model._meta
+    try:
+        field = opts.get_field(attr)
+    except FieldDoesNotExist:
+        field = None
+    if field is not None and (field.concrete or not field.auto_created):
+        return field
+    for relation in opts.related_objects:
+        if relation.get_accessor_name() == attr:
+            return relation
+    return None
+
+
+cdef list _all_columns(object model, str prefix):
+    return [prefix + f.name for f in model._meta.concrete_fields]
+
+
+cdef object _plan_queryset(Serializer serializer, object model, str prefix, list select, dict prefetch, bint root):
+    """
+    Collect the `select_related` and `prefetch_related` lookups needed to
+    serialize `model` instances with `serializer`.
+
+    Return the columns read by the serializer, or `None` when they cannot all
+    be known, e.g. because of a method field.
+
+    `root` is set for the queryset the serializer is called with, as opposed
+    to nested and prefetched ones.
+    """
+    cdef list columns = []
+    cdef bint restrict = True
+    cdef str name, attr, lookup
+    cdef Field field
+    for name, field in serializer._selected_field_set().readable().items():
+        if field.is_method_field or not field.attrs:
+            restrict = False
+            continue
+        current = model
+        lookup = prefix
+        relation = None
+        for attr in field.attrs:
+            if relation is not None:
+                # Dotted paths are followed through single-valued relations only.
+                if not (relation.many_to_one or relation.one_to_one):
+                    relation = None
+                    break
+                select.append(lookup)
+                if relation.concrete:
+                    columns.append(lookup)
+                current = relation.related_model
+                lookup += '__'
+            relation = _model_field(current, attr)
+            if relation is None:
+                break
+            lookup += attr
+        if relation is None:
+            restrict = False
+            continue
+
+        if not relation.is_relation:
+            columns.append(lookup)
+        elif relation.many_to_one or relation.one_to_one:
+            if relation.concrete:
+                columns.append(lookup)
+            if isinstance(field, RelatedField):
+                continue
+            select.append(lookup)
+            nested = None
+            if isinstance(field, Serializer):
+                nested = _plan_queryset(
+                    <Serializer>field, relation.related_model, lookup + '__', select, prefetch, False,
+                )
+            if nested is None:
+                nested = _all_columns(relation.related_model, lookup + '__')
+            columns.extend(nested)
+        elif isinstance(field, Serializer):
+            prefetch[lookup] = Prefetch(
+                lookup,
+                queryset=_optimize_queryset(
+                    <Serializer>field, relation.related_model._default_manager.all(), relation,
+                ),
+            )
+        elif isinstance(field, ManyRelatedField):
+            if root:
+                # Top-level rows read the pk lists with one `values_list()`
+                # query per page (see `_batch_many_related`), which is cheaper
+                # than prefetching objects.
+                continue
+            queryset = relation.related_model._default_manager.all()
+            if relation.one_to_many:
+                queryset = queryset.only(relation.field.name)
+            else:
+                queryset = queryset.only(relation.related_model._meta.pk.name)
+            prefetch[lookup] = Prefetch(lookup, queryset=queryset)
+        elif lookup not in prefetch:
+            prefetch[lookup] = lookup
+    return columns if restrict else None
+
+
+cdef void _cache_relations(Serializer serializer, object model, str prefix, list related, list through) except *:
+    """
+    Collect the relations that serializing `model` instances with
+    `serializer` reads, for invalidating result caches: `(related model,
+    lookup)` pairs in `related`, and `(through model, source model, source
+    lookup, target model, target lookup)` tuples for many-to-many relations
+    in `through`. Lookups lead from the root model and start with `prefix`.
+    """
+    cdef str name, attr, lookup, path
+    cdef Field field
+    cdef Py_ssize_t i
+    for name, field in serializer._selected_field_set().readable().items():
+        if field.is_method_field or not field.attrs:
+            continue
+        current = model
+        path = prefix
+        relation = None
+        for i, attr in enumerate(field.attrs):
+            relation = _model_field(current, attr)
+            if relation is None or not relation.is_relation:
+                relation = None
+                break
+            lookup = path + relation.name
+            if relation.many_to_many:
+                rel = relation if relation.auto_created else relation.remote_field
+                through.append((rel.through, current, path[:-2], relation.related_model, lookup))
+            # The pk of a foreign key is read from the row itself.
+            if not (
+                isinstance(field, RelatedField) and relation.concrete
+                and not relation.many_to_many and i == len(field.attrs) - 1
+            ):
+                related.append((relation.related_model, lookup))
+            current = relation.related_model
+            path = lookup + '__'
+        if relation is not None and isinstance(field, Serializer):
+            _cache_relations(<Serializer>field, current, path, related, through)
+
+
+cdef list _many_related_queries(SerializationPlan plan, list rows):
+    """
+    Return ``(entry, queryset)`` pairs for the to-many relations serialized by
+    :class:`ManyRelatedField` for all `rows`, where `queryset` yields
+    ``(row pk, related pk)`` tuples. Relations that are prefetched are left out.
+    """
+    cdef list queries = []
+    cdef FieldPlan entry
+    if not rows or not hasattr(rows[0], '_meta'):
+        return queries
+    first = rows[0]
+    model = type(first)
+    prefetched = getattr(first, '_prefetched_objects_cache', {})
+    for entry in plan.entries:
+        if entry.kind != ACCESS_ATTR or not isinstance(entry.field, ManyRelatedField):
+            continue
+        relation = _model_field(model, entry.attr)
+        if relation is None or not (relation.many_to_many or relation.one_to_many):
+            continue
+        # The lookup from the related model back to the rows, and the key
+        # the related manager uses in `_prefetched_objects_cache`.
+        if relation.concrete:
+            query_name = relation.related_query_name()
+            cache_name = relation.name
+        else:
+            query_name = relation.field.name
+            if relation.many_to_many:
+                cache_name = relation.field.related_query_name()
+            else:
+                cache_name = relation.get_cache_name()
+        if cache_name in prefetched:
+            continue
+        related = relation.related_model._default_manager.filter(
+            **{query_name + '__in': [row.pk for row in rows]}
+        )
+        queries.append((entry, related.values_list(query_name, 'pk')))
+    return queries
+
+
+cdef dict _batch_many_related(SerializationPlan plan, list rows):
+    """
+    Fetch the pk lists of the to-many relations serialized by
+    :class:`ManyRelatedField` for all `rows`, with one query per relation
+    grouped by the foreign key back to the rows.
+
+    Return a dict of :class:`FieldPlan` -> {row pk: [related pks]}. Relations
+    that are prefetched are left out.
+    """
+    cdef dict batched = {}
+    cdef dict groups
+    for entry, related in _many_related_queries(plan, rows):
+        groups = {row.pk: [] for row in rows}
+        for key, pk in related:
+            groups[key].append(pk)
+        batched[entry] = groups
+    return batched
+
+
+async def _abatch_many_related(SerializationPlan plan, list rows):
+    """
+    Like `_batch_many_related`, iterating the queries asynchronously.
+    """
+    batched = {}
+    for entry, related in _many_related_queries(plan, rows):
+        groups = {row.pk: [] for row in rows}
+        async for key, pk in related:
+            groups[key].append(pk)
+        batched[entry] = groups
+    return batched
+
+
+async def _aprefetch(Serializer serializer, list rows):
+    """
+    Fetch the related objects that serializing the model instances `rows`
+    with `serializer` reads, except the ones batched by `_abatch_many_related`.
+    """
+    cdef list select = []
+    cdef dict prefetch = {}
+    if not rows or not hasattr(rows[0], '_meta'):
+        return
+    _plan_queryset(serializer, type(rows[0]), '', select, prefetch, True)
+    lookups = list(dict.fromkeys(select)) + list(prefetch.values())
+    if lookups:
+        await aprefetch_related_objects(rows, *lookups)
+
+
+cdef object _optimize_queryset(Serializer serializer, object queryset, object relation):
+    """
+    Apply the lookups planned by `_plan_queryset` to `queryset`.
+
+    :param serializer: The serializer that will serialize the queryset.
+    :param queryset: The queryset to optimize.
+    :param relation: The reverse relation the queryset is prefetched through, if any.
+    """
+    cdef list select = []
+    cdef dict prefetch = {}
+    columns = _plan_queryset(serializer, queryset.model, '', select, prefetch, relation is None)
+    if select:
+        queryset = queryset.select_related(*dict.fromkeys(select))
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch.values())
+    if columns is not None:
+        if relation is not None and relation.one_to_many:
+            # Prefetching matches rows on the foreign key back to the parent.
+            columns.append(relation.field.name)
+        queryset = queryset.only(*dict.fromkeys(columns or [queryset.model._meta.pk.name]))
+    return queryset
+
+
+cdef bint _is_queryset(object instance):
+    """
+    Whether `instance` is a queryset that has not been evaluated yet.
+    """
+    return (
+        hasattr(instance, 'values_list')
+        and getattr(instance, '_result_cache', True) is None
+        and not getattr(instance, '_prefetch_related_lookups', ())
+    )
+
+
+async def _alist(object rows):
+    """
+    Return `rows` as a list, iterating querysets asynchronously.
+    """
+    if hasattr(rows, '__aiter__'):
+        return [row async for row in rows]
+    return list(rows)
+
+
+cdef class FieldSet:
+    """
+    A shared, pre-bound table of serializer fields. The readable and writable
+    tables and the serialization plan are derived from it on first use.
+
+    `instance_bound` is set on class tables with fields that must be bound to
+    each serializer instance instead.
+
+    :param fields: The bound fields, keyed by field name.
+    :param serializer_class: The serializer class the fields belong to.
+    """
+
+    def __init__(self, dict fields, object serializer_class):
+        self.fields = fields
+        self.serializer_class = serializer_class
+
+    cdef dict readable(self):
+        cdef str k
+        cdef Field v
+        if self._readable is None:
+            self._readable = {k: v for k, v in self.fields.items() if not v.write_only}
+        return self._readable
+
+    cdef dict writable(self):
+        cdef str k
+        cdef Field v
+        if self._writable is None:
+            self._writable = {k: v for k, v in self.fields.items() if not v.read_only}
+        return self._writable
+
+    cdef SerializationPlan plan(self):
+        if self._plan is None:
+            self._plan = SerializationPlan(self.readable(), self.serializer_class)
+        return self._plan
+
+    cdef ValidationPlan validation_plan(self):
+        if self._validation_plan is None:
+            self._validation_plan = ValidationPlan(self.writable(), self.serializer_class)
+        return self._validation_plan
+
+    cdef ValuesPlan values_plan(self, object model):
+        """
+        Return the `values_list()` plan for `model`, or `None` if some field
+        needs a model instance.
+        """
+        if self._values_plans is None:
+            self._values_plans = {}
+        try:
+            return self._values_plans[model]
+        except KeyError:
+            values_plan = self._values_plans[model] = _values_plan(self.plan(), model)
+            return values_plan
+
+    cdef FieldSet select(self, object only, object exclude):
+        """
+        Return the projection of this table for an ``only`` / ``exclude`` selection.
+        """
+        if only is not None:
+            fields = _project_fields(self.fields, _parse_nested_fields(only), True)
+        else:
+            fields = _project_fields(self.fields, _parse_nested_fields(exclude), False)
+        return FieldSet(fields, self.serializer_class)
+
+
+cdef class BoundFields:
+    """
+    A copy-on-write mapping view over a shared :class:`FieldSet`. Reads go to
+    the shared table; the first write gives the serializer instance its own
+    copy. Nested serializers are copied for the instance on first access, so
+    changes to their fields do not leak either.
+    """
+
+    def __init__(self, FieldSet base, object root):
+        self._base = base
+        self._root = root
+
+    cdef FieldSet current(self):
+        return self._base
+
+    cdef dict _copy_for_write(self):
+        return dict(self._base.fields)
+
+    cdef dict _own_nested(self):
+        """
+        Replace the nested serializers of the shared table by copies bound to
+        the root, and return the fields.
+        """
+        cdef dict fields = None
+        if self._nested_owned:
+            return self._base.fields
+        self._nested_owned = True
+        for key, value in self._base.fields.items():
+            if isinstance(value, Serializer) and (<Serializer>value).root is not self._root:
+                if fields is None:
+                    fields = self._copy_for_write()
+                fields[key] = (<Serializer>value)._bound_copy(key, self._root)
+        if fields is not None:
+            self._base = FieldSet(fields, self._base.serializer_class)
+        return self._base.fields
+
+    def __getitem__(self, key):
+        return self._own_nested()[key]
+
+    def __setitem__(self, key, Field value):
+        cdef dict fields = self._copy_for_write()
+        value.bind(key, self._root)
+        fields[key] = value
+        self._base = FieldSet(fields, self._base.serializer_class)
+
+    def __delitem__(self, key):
+        cdef dict fields = self._copy_for_write()
+        del fields[key]
+        self._base = FieldSet(fields, self._base.serializer_class)
+
+    def pop(self, key, *args):
+        self._own_nested()
+        cdef dict fields = self._copy_for_write()
+        value = fields.pop(key, *args)
+        self._base = FieldSet(fields, self._base.serializer_class)
+        return value
+
+    def popitem(self):
+        self._own_nested()
+        cdef dict fields = self._copy_for_write()
+        item = fields.popitem()
+        self._base = FieldSet(fields, self._base.serializer_class)
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self._base.fields:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        cdef dict fields = self._copy_for_write()
+        cdef Field value
+        for key, value in dict(*args, **kwargs).items():
+            value.bind(key, self._root)
+            fields[key] = value
+        self._base = FieldSet(fields, self._base.serializer_class)
+
+    def clear(self):
+        self._base = FieldSet({}, self._base.serializer_class)
+
+    def __iter__(self):
+        return iter(self._base.fields)
+
+    def __len__(self):
+        return len(self._base.fields)
+
+    def __contains__(self, key):
+        return key in self._base.fields
+
+    def __eq__(self, other):
+        if isinstance(other, BoundFields):
+            other = (<BoundFields>other)._base.fields
+        return self._base.fields == other
+
+    def __repr__(self):
+        return repr(self._base.fields)
+
+    def get(self, key, default=None):
+        return self._own_nested().get(key, default)
+
+    def keys(self):
+        return self._base.fields.keys()
+
+    def values(self):
+        return self._own_nested().values()
+
+    def items(self):
+        return self._own_nested().items()
+
+    def copy(self):
+        return dict(self._own_nested())
+
+
+MutableMapping.register(BoundFields)
+
+
+cdef class LazyRows:
+    """
+    The rows of a lazy ``many=True`` serialization, sharing the to-many
+    relations fetched by :func:`_batch_many_related` on first use.
+    """
+
+    def __init__(self, SerializationPlan plan, list rows):
+        self.plan = plan
+        self.rows = rows
+        self.batched = None
+
+    cdef dict batch(self):
+        if self.batched is None:
+            self.batched = _batch_many_related(self.plan, self.rows)
+        return self.batched
+
+
+cdef class LazyData:
+    """
+    A read-only mapping over the serialized representation of an instance that
+    serializes each field the first time it is read and caches the result.
+    Iterating, comparing or rendering it serializes the remaining fields.
+
+    Returned by ``serializer.data`` when the serializer sets
+    ``Meta.lazy_data = True``.
+    """
+
+    def __init__(self, Serializer serializer, object instance, SerializationPlan plan, LazyRows rows=None):
+        self.serializer = serializer
+        self.instance = instance
+        self.plan = plan
+        self.rows = rows
+        self.cache = {}
+        self.materialized = None
+
+    cdef object value(self, FieldPlan entry):
+        """
+        Return the serialized value of `entry`, or `NO_DEFAULT` when the field
+        is skipped.
+        """
+        cdef dict batched = None
+        try:
+            return self.cache[entry.key]
+        except KeyError:
+            pass
+        if self.rows is not None and isinstance(entry.field, ManyRelatedField):
+            batched = self.rows.batch()
+        if _profiler is not None:
+            value = self.serializer._profile_field(entry, self.instance, batched)
+        else:
+            value = self.serializer._serialize_field(entry, self.instance, batched)
+        self.cache[entry.key] = value
+        return value
+
+    cpdef dict materialize(self):
+        """
+        Serialize the remaining fields and return the representation as a dict.
+        """
+        cdef dict ret
+        if self.materialized is None:
+            ret = {}
+            for key, entry in self.plan.by_key.items():
+                value = self.value(entry)
+                if value is not NO_DEFAULT:
+                    ret[key] = value
+            self.materialized = ret
+        return self.materialized
+
+    def __getitem__(self, key):
+        value = self.value(self.plan.by_key[key])
+        if value is NO_DEFAULT:
+            raise KeyError(key)
+        return value
+
+    def __iter__(self):
+        return iter(self.materialize())
+
+    def __len__(self):
+        return len(self.materialize())
+
+    def __contains__(self, key):
+        entry = self.plan.by_key.get(key)
+        return entry is not None and self.value(entry) is not NO_DEFAULT
+
+    def __eq__(self, other):
+        if isinstance(other, LazyData):
+            other = (<LazyData>other).materialize()
+        return self.materialize() == other
+
+    def __repr__(self):
+        return repr(self.materialize())
+
+    def __reduce__(self):
+        return (dict, (self.materialize(),))
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        return self.materialize().keys()
+
+    def values(self):
+        return self.materialize().values()
+
+    def items(self):
+        return self.materialize().items()
+
+    def copy(self):
+        return dict(self.materialize())
+
+
+Mapping.register(LazyData)
+
 
 cdef class BaseSerializer(Field):
     """
@@ -66,18 +952,22 @@ cdef class BaseSerializer(Field):
             'passed when instantiating the serializer instance.'
         )
         if not hasattr(self, '_validated_data'):
-            try:
-                self._validated_data = self.run_validation(self._data, self.context)
-            except ValidationError as exc:
-                self._validated_data = {}
-                self._errors = exc.detail
-            else:
-                self._errors = {}
+            self._validate(self.context)
 
         if self._errors and raise_exception:
             raise ValidationError(self.errors)
         return not bool(self._errors)
 
+    cdef int _validate(self, dict context) except -1:
+        try:
+            self._validated_data = self.run_validation(self._data, context)
+        except ValidationError as exc:
+            self._validated_data = {}
+            self._errors = exc.detail
+        else:
+            self._errors = {}
+        return 0
+
     def save(self, **kwargs):
         """
         Create or update a model instance.
@@ -90,6 +980,14 @@ cdef class BaseSerializer(Field):
             "inspect 'serializer.validated_data' instead. "
         )
 
+        if self.many:
+            validated_data = [{**attrs, **kwargs} for attrs in self.validated_data]
+            if self._instance is not None:
+                self._instance = self.bulk_update(self._instance, validated_data)
+            else:
+                self._instance = self.bulk_create(validated_data)
+            return self._instance
+
         validated_data = {**self.validated_data, **kwargs}
         if self._instance is not None:
             self._instance = self.update(self._instance, validated_data)
@@ -98,6 +996,104 @@ cdef class BaseSerializer(Field):
 
         return self._instance
 
+    async def asave(self, **kwargs):
+        """
+        Like :meth:`save`, for async views.
+
+        :param kwargs: Extra keyword arguments.
+        """
+        assert not self._initial_data, (
+            "You cannot call `.asave()` after accessing `serializer.data`."
+            "If you need to access data before committing to the database then "
+            "inspect 'serializer.validated_data' instead. "
+        )
+
+        if self.many:
+            validated_data = [{**attrs, **kwargs} for attrs in self.validated_data]
+            if self._instance is not None:
+                self._instance = await self.abulk_update(self._instance, validated_data)
+            else:
+                self._instance = await self.abulk_create(validated_data)
+            return self._instance
+
+        validated_data = {**self.validated_data, **kwargs}
+        if self._instance is not None:
+            self._instance = await self.aupdate(self._instance, validated_data)
+        else:
+            self._instance = await self.acreate(validated_data)
+
+        return self._instance
+
+    async def acreate(self, validated_data):
+        """
+        Create a model instance from an async view. Runs :meth:`create` in a
+        thread by default.
+
+        :param validated_data: A dictionary of validated data.
+        """
+        return await sync_to_async(self.create)(validated_data)
+
+    async def aupdate(self, instance, validated_data):
+        """
+        Update a model instance from an async view. Runs :meth:`update` in a
+        thread by default.
+
+        :param instance: Model instance to update.
+        :param validated_data: A dictionary of validated data.
+        """
+        return await sync_to_async(self.update)(instance, validated_data)
+
+    async def abulk_create(self, validated_data):
+        """
+        Like :meth:`bulk_create`, awaiting :meth:`acreate` for each item.
+
+        :param validated_data: A list of dictionaries of validated data.
+        """
+        instances = []
+        for attrs in validated_data:
+            instances.append(await self.acreate(attrs))
+        return instances
+
+    async def abulk_update(self, instances, validated_data):
+        """
+        Like :meth:`bulk_update`, awaiting :meth:`aupdate` for each instance.
+
+        :param instances: The instances to update.
+        :param validated_data: A list of dictionaries of validated data.
+        """
+        instances = await _alist(instances)
+        assert len(instances) == len(validated_data), (
+            'Expected one item per instance (%d), got %d.'
+            % (len(instances), len(validated_data))
+        )
+        results = []
+        for instance, attrs in zip(instances, validated_data):
+            results.append(await self.aupdate(instance, attrs))
+        return results
+
+    def bulk_create(self, validated_data):
+        """
+        Create an instance for each item of a ``many=True`` save.
+
+        :param validated_data: A list of dictionaries of validated data.
+        """
+        return [self.create(attrs) for attrs in validated_data]
+
+    def bulk_update(self, instances, validated_data):
+        """
+        Update the instances of a ``many=True`` save, pairing them with the
+        items of `validated_data` by position.
+
+        :param instances: The instances to update.
+        :param validated_data: A list of dictionaries of validated data.
+        """
+        instances = list(instances)
+        assert len(instances) == len(validated_data), (
+            'Expected one item per instance (%d), got %d.'
+            % (len(instances), len(validated_data))
+        )
+        return [self.update(instance, attrs) for instance, attrs in zip(instances, validated_data)]
+
     @property
     def errors(self):
         """
@@ -137,7 +1133,8 @@ cdef class BaseSerializer(Field):
         """
         Return the serialized data on the serializer.
         """
-        if not self._initial_data :
+        data = self._initial_data
+        if data is None or (type(data) is not LazyData and not data):
             if self._instance is not None and not getattr(self, '_errors', None):
                 self._initial_data = self.serialize(self._instance, self.context)
             elif hasattr(self, '_validated_data') and not getattr(self, '_errors', None):
@@ -178,227 +1175,753 @@ cdef class Serializer(BaseSerializer):
         """
         return deepcopy(self._fields)
 
-    def fields(self):
+    async def ais_valid(self, bint raise_exception=False):
         """
-        This is a shortcut for accessing the dict on the *fields* attribute.
+        Like :meth:`is_valid`, for async views: the objects referenced by the
+        related fields of the serializer are fetched with ``ain_bulk()``
+        before validating.
+
+        Related fields of nested serializers and ``validate*()`` methods run
+        synchronously and must not query the database.
+
+        :param raise_exception: Whether to raise an exception if the data is invalid.
         """
-        cdef str key
-        cdef Field value
-        cdef dict fields = {}
-        for key, value in self.get_fields().items():
-            fields[key] = value
-            fields[key].bind(key, self)
-        return fields
+        assert hasattr(self, '_data'), (
+            'Cannot call `.ais_valid()` as no `data=` keyword argument was '
+            'passed when instantiating the serializer instance.'
+        )
+        if not hasattr(self, '_validated_data'):
+            rows = self._data if self.many else [self._data]
+            context = await aresolve_related_objects(
+                self._base_field_set().validation_plan().fields, rows, self.context,
+            )
+            self._validate(context)
 
-    from forbiddenfruit import curse as _curse
-    _curse(Serializer, 'fields', cached_property(fields))
-    Serializer.fields.__set_name__(Serializer, 'fields')
+        if self._errors and raise_exception:
+            raise ValidationError(self.errors)
+        return not bool(self._errors)
+
+    @property
+    def data(self):
+        """
+        Return the serialized data on the serializer, as :class:`LazyData`
+        when ``Meta.lazy_data`` is set.
+        """
+        if (
+            self._initial_data is None
+            and getattr(getattr(self, 'Meta', None), 'lazy_data', False)
+            and not getattr(self, '_errors', None)
+        ):
+            if self._instance is not None:
+                self._initial_data = self.serialize_lazy(self._instance)
+            elif hasattr(self, '_validated_data'):
+                self._initial_data = self.serialize_lazy(self._validated_data)
+        return BaseSerializer.data.__get__(self, type(self))
+
+    @property
+    def fields(self):
+        """
+        A copy-on-write view of the bound fields of this serializer.
+        """
+        if self._fields_view is None:
+            self._fields_view = BoundFields(self._base_field_set(), self)
+        return self._fields_view
 
     @property
     def _writable_fields(self):
         """
         Return a list of all writable fields.
         """
-        cdef str k
-        cdef Field v
-        return {k: v for k, v in self.fields.items() if not v.read_only}
+        return self._base_field_set().writable()
 
     @property
     def _readable_fields(self):
         """
         Return a list of all readable fields.
         """
-        cdef str k
-        cdef Field v
-        return {k: v for k, v in self.fields.items() if not v.write_only}
+        return self._base_field_set().readable()
 
-    @property
-    def _only_fields(self):
+    cdef FieldSet _class_field_set(self):
         """
-        Return a list of all fields that have been specified in the `only` option.
+        Return the shared field table of the serializer class, binding it on first use.
+        """
+        cdef str name
+        cdef Field field
+        cdef FieldSet field_set
+        cls = self.__class__
+        field_set = cls.__dict__.get('_field_set')
+        if field_set is None:
+            prototype = cls.__new__(cls)
+            fields = {}
+            for name, field in getattr(cls, '_fields', {}).items():
+                field = copy.copy(field)
+                field.bind(name, prototype)
+                fields[name] = field
+            field_set = FieldSet(fields, cls)
+            # Fields defined outside drf_turbo may read `self.root`, e.g. its
+            # context or instance, which would be the prototype.
+            field_set.instance_bound = any(
+                not isinstance(field, Serializer) and not type(field).__module__.startswith('drf_turbo.')
+                for field in fields.values()
+            )
+            try:
+                setattr(cls, '_field_set', field_set)
+            except TypeError:
+                pass
+        return field_set
+
+    cdef FieldSet _base_field_set(self):
         """
-        only = self.only or self.context.get('request').GET.get('only').split(',')
-        is_nested = any('__' in field for field in only)
-        if is_nested :
-            fields = self._parse_nested_fields(only)
-            self._select_nested_fields(self, fields, action='include')
+        Return the field table of this instance before any `only` / `exclude` selection.
+        """
+        cdef str name
+        cdef Field field
+        cdef dict fields
+        if self._fields_view is not None:
+            return self._fields_view.current()
+        if (
+            self.partial
+            or getattr(type(self), 'get_fields') is not getattr(Serializer, 'get_fields')
+            or self._class_field_set().instance_bound
+        ):
+            # Instance-specific tables: bound to this instance so that fields
+            # see its `partial` flag, context and instance, or built from an
+            # overridden `get_fields()`.
+            fields = {}
+            for name, field in self.get_fields().items():
+                if self.partial:
+                    field = copy.copy(field)
+                field.bind(name, self)
+                fields[name] = field
+            self._fields_view = BoundFields(FieldSet(fields, self.__class__), self)
+            return self._fields_view.current()
+        return self._class_field_set()
+
+    cdef FieldSet _selected_field_set(self):
+        """
+        Return the field table after applying the `only` / `exclude` selection.
+        """
+        cdef FieldSet base = self._base_field_set()
+        request_only = request_exclude = None
+        if self.context:
+            try:
+                query_params = self.context['request'].GET
+            except (KeyError, AttributeError):
+                pass
+            else:
+                request_only = query_params.get('only')
+                request_exclude = query_params.get('exclude')
+        only = exclude = None
+        if self.only or request_only is not None:
+            only = tuple(self.only or request_only.split(','))
+        elif self.exclude or request_exclude is not None:
+            exclude = tuple(self.exclude or request_exclude.split(','))
         else:
-            self._fields_to_include(self, only)
-        return self.fields
+            return base
+        if (
+            self._selected is not None
+            and self._selected_base is base
+            and self._selected_only == only
+            and self._selected_exclude == exclude
+        ):
+            return self._selected
+
+        if base is self._class_field_set():
+            key = (self.__class__, only, exclude)
+            selected = _projections.get(key)
+            if selected is None:
+                selected = base.select(only, exclude)
+                _projections.set(key, selected)
+        else:
+            selected = base.select(only, exclude)
+        self._selected = selected
+        self._selected_base = base
+        self._selected_only = only
+        self._selected_exclude = exclude
+        return selected
+
+    cdef Serializer _select_copy(self, dict tree, bint keep):
+        """
+        Return a copy of this nested serializer restricted to a selection tree.
+        """
+        cdef Serializer clone = copy.copy(self)
+        cdef FieldSet base = self._base_field_set()
+        clone._fields_view = BoundFields(
+            FieldSet(_project_fields(base.fields, tree, keep), base.serializer_class),
+            clone,
+        )
+        clone._selected = None
+        clone._selected_base = None
+        return clone
 
-    @property
-    def _exclude_fields(self):
+    cdef Serializer _bound_copy(self, object name, object root):
+        """
+        Return a copy of this nested serializer bound to `root`, with its own field view.
+        """
+        cdef Serializer clone = copy.copy(self)
+        clone.bind(name, root)
+        clone._fields_view = None
+        if self._fields_view is not None:
+            clone._fields_view = BoundFields(self._fields_view.current(), clone)
+        clone._selected = None
+        clone._selected_base = None
+        return clone
+
+    cdef inline object _resolve(self, FieldPlan entry, object instance):
+        """
+        Return the value of a planned field before `field.serialize`, or
+        `NO_DEFAULT` when the field should be skipped.
+        """
+        try:
+            if entry.kind == ACCESS_ATTR:
+                try:
+                    if isinstance(instance, dict):
+                        result = instance[entry.attr]
+                    else:
+                        result = getattr(instance, entry.attr)
+                except ObjectDoesNotExist:
+                    result = None
+                except (KeyError, AttributeError):
+                    result = entry.field.get_attribute(instance)
+            elif entry.kind == ACCESS_FK:
+                result = entry.field.get_attribute(instance, entry.attrs)
+            else:
+                result = entry.field.get_attribute(instance)
+        except SkipField:
+            return NO_DEFAULT
+
+        if entry.probe_manager and hasattr(result, 'all'):
+            result = result.all()
+        if entry.call and result is not None:
+            result = result()
+        return result
+
+    cdef tuple _cache_key(self, SerializationPlan plan):
+        """
+        Return the result cache key of `plan`: the serializer class and the
+        selected fields, including those of nested serializers.
         """
-        Return a list of all fields that have been specified in the `exclude` option.
+        cdef FieldPlan entry
+        if plan.cache_key is None:
+            plan.cache_key = (plan.serializer_path, tuple([
+                (entry.key, (<Serializer>entry.field)._cache_key((<Serializer>entry.field)._selected_field_set().plan())
+                 if isinstance(entry.field, Serializer) else None)
+                for entry in plan.entries
+            ]))
+        return plan.cache_key
+
+    cdef void _connect_cache(self, SerializationPlan plan, object model) except *:
         """
-        exclude = self.exclude or self.context.get('request').GET.get('exclude').split(',')
-        is_nested = any('__' in field for field in exclude)
-        if is_nested:
-            fields = self._parse_nested_fields(exclude)
-            self._select_nested_fields(self, fields, action='exclude', is_nested=True)
+        Have the result cache of `plan` drop the entries of `model` instances
+        when the related rows they are serialized from change.
+        """
+        cdef list related = []
+        cdef list through = []
+        _cache_relations(self, model, '', related, through)
+        plan.result_cache.connect_relations(model, related, through)
+        plan.cache_connected = True
+
+    cdef inline dict _serialize(self, object instance, SerializationPlan plan, dict batched=None):
+        cdef dict ret = {}
+        cdef dict context = self.context
+        cdef FieldPlan entry
+        cdef Py_ssize_t i
+        cdef tuple cache_key = None
+        if plan.result_cache is not None and isinstance(instance, Model) and instance.pk is not None:
+            cache_key = self._cache_key(plan)
+            if not plan.cache_connected:
+                self._connect_cache(plan, type(instance))
+            cached = plan.result_cache.get(cache_key, instance)
+            if cached is not None:
+                return dict(cached)
+        if _profiler is not None:
+            ret = self._serialize_profiled(instance, plan, batched)
         else:
-            self._fields_to_exclude(self, exclude, is_nested=False)
+            for i in range(plan.size):
+                entry = <FieldPlan>PyTuple_GET_ITEM(plan.entries, i)
+                if entry.kind == ACCESS_METHOD:
+                    ret[entry.key] = entry.method(self, instance)
+                    continue
+                if batched and entry in batched:
+                    ret[entry.key] = (<dict>batched[entry])[instance.pk]
+                    continue
+                result = self._resolve(entry, instance)
+                if result is NO_DEFAULT:
+                    continue
+                if result is not None:
+                    result = entry.field.serialize(result, context)
+                ret[entry.key] = result
 
-        return self.fields
+        if cache_key is not None:
+            plan.result_cache.set(cache_key, instance, dict(ret))
+        return ret
 
-    cdef inline dict _parse_nested_fields(self, object fields):
+    cdef object _serialize_field(self, FieldPlan entry, object instance, dict batched):
         """
-        Parse nested fields
+        Return the serialized value of a single planned field, or `NO_DEFAULT`
+        when the field should be skipped.
+        """
+        if entry.kind == ACCESS_METHOD:
+            return entry.method(self, instance)
+        if batched and entry in batched:
+            return (<dict>batched[entry])[instance.pk]
+        result = self._resolve(entry, instance)
+        if result is NO_DEFAULT or result is None:
+            return result
+        return entry.field.serialize(result, self.context)
+
+    cdef object _profile_field(self, FieldPlan entry, object instance, dict batched):
+        """
+        `_serialize_field` recording its time, queries and errors to the
+        active profiler.
+        """
+        cdef object profiler = _profiler
+        cdef Py_ssize_t queries = profiler.queries
+        cdef Py_ssize_t charged = _charged
+        start = perf_counter()
+        try:
+            result = self._serialize_field(entry, instance, batched)
+        except BaseException:
+            profiler.record(
+                type(self), entry.key, 'serialize', perf_counter() - start,
+                _own_queries(profiler, queries, charged), 1,
+            )
+            raise
+        profiler.record(
+            type(self), entry.key, 'serialize', perf_counter() - start, _own_queries(profiler, queries, charged),
+        )
+        return result
 
-        :param fields: A list of fields to parse.
+    cdef dict _serialize_profiled(self, object instance, SerializationPlan plan, dict batched):
+        cdef dict ret = {}
+        cdef FieldPlan entry
+        for entry in plan.entries:
+            result = self._profile_field(entry, instance, batched)
+            if result is not NO_DEFAULT:
+                ret[entry.key] = result
+        return ret
+
+    cpdef serialize_lazy(self, object instance):
         """
-        cdef dict field_object = {"fields": []}
-        cdef str f
-        for f in fields:
-            obj = field_object
-            nested_fields = f.split("__")
-            for v in nested_fields:
-                if v not in obj["fields"]:
-                    obj["fields"].append(v)
-                if nested_fields.index(v) < len(nested_fields) - 1:
-                    obj[v] = obj.get(v, {"fields": []})
-                    obj = obj[v]
-        return field_object
+        Serialize `instance` into a :class:`LazyData` mapping, or a list of
+        them with ``many=True``, whose fields are serialized when first read.
 
-    cdef inline void _select_nested_fields(
-        self,
-        Serializer serializer,
-        object fields,
-        basestring action,
-        bint is_nested=False
-    ):
-        for k in fields:
-            if k == "fields":
-                if action == 'include' :
-                    self._fields_to_include(serializer, fields[k])
-                elif action == 'exclude':
-                    self._fields_to_exclude(serializer, fields[k], is_nested)
+        :param instance: The instance, or instances, to serialize.
+        """
+        cdef SerializationPlan plan = self._selected_field_set().plan()
+        cdef LazyRows rows
+        if not self.many:
+            return LazyData(self, instance, plan)
+        instance = list(instance)
+        rows = LazyRows(plan, instance) if plan.many_related else None
+        return [LazyData(self, o, plan, rows) for o in instance]
+
+    async def aserialize(self, object instance):
+        """
+        Serialize `instance` from an async view. Unevaluated querysets are
+        optimized with :meth:`optimize_queryset` and iterated asynchronously,
+        and the related objects and to-many pk lists the fields read are
+        fetched before serializing, so that no field queries the database.
 
-            else:
-                self._select_nested_fields(serializer.fields[k], fields[k], action=action, is_nested=is_nested)
+        ``MethodField`` methods run synchronously and must not query the
+        database.
 
-    cdef inline object _fields_to_include(self, Serializer serializer, object fields):
+        :param instance: The instance, or instances, to serialize.
         """
-        Include fields.
+        plan = self._selected_field_set().plan()
+        rows = [instance]
+        if self.many:
+            optimized = _is_queryset(instance)
+            if optimized:
+                instance = _optimize_queryset(self, instance, None)
+            rows = await _alist(instance)
+            if not optimized:
+                await _aprefetch(self, rows)
+        else:
+            await _aprefetch(self, rows)
+        batched = await _abatch_many_related(plan, rows) if plan.many_related else None
+        if self.many:
+            return [self._serialize(o, plan, batched) for o in rows]
+        return self._serialize(instance, plan, batched)
 
-        :param serializer: The serializer to include fields on.
-        :param fields: A list of fields to include.
+    async def adata(self):
         """
-        allowed = set(fields)
-        existing = set(serializer.fields.keys())
-        for field_name in existing - allowed:
-            if field_name in serializer.fields :
-                serializer.fields.pop(field_name)
-        return serializer.fields
+        Return the serialized data on the serializer, like :attr:`data`, from an
+        async view. See :meth:`aserialize`.
+        """
+        if self._initial_data is None and self._instance is not None and not getattr(self, '_errors', None):
+            self._initial_data = await self.aserialize(self._instance)
+            return self._initial_data
+        return await sync_to_async(getattr)(self, 'data')
 
-    cdef inline object _fields_to_exclude(self, Serializer serializer, object fields, bint is_nested):
+    cpdef serialize(self, object instance, dict context):
         """
-        Exclude fields.
+        Serialize a model instance.
 
-        :param serializer: The serializer to exclude fields on.
-        :param fields: A list of fields to exclude.
-        :param is_nested: Whether the fields are nested.
+        :param instance: Model instance to serialize.
+        :param context: Context data.
         """
-        excluded = set(fields)
-        existing = set(serializer.fields.keys())
-        for field_name in excluded :
-            if is_nested :
-                if field_name in existing :
-                    if field_name in self.fields.keys() :
-                        if not issubclass(self.fields[field_name].__class__, Serializer):
-                            serializer.fields.pop(field_name)
-                    else:
-                        serializer.fields.pop(field_name)
-            else:
-                if field_name in serializer.fields:
-                    serializer.fields.pop(field_name)
-        return serializer.fields
+        cdef FieldSet field_set = self._selected_field_set()
+        cdef object profiler = _profiler
+        cdef list ret
+        if self.many :
+            if profiler is not None:
+                mark = profiler.begin_list()
+                ret = self._serialize_list(instance, field_set)
+                profiler.end_list(self, mark, len(ret))
+                return ret
+            return self._serialize_list(instance, field_set)
+        return self._serialize(instance, field_set.plan())
+
+    cdef list _serialize_list(self, object instance, FieldSet field_set):
+        cdef ValuesPlan values_plan
+        if _is_queryset(instance) and getattr(getattr(self, 'Meta', None), 'use_values_list', False):
+            values_plan = field_set.values_plan(instance.model)
+            if values_plan is not None:
+                return self._serialize_values(instance, values_plan)
+        return self._serialize_many(instance, field_set.plan())
+
+    cdef list _serialize_many(self, object instance, SerializationPlan plan):
+        cdef dict batched
+        if plan.many_related:
+            instance = list(instance)
+            batched = _batch_many_related(plan, instance)
+            return [self._serialize(o, plan, batched) for o in instance]
+        return [self._serialize(o, plan) for o in instance]
+
+    cdef list _serialize_values(self, object queryset, ValuesPlan plan):
+        cdef list ret = []
+        cdef dict row
+        cdef dict context = self.context
+        cdef FieldPlan entry
+        cdef Py_ssize_t i
+        cdef object profiler = _profiler
+        for values in queryset.values_list(*plan.columns):
+            row = {}
+            for i in range(plan.size):
+                entry = <FieldPlan>PyTuple_GET_ITEM(plan.entries, i)
+                value = <object>PyTuple_GET_ITEM(values, i)
+                if profiler is not None:
+                    start = perf_counter()
+                if value is not None:
+                    value = entry.field.serialize(value, context)
+                if profiler is not None:
+                    profiler.record(type(self), entry.key, 'serialize', perf_counter() - start)
+                row[entry.key] = value
+            ret.append(row)
+        return ret
 
-    cdef inline dict _serialize(self, object instance, dict fields):
+    cpdef list serialize_values(self, object queryset):
+        """
+        Serialize the rows of `queryset` from `values_list()` tuples, without
+        instantiating model instances. Falls back to serializing instances when
+        a field needs one, e.g. a method field or a nested serializer.
 
-        cdef str name
-        cdef Field field
-        cdef dict ret = {}
-        cdef bint is_dict
-        for name, field in fields.items():
-            attr = field.attr if field.attr and '.' not in field.attr else name
-            if field.is_method_field:
-                result = field.method_getter(attr, self.__class__)(self, instance)
-            else:
-                try:
-                    if isinstance(field, RelatedField):
-                        result = field.get_attribute(instance, [attr + '_id'])
-                    else:
-                        result = field.get_attribute(instance)
-                        if hasattr(result, 'all'):
-                            result = result.all()
+        Setting ``Meta.use_values_list = True`` makes ``many=True`` serializers
+        use this for unevaluated querysets.
 
-                except SkipField :
+        :param queryset: The queryset to serialize.
+        """
+        cdef FieldSet field_set = self._selected_field_set()
+        cdef ValuesPlan values_plan = field_set.values_plan(queryset.model)
+        if values_plan is None:
+            return self._serialize_many(queryset, field_set.plan())
+        return self._serialize_values(queryset, values_plan)
+
+    cdef int _write_object(
+        self, JSONWriter writer, object instance, SerializationPlan plan, dict batched=None
+    ) except -1:
+        cdef dict context = self.context
+        cdef FieldPlan entry
+        cdef Py_ssize_t i
+        cdef bint first = True
+        if plan.result_cache is not None or _profiler is not None:
+            return writer.write_value(self._serialize(instance, plan, batched))
+        writer.write_char(b'{')
+        for i in range(plan.size):
+            entry = <FieldPlan>PyTuple_GET_ITEM(plan.entries, i)
+            if entry.kind == ACCESS_METHOD:
+                result = entry.method(self, instance)
+            elif batched and entry in batched:
+                result = (<dict>batched[entry])[instance.pk]
+            else:
+                result = self._resolve(entry, instance)
+                if result is NO_DEFAULT:
                     continue
+            if not first:
+                writer.write_char(b',')
+            first = False
+            writer.write(entry.json_key, len(entry.json_key))
+            if result is None or entry.kind == ACCESS_METHOD or (batched and entry in batched):
+                writer.write_value(result)
+            elif entry.encoding == ENCODE_STR:
+                writer.write_str(result if type(result) is str else str(result))
+            elif entry.encoding == ENCODE_INT:
+                writer.write_int(result if type(result) is int else int(result))
+            elif entry.encoding == ENCODE_FLOAT:
+                writer.write_float(result if type(result) is float else float(result))
+            elif entry.encoding == ENCODE_NESTED:
+                (<Serializer>entry.field)._write_json(writer, result)
+            elif entry.encoding == ENCODE_CHOICE:
+                raw = (<ChoiceField>entry.field).json_output(result)
+                if raw is None:
+                    writer.write_value(entry.field.serialize(result, context))
+                else:
+                    writer.write(raw, len(raw))
+            else:
+                writer.write_value(entry.field.serialize(result, context))
+        writer.write_char(b'}')
+        return 0
+
+    cdef int _write_json(self, JSONWriter writer, object instance) except -1:
+        cdef SerializationPlan plan = self._selected_field_set().plan()
+        cdef dict batched = None
+        cdef Py_ssize_t rows = 0
+        cdef object profiler = _profiler
+        if not self.many:
+            return self._write_object(writer, instance, plan)
+        if profiler is not None:
+            mark = profiler.begin_list()
+        if plan.many_related:
+            instance = list(instance)
+            batched = _batch_many_related(plan, instance)
+        writer.write_char(b'[')
+        for o in instance:
+            if rows:
+                writer.write_char(b',')
+            rows += 1
+            self._write_object(writer, o, plan, batched)
+        writer.write_char(b']')
+        if profiler is not None:
+            profiler.end_list(self, mark, rows)
+        return 0
+
+    cpdef serialize_json(self, object instance, dict context):
+        """
+        Serialize a model instance straight to UTF-8 JSON bytes, without
+        building the intermediate dicts. The output is the same as rendering
+        :meth:`serialize` with DRF's `JSONRenderer`.
 
-                if result is not None:
-                    if field.call:
-                        result = result()
-                    result = field.serialize(result, self.context)
-            ret[attr] = result
+        :param instance: Model instance to serialize.
+        :param context: Context data.
+        """
+        cdef JSONWriter writer = JSONWriter()
+        self._write_json(writer, instance)
+        return writer.getvalue()
 
-        return ret
+    def iter_serialize(self, instance=None, int chunk_size=2000):
+        """
+        Serialize objects one at a time. Querysets are read with
+        ``.iterator(chunk_size)`` so rows are never all held in memory, and
+        the pks of to-many relations are fetched with one query per chunk.
 
-    cpdef serialize(self, object instance, dict context):
+        :param instance: The objects to serialize, defaults to the serializer instance.
+        :param chunk_size: Number of rows fetched from the database at a time.
         """
-        Serialize a model instance.
+        cdef SerializationPlan plan = self._selected_field_set().plan()
+        cdef dict batched = None
+        if instance is None:
+            instance = self._instance
+        if not self.many:
+            yield self._serialize(instance, plan)
+            return
+        for chunk in _iter_chunks(instance, chunk_size):
+            if plan.many_related:
+                batched = _batch_many_related(plan, chunk)
+            for o in chunk:
+                yield self._serialize(o, plan, batched)
+
+    def stream_json(self, instance=None, int chunk_size=2000):
+        """
+        Serialize objects to JSON, yielding one UTF-8 chunk of bytes per
+        ``chunk_size`` rows. The chunks together form a single JSON array,
+        so the generator can be passed to `StreamingHttpResponse`.
 
-        :param instance: Model instance to serialize.
-        :param context: Context data.
+        :param instance: The objects to serialize, defaults to the serializer instance.
+        :param chunk_size: Number of rows per chunk.
         """
-        try:
-            only = self.context.get('request').GET.get('only')
-        except Exception:
-            only = None
-        try:
-            exclude = self.context.get('request').GET.get('exclude')
-        except Exception:
-            exclude = None
-        if self.only or only is not None :
-            fields = self._only_fields
-        elif self.exclude or exclude is not None:
-            fields = self._exclude_fields
-        fields = self._readable_fields
-        if self.many :
-            return [self._serialize(o, fields) for o in instance]
-        return self._serialize(instance, fields)
+        cdef SerializationPlan plan = self._selected_field_set().plan()
+        cdef JSONWriter writer = JSONWriter()
+        cdef dict batched = None
+        cdef Py_ssize_t count = 0
+        if instance is None:
+            instance = self._instance
+        if not self.many:
+            self._write_object(writer, instance, plan)
+            yield writer.getvalue()
+            return
+        writer.write_char(b'[')
+        for chunk in _iter_chunks(instance, chunk_size):
+            if plan.many_related:
+                batched = _batch_many_related(plan, chunk)
+            for o in chunk:
+                if count:
+                    writer.write_char(b',')
+                self._write_object(writer, o, plan, batched)
+                count += 1
+            if len(chunk) == chunk_size:
+                yield writer.getvalue()
+                writer = JSONWriter()
+        writer.write_char(b']')
+        yield writer.getvalue()
+
+    @property
+    def json_bytes(self):
+        """
+        Return the serialized data on the serializer as JSON bytes.
+        """
+        if self._instance is not None and not getattr(self, '_errors', None):
+            return self.serialize_json(self._instance, self.context)
+        return encode_json(getattr(self, 'data'))
 
-    cdef inline dict _deserialize(self, object data, dict fields):
+    @classmethod
+    def optimize_queryset(cls, queryset, only=None, exclude=None, dict context=None):
+        """
+        Return `queryset` with the `select_related`, `prefetch_related` and
+        `only()` calls needed to serialize it without extra queries.
+
+        :param queryset: The queryset to optimize.
+        :param only: Fields that will be included in the serialized data.
+        :param exclude: Fields that will be excluded from the serialized data.
+        :param context: The serializer context; ``?only=`` / ``?exclude=`` of its request are honored.
+        """
+        return _optimize_queryset(cls(only=only, exclude=exclude, context=context), queryset, None)
+
+    cdef inline dict _deserialize(self, object data, ValidationPlan plan, dict context):
         if not isinstance(data, Mapping):
             raise ValidationError(
                 'Invalid data type: %s' % type(data).__name__
             )
         cdef dict ret = {}
         cdef dict errors = {}
-        cdef str name
-        cdef str attr
-        for name, field in fields.items():
-            attr = field.attr if field.attr and '.' not in field.attr else name
-            validate_method = getattr(self, 'validate_' + attr, None)
-            value = data.get(name, NO_DEFAULT)
+        cdef ValidationEntry entry
+        cdef Field field
+        cdef object profiler = _profiler
+        cdef bint failed
+        for entry in plan.entries:
+            field = entry.field
+            value = data.get(entry.name, NO_DEFAULT)
+            if profiler is not None:
+                queries = profiler.queries
+                charged = _charged
+                start = perf_counter()
+            failed = False
             try:
-                validated_value = field.run_validation(value, self.context)
-                if validate_method is not None:
-                    validated_value = validate_method(validated_value)
+                if entry.direct and value is not NO_DEFAULT and value is not None:
+                    validated_value = field.deserialize(value, context)
+                    if field.validators:
+                        field.validate_or_raise(validated_value)
+                else:
+                    validated_value = field.run_validation(value, context)
+                if entry.hook is not None:
+                    validated_value = getattr(self, entry.hook)(validated_value)
 
             except ValidationError as exc:
-                errors[name] = exc.detail
+                errors[entry.name] = exc.detail
+                failed = True
             except DjangoValidationError as exc:
-                errors[name] = get_error_detail(exc)
+                errors[entry.name] = get_error_detail(exc)
+                failed = True
             except SkipField:
-                continue
+                pass
             else:
-                ret[attr] = validated_value
+                ret[entry.attr] = validated_value
+            if profiler is not None:
+                profiler.record(
+                    type(self), entry.name, 'deserialize', perf_counter() - start,
+                    _own_queries(profiler, queries, charged), failed,
+                )
+            if failed and plan.max_errors and len(errors) >= plan.max_errors:
+                break
 
         if errors:
             raise ValidationError(errors)
         return ret
 
+    cdef list _deserialize_many(self, object data, ValidationPlan plan, dict context):
+        """
+        Deserialize a list of rows column by column.
+
+        Each field validates the values of all rows in one `run_validation_many`
+        call; errors are keyed by the index of the failing row. With
+        ``Meta.max_errors``, rows are validated in blocks of
+        `MAX_ERRORS_BLOCK` and validation stops after the block in which
+        that many rows failed.
+        """
+        cdef list rows = data if type(data) is list else list(data)
+        cdef list positions = []
+        cdef list ret
+        cdef list column
+        cdef list results
+        cdef dict failed
+        cdef dict errors = {}
+        cdef Py_ssize_t i, j
+        cdef ValidationEntry entry
+        cdef str name
+        cdef list block
+        cdef Py_ssize_t start, size
+        cdef object profiler = _profiler
+        cdef Py_ssize_t failures
+        for i in range(len(rows)):
+            if isinstance(rows[i], Mapping):
+                positions.append(i)
+            else:
+                errors[i] = ValidationError(
+                    'Invalid data type: %s' % type(rows[i]).__name__
+                ).detail
+
+        ret = [{} for _ in positions]
+        size = len(positions) or 1
+        if plan.max_errors:
+            size = MAX_ERRORS_BLOCK
+        for start in range(0, len(positions), size):
+            if plan.max_errors and len(errors) >= plan.max_errors:
+                break
+            block = positions[start:start + size]
+            for entry in plan.entries:
+                name = entry.name
+                validate_method = getattr(self, entry.hook) if entry.hook is not None else None
+                column = [rows[i].get(name, NO_DEFAULT) for i in block]
+                if profiler is not None:
+                    queries = profiler.queries
+                    charged = _charged
+                    timer = perf_counter()
+                failures = 0
+                (results, failed) = entry.field.run_validation_many(column, context)
+                for j in range(len(block)):
+                    if failed and j in failed:
+                        errors.setdefault(block[j], {})[name] = failed[j]
+                        failures += 1
+                        continue
+                    value = results[j]
+                    if value is NO_DEFAULT:
+                        continue
+                    if validate_method is not None:
+                        try:
+                            value = validate_method(value)
+                        except ValidationError as exc:
+                            errors.setdefault(block[j], {})[name] = exc.detail
+                            failures += 1
+                            continue
+                        except DjangoValidationError as exc:
+                            errors.setdefault(block[j], {})[name] = get_error_detail(exc)
+                            failures += 1
+                            continue
+                        except SkipField:
+                            continue
+                    (<dict>ret[start + j])[entry.attr] = value
+                if profiler is not None:
+                    profiler.record(
+                        type(self), name, 'deserialize', perf_counter() - timer,
+                        _own_queries(profiler, queries, charged), failures, len(block),
+                    )
+
+        if errors:
+            if plan.max_errors:
+                raise ValidationError({i: errors[i] for i in sorted(errors)[:plan.max_errors]})
+            raise ValidationError({i: errors[i] for i in sorted(errors)})
+        return ret
+
     cpdef deserialize(self, object data, dict context):
         """
         Given a dictionary-like structure, build a dictionary of deserialized
@@ -407,10 +1930,12 @@ cdef class Serializer(BaseSerializer):
         :param data: The data to deserialize.
         :param context: The context for the request.
         """
-        fields = self._writable_fields
+        cdef ValidationPlan plan = self._base_field_set().validation_plan()
         if self.many :
-            return [self._deserialize(o, fields) for o in data]
-        return self._deserialize(data, fields)
+            # Related objects of all rows are fetched up front, one query per field.
+            context = resolve_related_objects(plan.fields, data, context)
+            return self._deserialize_many(data, plan, context)
+        return self._deserialize(data, plan, context)
 
     cpdef run_validation(self, object data, dict context):
         """
@@ -431,6 +1956,33 @@ cdef class Serializer(BaseSerializer):
         return data
 
 
+cdef object _model_type_error(object model, object serializer_class, str method):
+    """
+    Explain a `TypeError` raised while creating model instances from validated data.
+    """
+    tb = traceback.format_exc()
+    msg = (
+        'Got a `TypeError` when calling `%s.%s.%s()`. '
+        'This may be because you have a writable field on the '
+        'serializer class that is not a valid argument to '
+        '`%s.%s.%s()`. You may need to make the field '
+        'read-only, or override the %s.%s() method to handle '
+        'this correctly.\nOriginal exception was:\n %s' %
+        (
+            model.__name__,
+            model._default_manager.name,
+            method,
+            model.__name__,
+            model._default_manager.name,
+            method,
+            serializer_class.__name__,
+            method,
+            tb
+        )
+    )
+    return TypeError(msg)
+
+
 cdef class ModelSerializer(Serializer):
 
     def __getmetaclass__(_):
@@ -454,24 +2006,7 @@ cdef class ModelSerializer(Serializer):
         try:
             instance = model._default_manager.create(**validated_data)
         except TypeError:
-            tb = traceback.format_exc()
-            msg = (
-                'Got a `TypeError` when calling `%s.%s.create()`. '
-                'This may be because you have a writable field on the '
-                'serializer class that is not a valid argument to '
-                '`%s.%s.create()`. You may need to make the field '
-                'read-only, or override the %s.create() method to handle '
-                'this correctly.\nOriginal exception was:\n %s' %
-                (
-                    model.__name__,
-                    model._default_manager.name,
-                    model.__name__,
-                    model._default_manager.name,
-                    self.__class__.__name__,
-                    tb
-                )
-            )
-            raise TypeError(msg)
+            raise _model_type_error(model, type(self), 'create')
         # Save many-to-many relationships after the instance is created.
         if m2m_fields:
             for field_name, value in m2m_fields.items():
@@ -502,3 +2037,324 @@ cdef class ModelSerializer(Serializer):
             field.set(value)
 
         return instance
+
+    cpdef bulk_create(self, validated_data):
+        """
+        Create model instances for a ``many=True`` save, and return them in
+        input order. Calls :meth:`create` for each item, unless
+        ``Meta.bulk_save = True``.
+
+        With ``Meta.bulk_save``, the instances are created with `bulk_create`
+        and the many-to-many through-table rows are batched. Like
+        `bulk_create`, this does not call `save()` or send model signals. The
+        batch size can be set with ``Meta.batch_size``. Overriding `create`
+        or saving a multi-table inherited model disables the bulk path. On
+        databases where `bulk_create` does not set primary keys, instances
+        with many-to-many values are saved one by one instead.
+
+        :param validated_data: A list of dictionaries of validated data.
+        """
+        if not _bulk_creates(self):
+            return [self.create(attrs) for attrs in validated_data]
+        model = self.Meta.model
+        batch_size = getattr(self.Meta, 'batch_size', None)
+        instances, m2m_values = self._build_instances(validated_data)
+        if any(m2m_values) and not _bulk_insert_returns_pks(model):
+            for instance in instances:
+                instance.save()
+        else:
+            instances = model._default_manager.bulk_create(instances, batch_size=batch_size)
+            _invalidate_rows(model, instances)
+        _set_many_to_many(model, instances, m2m_values, batch_size)
+        return instances
+
+    cdef tuple _build_instances(self, validated_data):
+        """
+        Return the unsaved instances of a bulk create, and the many-to-many
+        values of each.
+        """
+        model = self.Meta.model
+        m2m_names = _many_to_many_names(model)
+        instances = []
+        m2m_values = []
+        for attrs in validated_data:
+            attrs = dict(attrs)
+            m2m_values.append({name: attrs.pop(name) for name in m2m_names if name in attrs})
+            try:
+                instances.append(model(**attrs))
+            except TypeError:
+                raise _model_type_error(model, type(self), 'bulk_create')
+        return instances, m2m_values
+
+    cpdef bulk_update(self, instances, validated_data):
+        """
+        Update the instances of a ``many=True`` save, pairing them with the
+        items of `validated_data` by position. Calls :meth:`update` for each
+        instance, unless ``Meta.bulk_save = True``.
+
+        With ``Meta.bulk_save``, the instances are updated with `bulk_update`
+        and related sets are replaced with one delete and batched inserts per
+        many-to-many field. Like `bulk_update`, this does not call `save()` or
+        send model signals. The batch size can be set with
+        ``Meta.batch_size``. Overriding `update` or writing the primary key
+        disables the bulk path.
+
+        :param instances: The instances to update.
+        :param validated_data: A list of dictionaries of validated data.
+        """
+        instances = list(instances)
+        assert len(instances) == len(validated_data), (
+            'Expected one item per instance (%d), got %d.'
+            % (len(instances), len(validated_data))
+        )
+        if not _bulk_updates(self, validated_data):
+            return [self.update(instance, attrs) for instance, attrs in zip(instances, validated_data)]
+        model = self.Meta.model
+        batch_size = getattr(self.Meta, 'batch_size', None)
+        update_fields, m2m_values = self._apply_updates(instances, validated_data)
+        if update_fields and instances:
+            _invalidate_rows(model, instances)
+            model._default_manager.bulk_update(instances, update_fields, batch_size=batch_size)
+            _invalidate_rows(model, instances)
+        _set_many_to_many(model, instances, m2m_values, batch_size, replace=True)
+        return instances
+
+    cdef tuple _apply_updates(self, list instances, validated_data):
+        """
+        Set the validated values on the instances of a bulk update. Return
+        the updated field names, and the many-to-many values of each instance.
+        """
+        m2m_names = _many_to_many_names(self.Meta.model)
+        update_fields = {}
+        m2m_values = []
+        for instance, attrs in zip(instances, validated_data):
+            values = {}
+            for attr, value in attrs.items():
+                if attr in m2m_names:
+                    values[attr] = value
+                else:
+                    setattr(instance, attr, value)
+                    update_fields[attr] = None
+            m2m_values.append(values)
+        return list(update_fields), m2m_values
+
+    async def acreate(self, validated_data):
+        """
+        Create a model instance with ``acreate()``. Runs :meth:`create` in a
+        thread when it is overridden.
+
+        :param validated_data: A dictionary of validated data.
+        """
+        if not _inherits(type(self), ModelSerializer, 'create'):
+            return await sync_to_async(self.create)(validated_data)
+        model = self.Meta.model
+        m2m_names = _many_to_many_names(model)
+        validated_data = dict(validated_data)
+        m2m_fields = {name: validated_data.pop(name) for name in m2m_names if name in validated_data}
+        try:
+            instance = await model._default_manager.acreate(**validated_data)
+        except TypeError:
+            raise _model_type_error(model, type(self), 'create')
+        for name, value in m2m_fields.items():
+            await getattr(instance, name).aset(value)
+        return instance
+
+    async def aupdate(self, instance, validated_data):
+        """
+        Update a model instance with ``asave()``. Runs :meth:`update` in a
+        thread when it is overridden.
+
+        :param instance: Model instance to update.
+        :param validated_data: A dictionary of deserialized data.
+        """
+        if not _inherits(type(self), ModelSerializer, 'update'):
+            return await sync_to_async(self.update)(instance, validated_data)
+        m2m_names = _many_to_many_names(type(instance))
+        m2m_fields = []
+        for attr, value in validated_data.items():
+            if attr in m2m_names:
+                m2m_fields.append((attr, value))
+            else:
+                setattr(instance, attr, value)
+        await instance.asave()
+        for attr, value in m2m_fields:
+            await getattr(instance, attr).aset(value)
+        return instance
+
+    async def abulk_create(self, validated_data):
+        """
+        Like :meth:`bulk_create`, with ``abulk_create()``.
+
+        :param validated_data: A list of dictionaries of validated data.
+        """
+        if not _bulk_creates(self):
+            return await BaseSerializer.abulk_create(self, validated_data)
+        model = self.Meta.model
+        batch_size = getattr(self.Meta, 'batch_size', None)
+        instances, m2m_values = self._build_instances(validated_data)
+        if any(m2m_values) and not await sync_to_async(_bulk_insert_returns_pks)(model):
+            for instance in instances:
+                await instance.asave()
+        else:
+            instances = await model._default_manager.abulk_create(instances, batch_size=batch_size)
+            await sync_to_async(_invalidate_rows)(model, instances)
+        await _aset_many_to_many(model, instances, m2m_values, batch_size)
+        return instances
+
+    async def abulk_update(self, instances, validated_data):
+        """
+        Like :meth:`bulk_update`, with ``abulk_update()``.
+
+        :param instances: The instances to update.
+        :param validated_data: A list of dictionaries of validated data.
+        """
+        instances = await _alist(instances)
+        assert len(instances) == len(validated_data), (
+            'Expected one item per instance (%d), got %d.'
+            % (len(instances), len(validated_data))
+        )
+        if not _bulk_updates(self, validated_data):
+            return await BaseSerializer.abulk_update(self, instances, validated_data)
+        model = self.Meta.model
+        batch_size = getattr(self.Meta, 'batch_size', None)
+        update_fields, m2m_values = self._apply_updates(instances, validated_data)
+        if update_fields and instances:
+            await sync_to_async(_invalidate_rows)(model, instances)
+            await model._default_manager.abulk_update(instances, update_fields, batch_size=batch_size)
+            await sync_to_async(_invalidate_rows)(model, instances)
+        await _aset_many_to_many(model, instances, m2m_values, batch_size, replace=True)
+        return instances
+
+
+cdef bint _bulk_creates(ModelSerializer serializer) except -1:
+    """
+    Whether a ``many=True`` save of `serializer` creates its instances with
+    `bulk_create`, which rejects multi-table inherited models.
+    """
+    meta = serializer.Meta
+    return (
+        getattr(meta, 'bulk_save', False)
+        and _inherits(type(serializer), ModelSerializer, 'create')
+        and not meta.model._meta.concrete_model._meta.parents
+    )
+
+
+cdef bint _bulk_updates(ModelSerializer serializer, validated_data) except -1:
+    """
+    Whether a ``many=True`` save of `serializer` updates its instances with
+    `bulk_update`, which rejects primary key fields.
+    """
+    meta = serializer.Meta
+    if not (getattr(meta, 'bulk_save', False) and _inherits(type(serializer), ModelSerializer, 'update')):
+        return False
+    pk = meta.model._meta.pk
+    return not any(pk.name in attrs or pk.attname in attrs for attrs in validated_data)
+
+
+def _invalidate_rows(model, list instances, through=None):
+    """
+    Invalidate the cached results that read the saved `instances`, as bulk
+    writes send no model signals.
+    """
+    pks = [instance.pk for instance in instances if instance.pk is not None]
+    if pks:
+        invalidate_rows(model, pks, through)
+
+
+def _bulk_insert_returns_pks(model):
+    """
+    Whether `bulk_create` sets the primary keys of `model` instances, which
+    the many-to-many through rows need.
+    """
+    return connections[router.db_for_write(model)].features.can_return_rows_from_bulk_insert
+
+
+cdef list _many_to_many_names(object model):
+    opts = model._meta.concrete_model._meta
+    return [field.name for field in opts.many_to_many if field.serialize]
+
+
+cdef list _many_to_many_writes(object model, list instances, list m2m_values):
+    """
+    Group the many-to-many values of saved instances by field.
+
+    Return a list of ``(name, pairs, through, source, target)`` where `pairs`
+    are the (instance, related objects or pks) pairs of the field. `through`
+    is ``None`` for custom through models, which may need extra data and are
+    written with the related manager.
+    """
+    cdef list writes = []
+    cdef dict values
+    for name in _many_to_many_names(model):
+        pairs = [(instance, values[name]) for instance, values in zip(instances, m2m_values) if name in values]
+        if not pairs:
+            continue
+        field = model._meta.get_field(name)
+        through = field.remote_field.through
+        if not through._meta.auto_created:
+            writes.append((name, pairs, None, None, None))
+            continue
+        source = through._meta.get_field(field.m2m_field_name()).attname
+        target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+        writes.append((name, pairs, through, source, target))
+    return writes
+
+
+cdef void _set_many_to_many(
+    object model, list instances, list m2m_values, object batch_size, bint replace=False
+) except *:
+    """
+    Write the many-to-many values of saved instances.
+
+    :param model: The model of the instances.
+    :param instances: The saved instances.
+    :param m2m_values: For each instance, a dict of many-to-many field name -> related objects or pks.
+    :param batch_size: The batch size for the through-table inserts.
+    :param replace: Whether to remove the existing relations first.
+    """
+    for name, pairs, through, source, target in _many_to_many_writes(model, instances, m2m_values):
+        if through is None:
+            for instance, value in pairs:
+                getattr(instance, name).set(value)
+            continue
+        written = [instance for instance, _ in pairs]
+        if replace:
+            _invalidate_rows(model, written, through)
+            through._default_manager.filter(**{
+                source + '__in': [instance.pk for instance in written]
+            }).delete()
+        through._default_manager.bulk_create(
+            [
+                through(**{source: instance.pk, target: getattr(obj, 'pk', obj)})
+                for instance, value in pairs
+                for obj in dict.fromkeys(value)
+            ],
+            batch_size=batch_size,
+        )
+        _invalidate_rows(model, written, through)
+
+
+async def _aset_many_to_many(object model, list instances, list m2m_values, object batch_size, bint replace=False):
+    """
+    Like `_set_many_to_many`, with the async ORM.
+    """
+    for name, pairs, through, source, target in _many_to_many_writes(model, instances, m2m_values):
+        if through is None:
+            for instance, value in pairs:
+                await getattr(instance, name).aset(value)
+            continue
+        written = [instance for instance, _ in pairs]
+        if replace:
+            await sync_to_async(_invalidate_rows)(model, written, through)
+            await through._default_manager.filter(**{
+                source + '__in': [instance.pk for instance in written]
+            }).adelete()
+        await through._default_manager.abulk_create(
+            [
+                through(**{source: instance.pk, target: getattr(obj, 'pk', obj)})
+                for instance, value in pairs
+                for obj in dict.fromkeys(value)
+            ],
+            batch_size=batch_size,
+        )
+        await sync_to_async(_invalidate_rows)(model, written, through)
@@ -46,12 +46,34 @@ cpdef str force_str(object obj, str encoding='utf-8'):
     else:
         return str(obj)
 
+class ErrorList(list):
+    """
+    A list of error details already normalized by `get_execption_detail`.
+    """
+
+
+class ErrorDict(dict):
+    """
+    A dict of error details already normalized by `get_execption_detail`.
+    """
+
+
 cpdef get_execption_detail(exception):
+    """
+    Normalize an error detail to nested lists and dicts of strings. Normalized
+    containers are returned as is, so that nesting the details of other errors
+    does not walk them again.
+    """
+    cdef type kind = type(exception)
+    if kind is str:
+        return exception
+    if kind is ErrorList or kind is ErrorDict:
+        return exception
     if isinstance(exception, (list, tuple)):
-        return [get_execption_detail(item) for item in exception]
+        return ErrorList([get_execption_detail(item) for item in exception])
 
     elif isinstance(exception, dict):
-        return {key : get_execption_detail(value) for key, value in exception.items()}
+        return ErrorDict({key : get_execption_detail(value) for key, value in exception.items()})
 
     return force_str(exception)
 
@@ -76,3 +98,47 @@ cpdef dict deepcopy(dict data):
     for key, value in output.items():
         output[key] = deepcopy(value) if isinstance(value, dict) else value
     return output
+
+
+cdef class LRUCache:
+    """
+    A small bounded mapping that evicts the least recently used entry once
+    ``maxsize`` is reached.
+
+    :param maxsize: The maximum number of entries to keep.
+    """
+    cdef object _data
+    cdef readonly Py_ssize_t maxsize
+    cdef readonly Py_ssize_t evictions
+
+    def __init__(self, Py_ssize_t maxsize=128):
+        self._data = collections.OrderedDict()
+        self.maxsize = maxsize
+        self.evictions = 0
+
+    cpdef object get(self, object key, object default=None):
+        try:
+            value = self._data[key]
+        except KeyError:
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    cpdef void set(self, object key, object value) except *:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    cpdef object pop(self, object key, object default=None):
+        return self._data.pop(key, default)
+
+    cpdef void clear(self) except *:
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
@@ -55,6 +55,10 @@ setup(
             "drf_turbo.exceptions",
             ["drf_turbo/exceptions.c"],
         ),
+        Extension(
+            "drf_turbo.encoder",
+            ["drf_turbo/encoder.c"],
+        ),
         Extension(
             "drf_turbo.cython_metaclass",
             ["drf_turbo/cython_metaclass.c"],
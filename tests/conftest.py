@@ -1,4 +1,5 @@
 import django
+import pytest
 
 
 def pytest_addoption(parser):
@@ -48,9 +49,29 @@ def pytest_configure(config):
             "django.contrib.staticfiles",
             "rest_framework",
             "rest_framework.authtoken",
+            "drf_turbo",
             "tests",
         ),
         PASSWORD_HASHERS=("django.contrib.auth.hashers.MD5PasswordHasher",),
         **use_l10n,
     )
     django.setup()
+
+
+@pytest.fixture(scope="session")
+def django_tables():
+    from django.apps import apps
+    from django.db import connection
+
+    with connection.schema_editor() as schema_editor:
+        for model in apps.get_app_config("tests").get_models():
+            schema_editor.create_model(model)
+
+
+@pytest.fixture
+def db(django_tables):
+    from django.db import transaction
+
+    with transaction.atomic():
+        yield
+        transaction.set_rollback(True)
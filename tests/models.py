@@ -0,0 +1,26 @@
+from django.db import models
+
+
+class Publisher(models.Model):
+    name = models.CharField(max_length=100)
+
+
+class Author(models.Model):
+    name = models.CharField(max_length=100)
+    bio = models.TextField(blank=True)
+    publisher = models.ForeignKey(Publisher, null=True, on_delete=models.CASCADE)
+
+
+class Tag(models.Model):
+    name = models.CharField(max_length=100)
+
+
+class Book(models.Model):
+    title = models.CharField(max_length=100)
+    summary = models.TextField(blank=True)
+    author = models.ForeignKey(Author, related_name='books', on_delete=models.CASCADE)
+    tags = models.ManyToManyField(Tag, blank=True)
+
+
+class SpecialEdition(Book):
+    edition = models.CharField(max_length=100)
@@ -0,0 +1,298 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+import drf_turbo as dt
+from drf_turbo.cache import DjangoResultCache, ResultCache
+from drf_turbo.utils import LRUCache
+from tests.models import Author, Book, Publisher, Tag
+
+
+class AuthorSerializer(dt.ModelSerializer):
+    class Meta:
+        model = Author
+        fields = ("id", "name")
+
+
+class BookSerializer(dt.ModelSerializer):
+    author = AuthorSerializer()
+    words = dt.MethodField()
+
+    class Meta:
+        model = Book
+        fields = ("id", "title", "author", "words")
+        result_cache = None
+
+    def get_words(self, obj):
+        return len(obj.title.split())
+
+
+class BookTagsSerializer(dt.ModelSerializer):
+    class Meta:
+        model = Book
+        fields = ("id", "tags")
+        result_cache = None
+
+
+class AuthorBooksSerializer(dt.ModelSerializer):
+    books = dt.ManyRelatedField()
+
+    class Meta:
+        model = Author
+        fields = ("id", "books")
+        result_cache = None
+
+
+class TagBooksSerializer(dt.ModelSerializer):
+    book_set = dt.ManyRelatedField()
+
+    class Meta:
+        model = Tag
+        fields = ("id", "book_set")
+        result_cache = None
+
+
+class BookWriter(dt.ModelSerializer):
+    class Meta:
+        model = Book
+        fields = ("title", "author", "tags")
+        bulk_save = True
+
+
+class AuthorWriter(dt.ModelSerializer):
+    class Meta:
+        model = Author
+        fields = ("name",)
+        bulk_save = True
+
+
+def use_result_cache(monkeypatch, cache):
+    for serializer_class in (BookSerializer, BookTagsSerializer, AuthorBooksSerializer, TagBooksSerializer):
+        monkeypatch.setattr(serializer_class.Meta, "result_cache", cache)
+        # The shared field table reads `Meta.result_cache` once.
+        monkeypatch.delattr(serializer_class, "_field_set", raising=False)
+
+
+@pytest.fixture
+def result_cache(monkeypatch):
+    cache = ResultCache(maxsize=2)
+    use_result_cache(monkeypatch, cache)
+    yield cache
+    cache.disconnect()
+
+
+@pytest.fixture
+def django_result_cache(monkeypatch):
+    cache = DjangoResultCache(prefix="test")
+    cache.clear()
+    use_result_cache(monkeypatch, cache)
+    yield cache
+    cache.disconnect()
+
+
+def create_book(title="a book"):
+    publisher = Publisher.objects.create(name="publisher")
+    author = Author.objects.create(name="author", publisher=publisher)
+    return Book.objects.create(title=title, author=author)
+
+
+@pytest.mark.usefixtures("db")
+class TestResultCache:
+    @pytest.fixture(autouse=True)
+    def setup_cache(self, result_cache):
+        self.cache = result_cache
+
+    def test_hit(self):
+        book = create_book()
+        expected = BookSerializer(book).data
+        book = Book.objects.get(pk=book.pk)
+        with CaptureQueriesContext(connection) as queries:
+            assert BookSerializer(book).data == expected
+        assert len(queries) == 0
+        assert self.cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "hit_rate": 0.5,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+
+    def test_hit_is_a_copy(self):
+        book = create_book()
+        BookSerializer(book).data["title"] = "changed"
+        assert BookSerializer(book).data["title"] == "a book"
+
+    def test_selection_is_part_of_the_key(self):
+        book = create_book()
+        assert BookSerializer(book, only=("id",)).data == {"id": book.pk}
+        assert BookSerializer(book, only=("author__name",)).data == {"author": {"name": "author"}}
+        assert BookSerializer(book, only=("author__id",)).data == {"author": {"id": book.author_id}}
+        assert self.cache.hits == 0
+
+    def test_json_bytes(self):
+        book = create_book()
+        expected = BookSerializer(book).data
+        assert json.loads(BookSerializer(book).json_bytes) == expected
+        assert json.loads(BookSerializer([book], many=True).json_bytes) == [expected]
+        assert self.cache.hits == 2
+
+    def test_save_invalidates(self):
+        book = create_book()
+        BookSerializer(book).data
+        book.title = "another book"
+        book.save()
+        assert BookSerializer(book).data["words"] == 2
+        assert self.cache.invalidations == 1
+        assert self.cache.hits == 0
+
+    def test_delete_invalidates(self):
+        book = create_book()
+        BookSerializer(book).data
+        Book.objects.filter(pk=book.pk).delete()
+        assert len(self.cache) == 0
+
+    def test_nested_save_invalidates(self):
+        book = create_book()
+        BookSerializer(book).data
+        Author.objects.get(pk=book.author_id).save()
+        Publisher.objects.create(name="unrelated")
+        assert self.cache.invalidations == 2
+        author = Author.objects.get(pk=book.author_id)
+        author.name = "another author"
+        author.save()
+        assert BookSerializer(Book.objects.get(pk=book.pk)).data["author"]["name"] == "another author"
+
+    def test_many_to_many_invalidates(self):
+        Serializer = BookTagsSerializer
+        book = create_book()
+        tag = Tag.objects.create(name="tag")
+        assert Serializer(book).data["tags"] == []
+        book.tags.add(tag)
+        assert Serializer(book).data["tags"] == [tag.pk]
+        tag.book_set.remove(book)
+        assert Serializer(book).data["tags"] == []
+        tag.book_set.add(book)
+        assert Serializer(book).data["tags"] == [tag.pk]
+        tag.book_set.clear()
+        assert Serializer(book).data["tags"] == []
+        book.tags.add(tag)
+        assert Serializer(book).data["tags"] == [tag.pk]
+        tag.delete()
+        assert Serializer(book).data["tags"] == []
+
+    def test_reverse_foreign_key_invalidates(self):
+        Serializer = AuthorBooksSerializer
+        book = create_book()
+        author = book.author
+        other = Author.objects.create(name="other")
+        assert Serializer(author).data["books"] == [book.pk]
+        assert Serializer(other).data["books"] == []
+        book.author = other
+        book.save()
+        assert Serializer(author).data["books"] == []
+        assert Serializer(other).data["books"] == [book.pk]
+        new = Book.objects.create(title="new", author=author)
+        assert Serializer(author).data["books"] == [new.pk]
+
+    def test_bulk_save_invalidates(self):
+        book = create_book()
+        BookSerializer(book).data
+        serializer = BookWriter([book], data=[{"title": "another book"}], many=True, partial=True)
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+        assert BookSerializer(Book.objects.get(pk=book.pk)).data["title"] == "another book"
+        serializer = AuthorWriter([book.author], data=[{"name": "another author"}], many=True)
+        assert serializer.is_valid(), serializer.errors
+        async_to_sync(serializer.asave)()
+        assert BookSerializer(Book.objects.get(pk=book.pk)).data["author"]["name"] == "another author"
+
+    def test_bulk_save_invalidates_relations(self):
+        author = Author.objects.create(name="author")
+        tag = Tag.objects.create(name="tag")
+        assert AuthorBooksSerializer(author).data["books"] == []
+        assert TagBooksSerializer(tag).data["book_set"] == []
+        serializer = BookWriter(data=[{"title": "a book", "author": author.pk, "tags": [tag.pk]}], many=True)
+        assert serializer.is_valid(), serializer.errors
+        book = serializer.save()[0]
+        assert AuthorBooksSerializer(author).data["books"] == [book.pk]
+        assert TagBooksSerializer(tag).data["book_set"] == [book.pk]
+        serializer = BookWriter([book], data=[{"tags": []}], many=True, partial=True)
+        assert serializer.is_valid(), serializer.errors
+        async_to_sync(serializer.asave)()
+        assert TagBooksSerializer(tag).data["book_set"] == []
+
+    def test_version_field(self, monkeypatch):
+        cache = ResultCache(version_field="title")
+        use_result_cache(monkeypatch, cache)
+        book = create_book()
+        BookSerializer(book).data
+        Book.objects.filter(pk=book.pk).update(title="another book")
+        assert BookSerializer(Book.objects.get(pk=book.pk)).data["title"] == "another book"
+        assert cache.hits == 0
+        cache.disconnect()
+
+    def test_evictions(self):
+        books = [create_book() for _ in range(3)]
+        BookSerializer(books, many=True).data
+        assert len(self.cache) == 2
+        assert self.cache.evictions == 1
+
+    def test_plain_objects_are_not_cached(self):
+        class Serializer(dt.Serializer):
+            title = dt.StrField()
+
+            class Meta:
+                result_cache = self.cache
+
+        assert Serializer({"title": "a"}).data == {"title": "a"}
+        assert self.cache.misses == 0
+
+
+@pytest.mark.usefixtures("db")
+class TestDjangoResultCache:
+    @pytest.fixture(autouse=True)
+    def setup_cache(self, django_result_cache):
+        self.cache = django_result_cache
+
+    def test_hit(self):
+        book = create_book()
+        expected = BookSerializer(book).data
+        key = "test:%s:tests.book:%s" % (self.cache.namespace(), book.pk)
+        assert self.cache.cache.get(key) is not None
+        assert BookSerializer(book).data == expected
+        assert self.cache.hit_rate == 0.5
+
+    def test_save_invalidates(self):
+        book = create_book()
+        BookSerializer(book).data
+        book.save()
+        assert self.cache.cache.get(self.cache.instance_key(Book, book.pk)) is None
+
+    def test_clear_keeps_other_keys(self):
+        book = create_book()
+        self.cache.cache.set("other", 1)
+        BookSerializer(book).data
+        self.cache.clear()
+        assert self.cache.cache.get("other") == 1
+        BookSerializer(book).data
+        assert self.cache.hits == 0
+        self.cache.cache.delete("other")
+
+
+class TestLRUCache:
+    def test_set_evicts_least_recently_used(self):
+        cache = LRUCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert "b" not in cache
+        assert cache.evictions == 1
+
+    def test_set_raises(self):
+        cache = LRUCache()
+        with pytest.raises(TypeError):
+            cache.set([], 1)
@@ -0,0 +1,177 @@
+import datetime
+import decimal
+import json
+import uuid
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+import drf_turbo as dt
+from drf_turbo.encoder import RawJSON, encode_json
+from drf_turbo.renderers import TurboJSONRenderer
+
+
+def drf_render(data):
+    return JSONRenderer().render(data)
+
+
+class TestEncodeJSON:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            True,
+            False,
+            0,
+            -12,
+            2 ** 63,
+            -(2 ** 70),
+            1.5,
+            1e100,
+            0.1,
+            "",
+            "abc",
+            'quote " and \\ backslash',
+            "control \n\r\t\b\f\x00\x1f",
+            "unicode é ☃ 😀",
+            "separators    ",
+            [],
+            {},
+            [1, "a", None, [2, {"b": 3}]],
+            {"a": {"b": [1, 2.5, "c"]}, "d": (1, 2)},
+            {1: "int", 2.5: "float", None: "none"},
+            {True: "t", False: "f"},
+        ],
+    )
+    def test_matches_json_renderer(self, value):
+        assert encode_json(value) == drf_render(value)
+
+    def test_none(self):
+        assert encode_json(None) == b"null"
+
+    def test_default_types(self):
+        value = {
+            "date": datetime.date(2020, 1, 2),
+            "datetime": datetime.datetime(2020, 1, 2, 3, 4, 5, 123456),
+            "decimal": decimal.Decimal("1.50"),
+            "uuid": uuid.UUID("12345678123456781234567812345678"),
+            "set": {1},
+        }
+        assert encode_json(value) == drf_render(value)
+
+    def test_raw_json(self):
+        assert encode_json({"a": RawJSON(b'[1,2]')}) == b'{"a":[1,2]}'
+
+    def test_result_is_raw_json(self):
+        assert isinstance(encode_json([1]), RawJSON)
+
+    def test_nan(self):
+        with pytest.raises(ValueError):
+            encode_json(float("nan"))
+        assert encode_json([float("nan"), float("inf")], allow_nan=True) == b"[NaN,Infinity]"
+
+    def test_non_finite_key(self):
+        with pytest.raises(ValueError):
+            drf_render({float("inf"): 1})
+        with pytest.raises(ValueError):
+            encode_json({float("inf"): 1})
+        value = {float("nan"): 1, float("inf"): 2, float("-inf"): 3}
+        assert encode_json(value, allow_nan=True) == json.dumps(value, separators=(",", ":")).encode()
+
+    def test_invalid_key(self):
+        with pytest.raises(TypeError):
+            encode_json({(1, 2): 1})
+
+    def test_circular_reference(self):
+        value = []
+        value.append(value)
+        with pytest.raises(ValueError):
+            encode_json(value)
+
+    def test_large_output(self):
+        value = ["x" * 100] * 1000
+        assert encode_json(value) == drf_render(value)
+
+
+class TestSerializeJSON:
+    def setup(self):
+        class ChildSerializer(dt.Serializer):
+            name = dt.StrField()
+
+        class ExampleSerializer(dt.Serializer):
+            char = dt.StrField()
+            integer = dt.IntField()
+            number = dt.FloatField()
+            amount = dt.DecimalField(max_digits=5, decimal_places=2)
+            created = dt.DateTimeField()
+            uid = dt.UUIDField()
+            tags = dt.ArrayField(child=dt.StrField())
+            child = ChildSerializer()
+            children = ChildSerializer(many=True)
+            optional = dt.StrField(allow_null=True)
+            status = dt.ChoiceField(choices=[(1, "Open"), (2, "Closed")])
+            kind = dt.ChoiceField(choices=[("a", "Alpha")], output="display")
+            computed = dt.MethodField()
+
+            def get_computed(self, obj):
+                return {"length": len(obj["char"])}
+
+        self.Serializer = ExampleSerializer
+        self.instance = {
+            "char": 'a "quoted" é',
+            "integer": "12",
+            "number": 1,
+            "amount": decimal.Decimal("3.14159"),
+            "created": datetime.datetime(2020, 1, 2, 3, 4, 5),
+            "uid": uuid.UUID("12345678123456781234567812345678"),
+            "tags": ["x", "y"],
+            "child": {"name": "c"},
+            "children": [{"name": "d"}, {"name": "e"}],
+            "optional": None,
+            "status": 2,
+            "kind": "b",
+        }
+
+    def test_matches_serialize(self):
+        serializer = self.Serializer(self.instance)
+        assert serializer.json_bytes == drf_render(serializer.data)
+
+    def test_many(self):
+        serializer = self.Serializer([self.instance, self.instance], many=True)
+        assert serializer.json_bytes == drf_render(serializer.data)
+
+    def test_selection(self):
+        serializer = self.Serializer(self.instance, only=("integer", "children__name"))
+        assert json.loads(serializer.json_bytes) == {
+            "integer": 12,
+            "children": [{"name": "d"}, {"name": "e"}],
+        }
+
+    def test_missing_field_is_skipped(self):
+        instance = dict(self.instance)
+        del instance["optional"]
+        serializer = self.Serializer(instance)
+        assert serializer.json_bytes == drf_render(serializer.data)
+
+    def test_without_instance(self):
+        serializer = self.Serializer(data={"char": "abc"})
+        assert json.loads(serializer.json_bytes) == serializer.data
+
+
+class TestTurboJSONRenderer:
+    def test_render(self):
+        data = {"a": [1, "é", None]}
+        assert TurboJSONRenderer().render(data) == drf_render(data)
+
+    def test_render_none(self):
+        assert TurboJSONRenderer().render(None) == b""
+
+    def test_render_raw_json(self):
+        data = {"count": 1, "results": RawJSON(b'[{"a":1}]')}
+        assert TurboJSONRenderer().render(data) == b'{"count":1,"results":[{"a":1}]}'
+
+    def test_render_indent(self):
+        data = {"count": 1, "results": RawJSON(b'[{"a":1}]')}
+        rendered = TurboJSONRenderer().render(data, "application/json; indent=4")
+        assert rendered == JSONRenderer().render(
+            {"count": 1, "results": [{"a": 1}]}, "application/json; indent=4"
+        )
@@ -1,7 +1,8 @@
+import copy
 import datetime
 import uuid
 from datetime import timezone
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 import pytest
 from django.core.exceptions import ObjectDoesNotExist
@@ -49,6 +50,20 @@ class FieldValues:
                 repr(input_value)
             )
 
+    def test_validate_many(self):
+        """
+        Ensure that validating a column gives the same values and errors as
+        validating each value on its own.
+        """
+        valid = list(get_items(self.valid_inputs))
+        invalid = list(get_items(self.invalid_inputs))
+        values = [value for value, _ in valid] + [value for value, _ in invalid]
+        results, errors = self.field.run_validation_many(values, self.context)
+        assert results[:len(valid)] == [expected for _, expected in valid]
+        assert errors == {
+            len(valid) + index: expected for index, (_, expected) in enumerate(invalid)
+        }
+
     def test_outputs(self):
         for output_value, expected_output in get_items(self.outputs):
             assert (
@@ -119,6 +134,22 @@ class TestRegexField(FieldValues):
     outputs = {}
     field = dt.RegexField(regex="[a-z][0-9]")
 
+    def test_pattern_is_shared(self):
+        field = dt.RegexField(regex="[a-z][0-9]")
+        assert field.compiled is self.field.compiled
+        assert copy.deepcopy(field).compiled is field.compiled
+
+    def test_re2(self):
+        re2 = pytest.importorskip("re2")
+        field = dt.RegexField(regex="[a-z][0-9]", use_re2=True)
+        assert isinstance(field.compiled.pattern, re2._Regexp)
+        assert field.run_validation("a9", self.context) == "a9"
+        with pytest.raises(ValidationError):
+            field.run_validation("A9", self.context)
+        # Backreferences are not supported by re2.
+        field = dt.RegexField(regex=r"(a)\1", use_re2=True)
+        assert field.run_validation("aa", self.context) == "aa"
+
 
 class TestURLField(FieldValues):
     """
@@ -344,6 +375,43 @@ class TestNoMaxDigitsDecimalField(FieldValues):
     outputs = {}
 
 
+class TestQuantizedDecimalField(FieldValues):
+    """
+    Values already at the field's exponent take the no-quantize path.
+    """
+
+    valid_inputs = {
+        "1.23": Decimal("1.23"),
+        "0.00": Decimal("0.00"),
+        "-999.99": Decimal("-999.99"),
+        Decimal("12.30"): Decimal("12.30"),
+    }
+    invalid_inputs = {
+        "1000.00": ["Ensure that there are no more than 5 digits in total."],
+        "Infinity": ["A valid number is required."],
+        "sNaN": ["A valid number is required."],
+    }
+    outputs = {
+        Decimal("1.23"): "1.23",
+        Decimal("-0.00"): "-0.00",
+        Decimal("1.2"): "1.20",
+        Decimal("1.235"): "1.24",
+        1: "1.00",
+    }
+    field = dt.DecimalField(max_digits=5, decimal_places=2)
+
+    def test_small_values_use_fixed_point(self):
+        field = dt.DecimalField(max_digits=12, decimal_places=8)
+        assert field.serialize(Decimal("0.00000001"), {}) == "0.00000001"
+        assert field.serialize(Decimal("0E-8"), {}) == "0.00000000"
+
+    def test_too_many_digits_for_quantize(self):
+        field = dt.DecimalField(max_digits=5, decimal_places=2, coerce_to_string=False)
+        with pytest.raises(InvalidOperation):
+            field.serialize(Decimal("1000.00"), {})
+        assert field.serialize(Decimal("999.99"), {}) == Decimal("999.99")
+
+
 class TestDateField(FieldValues):
     """
     Valid and invalid values for `DateField`.
@@ -448,6 +516,62 @@ class TestNoOutputFormatDateTimeField(FieldValues):
     field = dt.DateTimeField(format=None)
 
 
+class TestDateTimeFieldISOFormatting:
+    def test_matches_isoformat(self):
+        for offset in (0, 330, -480, 45):
+            tz = timezone(datetime.timedelta(minutes=offset))
+            field = dt.DateTimeField(default_timezone=tz)
+            for value in (
+                datetime.datetime(2001, 1, 1, 13, 0, tzinfo=timezone.utc),
+                datetime.datetime(999, 12, 31, 23, 59, 59, 120, tzinfo=tz),
+            ):
+                expected = value.astimezone(tz).isoformat()
+                if expected.endswith("+00:00"):
+                    expected = expected[:-6] + "Z"
+                assert field.serialize(value, {}) == expected
+
+    def test_naive_output(self):
+        field = dt.DateTimeField(default_timezone=None)
+        field.timezone = None
+        value = datetime.datetime(2001, 1, 1, 13, 0, 0, 5)
+        assert field.serialize(value, {}) == "2001-01-01T13:00:00.000005"
+
+    def test_second_offsets_fall_back_to_isoformat(self):
+        tz = timezone(datetime.timedelta(seconds=30))
+        field = dt.DateTimeField(default_timezone=tz)
+        value = datetime.datetime(2001, 1, 1, tzinfo=tz)
+        assert field.serialize(value, {}) == "2001-01-01T00:00:00+00:00:30"
+
+    def test_changing_format_resets_cache(self):
+        field = dt.DateTimeField(default_timezone=timezone.utc)
+        value = datetime.datetime(2001, 1, 1, 13, 0, tzinfo=timezone.utc)
+        assert field.serialize(value, {}) == "2001-01-01T13:00:00Z"
+        field.format = "%Y"
+        assert field.serialize(value, {}) == "2001"
+        field.format = "iso-8601"
+        field.timezone = timezone(datetime.timedelta(hours=1))
+        assert field.serialize(value, {}) == "2001-01-01T14:00:00+01:00"
+
+    def test_changing_input_formats(self):
+        field = dt.DateTimeField(default_timezone=timezone.utc)
+        field.input_formats = ["%Y"]
+        assert field.parse_formats == ("%Y",)
+        assert field.run_validation("2001", {}) == datetime.datetime(
+            2001, 1, 1, tzinfo=timezone.utc
+        )
+
+
+class TestCustomInputFormatDateField(FieldValues):
+    """
+    Valid and invalid values for `DateField` with a custom input format.
+    """
+
+    valid_inputs = {"1 Jan 2001": datetime.date(2001, 1, 1)}
+    invalid_inputs = {"2001-01-01": ["Not a valid date."]}
+    outputs = {}
+    field = dt.DateField(input_formats=["%d %b %Y"])
+
+
 class TestCustomOutputFormatDateField(FieldValues):
     """
     Values for `DateField` with a custom output format.
@@ -586,6 +710,51 @@ class TestChoiceFieldWithType(FieldValues):
     )
 
 
+class TestChoiceFieldOutput:
+    """
+    Typed lookups and the `output` option of `ChoiceField`.
+    """
+
+    choices = [(1, "Poor quality"), (2, "Good quality")]
+
+    def test_outputs_are_shared(self):
+        field = dt.ChoiceField(choices=self.choices)
+        output = field.serialize(1, {})
+        assert output is field.serialize(1, {})
+        assert output is field.serialize("1", {})
+        assert output == {"value": 1, "display": "Poor quality"}
+
+    def test_outputs_are_read_only(self):
+        output = dt.ChoiceField(choices=self.choices).serialize(1, {})
+        with pytest.raises(TypeError):
+            output["display"] = "Awful"
+        with pytest.raises(TypeError):
+            output.update(value=3)
+        assert copy.deepcopy(output) == output
+
+    def test_typed_lookup_keeps_string_semantics(self):
+        field = dt.ChoiceField(choices=self.choices)
+        assert field.serialize(True, {}) == {"value": True, "display": True}
+        with pytest.raises(ValidationError):
+            field.run_validation(True, {})
+        with pytest.raises(ValidationError):
+            field.run_validation(1.0, {})
+
+    def test_output_value(self):
+        field = dt.ChoiceField(choices=self.choices, output="value")
+        assert field.serialize("2", {}) == 2
+        assert field.serialize(3, {}) == 3
+
+    def test_output_display(self):
+        field = dt.ChoiceField(choices=self.choices, output="display")
+        assert field.serialize(2, {}) == "Good quality"
+        assert field.serialize(3, {}) == 3
+
+    def test_invalid_output(self):
+        with pytest.raises(AssertionError):
+            dt.ChoiceField(choices=self.choices, output="label")
+
+
 class TestChoiceFieldWithListChoices(FieldValues):
     """
     Valid and invalid values for a `Choice` field that uses a flat list for the
@@ -797,6 +966,71 @@ class TestArrayFieldExactLength(FieldValues):
     field = dt.ArrayField(child=dt.IntField(), exact_items=3)
 
 
+class TestVectorizedArrayField:
+    def setup(self):
+        self.np = pytest.importorskip("numpy")
+        self.context = {}
+
+    def test_valid_inputs(self):
+        field = dt.ArrayField(child=dt.FloatField(min_value=0), vectorize=True)
+        assert field.run_validation([1, 2.5, True], self.context) == [1.0, 2.5, 1.0]
+        field = dt.ArrayField(child=dt.IntField(), vectorize=True)
+        assert field.run_validation([1, "2", 3], self.context) == [1, 2, 3]
+
+    def test_range_errors(self):
+        field = dt.ArrayField(
+            child=dt.FloatField(min_value=0, max_value=10), vectorize=True, max_errors=2
+        )
+        with pytest.raises(ValidationError) as exc_info:
+            field.run_validation([-1, 5, 11, 20], self.context)
+        assert exc_info.value.detail == {
+            0: ["Must be greater than or equal to 0."],
+            2: ["Must be less than or equal to 10."],
+        }
+
+    def test_invalid_items_fall_back(self):
+        field = dt.ArrayField(child=dt.IntField(), vectorize=True, max_errors=1)
+        with pytest.raises(ValidationError) as exc_info:
+            field.run_validation([1, True, None], self.context)
+        assert exc_info.value.detail == {1: ["A valid integer is required."]}
+
+    def test_outputs(self):
+        field = dt.ArrayField(child=dt.IntField(), vectorize=True, output="ndarray")
+        value = field.run_validation([1, 2, 3], self.context)
+        assert value.dtype == self.np.int64
+        assert value.tolist() == [1, 2, 3]
+        field = dt.ArrayField(child=dt.FloatField(), vectorize=True, output="array")
+        value = field.run_validation(self.np.arange(3), self.context)
+        assert value.typecode == "d"
+        assert value.tolist() == [0.0, 1.0, 2.0]
+        field = dt.ArrayField(child=dt.IntField(), output="array")
+        assert field.run_validation(["1", 2], self.context).tolist() == [1, 2]
+
+    def test_outputs_out_of_int64_range(self):
+        for output in ("array", "ndarray"):
+            field = dt.ArrayField(child=dt.IntField(), vectorize=True, output=output)
+            with pytest.raises(ValidationError) as exc_info:
+                field.run_validation([1, 2 ** 70, -(2 ** 70)], self.context)
+            assert exc_info.value.detail == {
+                1: ["Must be less than or equal to %d." % (2 ** 63 - 1)],
+                2: ["Must be greater than or equal to %d." % -(2 ** 63)],
+            }
+        field = dt.ArrayField(child=dt.IntField(), output="list")
+        assert field.run_validation([2 ** 70], self.context) == [2 ** 70]
+
+    def test_empty_outputs(self):
+        field = dt.ArrayField(child=dt.IntField(), vectorize=True, output="ndarray")
+        assert field.run_validation([], self.context).dtype == self.np.int64
+        field = dt.ArrayField(child=dt.FloatField(), output="ndarray")
+        assert field.run_validation([], self.context).dtype == self.np.float64
+        field = dt.ArrayField(child=dt.IntField(), output="array")
+        assert field.run_validation([], self.context).typecode == "q"
+
+    def test_array_output_requires_numeric_child(self):
+        with pytest.raises(AssertionError):
+            dt.ArrayField(child=dt.StrField(), output="array")
+
+
 class TestDictField(FieldValues):
     """
     Values for `DictField` with CharField as child.
@@ -0,0 +1,640 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.db.models.signals import post_save
+from django.test.utils import CaptureQueriesContext
+
+from rest_framework import generics
+from rest_framework.test import APIRequestFactory
+
+import drf_turbo as dt
+from drf_turbo.mixins import OptimizeQuerysetMixin
+from tests.models import Author, Book, Publisher, SpecialEdition, Tag
+
+
+class PublisherSerializer(dt.ModelSerializer):
+    class Meta:
+        model = Publisher
+        fields = ("id", "name")
+
+
+class AuthorSerializer(dt.ModelSerializer):
+    publisher = PublisherSerializer()
+
+    class Meta:
+        model = Author
+        fields = ("id", "name", "publisher")
+
+
+class BookSerializer(dt.ModelSerializer):
+    author = AuthorSerializer()
+
+    class Meta:
+        model = Book
+        fields = ("id", "title", "author", "tags")
+
+
+class AuthorWithBooksSerializer(dt.ModelSerializer):
+    books = BookSerializer(many=True, only=("id", "title", "tags"))
+
+    class Meta:
+        model = Author
+        fields = ("id", "name", "books")
+
+
+def create_books(count=3):
+    publisher = Publisher.objects.create(name="publisher")
+    tags = [Tag.objects.create(name="tag%d" % i) for i in range(2)]
+    for i in range(count):
+        author = Author.objects.create(name="author%d" % i, publisher=publisher)
+        for j in range(2):
+            book = Book.objects.create(title="book%d-%d" % (i, j), author=author)
+            book.tags.set(tags)
+
+
+class TestOptimizeQueryset:
+    def test_select_related(self):
+        queryset = BookSerializer.optimize_queryset(Book.objects.all())
+        assert queryset.query.select_related == {"author": {"publisher": {}}}
+        assert queryset._prefetch_related_lookups == ()
+        deferred, defer = queryset.query.deferred_loading
+        assert not defer
+        assert set(deferred) == {
+            "title", "author", "author__name", "author__publisher",
+            "author__publisher__name", "author__id", "author__publisher__id", "id",
+        }
+
+    def test_only(self):
+        queryset = BookSerializer.optimize_queryset(Book.objects.all(), only=("title", "author__name"))
+        assert queryset.query.select_related == {"author": {}}
+        assert queryset._prefetch_related_lookups == ()
+        assert set(queryset.query.deferred_loading[0]) == {"title", "author", "author__name"}
+
+    def test_exclude(self):
+        queryset = BookSerializer.optimize_queryset(Book.objects.all(), exclude=("author", "tags"))
+        assert queryset.query.select_related is False
+        assert set(queryset.query.deferred_loading[0]) == {"id", "title"}
+
+    def test_method_field_disables_only(self):
+        class Serializer(dt.ModelSerializer):
+            upper = dt.MethodField()
+
+            class Meta:
+                model = Book
+                fields = ("title",)
+
+            def get_upper(self, obj):
+                return obj.title.upper()
+
+        queryset = Serializer.optimize_queryset(Book.objects.all())
+        assert queryset.query.deferred_loading == (frozenset(), True)
+
+    def test_related_field_reads_foreign_key_column(self):
+        class Serializer(dt.ModelSerializer):
+            class Meta:
+                model = Book
+                fields = ("id", "author")
+
+        queryset = Serializer.optimize_queryset(Book.objects.all())
+        assert queryset.query.select_related is False
+        assert set(queryset.query.deferred_loading[0]) == {"id", "author"}
+
+    @pytest.mark.usefixtures("db")
+    def test_queries(self):
+        create_books()
+        expected = BookSerializer(Book.objects.all(), many=True).data
+        queryset = BookSerializer.optimize_queryset(Book.objects.all())
+        with CaptureQueriesContext(connection) as queries:
+            data = BookSerializer(queryset, many=True).data
+        assert data == expected
+        assert len(queries) == 2
+
+    @pytest.mark.usefixtures("db")
+    def test_root_many_related_is_batched(self):
+        # Top-level to-many pk fields are read with one `values_list()` query
+        # per page (see `_batch_many_related`) instead of being prefetched.
+        create_books()
+        queryset = BookSerializer.optimize_queryset(Book.objects.all())
+        assert queryset._prefetch_related_lookups == ()
+        with CaptureQueriesContext(connection) as queries:
+            data = BookSerializer(queryset, many=True).data
+        assert len(queries) == 2
+        assert "IN" in queries[1]["sql"]
+        assert [len(row["tags"]) for row in data] == [2] * 6
+
+    @pytest.mark.usefixtures("db")
+    def test_nested_prefetch(self):
+        create_books()
+        expected = AuthorWithBooksSerializer(Author.objects.all(), many=True).data
+        queryset = AuthorWithBooksSerializer.optimize_queryset(Author.objects.all())
+        with CaptureQueriesContext(connection) as queries:
+            data = AuthorWithBooksSerializer(queryset, many=True).data
+        assert data == expected
+        assert len(queries) == 3
+
+    def test_view_mixin(self):
+        class View(OptimizeQuerysetMixin, generics.ListAPIView):
+            queryset = Book.objects.all()
+            serializer_class = BookSerializer
+
+        request = APIRequestFactory().get("/", {"only": "title,author__name"})
+        view = View()
+        view.setup(view.initialize_request(request))
+        view.format_kwarg = None
+        queryset = view.get_queryset()
+        assert queryset.query.select_related == {"author": {}}
+        assert set(queryset.query.deferred_loading[0]) == {"title", "author", "author__name"}
+
+
+class TestBulkSave:
+    def setup(self):
+        class Serializer(dt.ModelSerializer):
+            class Meta:
+                model = Book
+                fields = ("id", "title", "author", "tags")
+                bulk_save = True
+
+        self.Serializer = Serializer
+
+    @pytest.mark.usefixtures("db")
+    def test_bulk_create(self):
+        author = Author.objects.create(name="author")
+        tags = [Tag.objects.create(name="tag%d" % i) for i in range(2)]
+        data = [
+            {"title": "book%d" % i, "author": author.pk, "tags": [tag.pk for tag in tags[: i + 1]]}
+            for i in range(3)
+        ]
+        serializer = self.Serializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            books = serializer.save()
+        assert len(queries) == 2
+        assert [book.title for book in books] == ["book0", "book1", "book2"]
+        assert [sorted(book.tags.values_list("name", flat=True)) for book in books] == [
+            ["tag0"],
+            ["tag0", "tag1"],
+            ["tag0", "tag1"],
+        ]
+
+    @pytest.mark.usefixtures("db")
+    def test_bulk_create_without_returned_pks(self, monkeypatch):
+        monkeypatch.setattr(type(connection.features), "can_return_rows_from_bulk_insert", False)
+        author = Author.objects.create(name="author")
+        tags = [Tag.objects.create(name="tag%d" % i) for i in range(2)]
+        data = [{"title": "book%d" % i, "author": author.pk, "tags": [tag.pk for tag in tags]} for i in range(3)]
+        serializer = self.Serializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            books = serializer.save()
+        # One insert per book, then the through rows in one insert.
+        assert len(queries) == 4
+        assert all(book.pk is not None for book in books)
+        assert Book.tags.through.objects.count() == 6
+
+        serializer = self.Serializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        books = async_to_sync(serializer.asave)()
+        assert [book.tags.count() for book in books] == [2, 2, 2]
+
+    @pytest.mark.usefixtures("db")
+    def test_bulk_create_with_save_kwargs(self):
+        author = Author.objects.create(name="author")
+        serializer = self.Serializer(data=[{"title": "a"}, {"title": "b"}], many=True)
+        serializer.fields["author"].required = False
+        assert serializer.is_valid(), serializer.errors
+        books = serializer.save(author=author)
+        assert [book.author_id for book in books] == [author.pk, author.pk]
+
+    @pytest.mark.usefixtures("db")
+    def test_bulk_update(self):
+        create_books(count=2)
+        tag = Tag.objects.create(name="new")
+        books = list(Book.objects.order_by("pk"))
+        data = [{"title": "title%d" % i, "tags": [tag.pk]} for i in range(len(books))]
+        serializer = self.Serializer(books, data=data, many=True, partial=True)
+        assert serializer.is_valid(), serializer.errors
+        with CaptureQueriesContext(connection) as queries:
+            updated = serializer.save()
+        assert len(queries) == 3
+        assert updated == books
+        assert list(Book.objects.order_by("pk").values_list("title", flat=True)) == [
+            "title%d" % i for i in range(len(books))
+        ]
+        assert all(list(book.tags.all()) == [tag] for book in books)
+
+    @pytest.mark.usefixtures("db")
+    def test_bulk_update_length_mismatch(self):
+        create_books(count=1)
+        serializer = self.Serializer(Book.objects.all(), data=[{"title": "x"}], many=True, partial=True)
+        assert serializer.is_valid(), serializer.errors
+        with pytest.raises(AssertionError):
+            serializer.save()
+
+    @pytest.mark.usefixtures("db")
+    def test_overridden_create_is_used(self):
+        author = Author.objects.create(name="author")
+
+        class Serializer(self.Serializer):
+            def create(self, validated_data):
+                validated_data["title"] = validated_data["title"].upper()
+                return super().create(validated_data)
+
+        serializer = Serializer(data=[{"title": "a", "author": author.pk}], many=True)
+        assert serializer.is_valid(), serializer.errors
+        assert [book.title for book in serializer.save()] == ["A"]
+
+    @pytest.mark.usefixtures("db")
+    def test_saves_one_by_one_by_default(self):
+        author = Author.objects.create(name="author")
+
+        class Serializer(dt.ModelSerializer):
+            class Meta:
+                model = Book
+                fields = ("id", "title", "author")
+
+        saved = []
+
+        def receiver(sender, instance, **kwargs):
+            saved.append(instance.title)
+
+        post_save.connect(receiver, sender=Book)
+        try:
+            data = [{"title": "a", "author": author.pk}, {"title": "b", "author": author.pk}]
+            serializer = Serializer(data=data, many=True)
+            assert serializer.is_valid(), serializer.errors
+            books = serializer.save()
+            serializer = Serializer(books, data=[{"title": "c"}, {"title": "d"}], many=True, partial=True)
+            assert serializer.is_valid(), serializer.errors
+            serializer.save()
+        finally:
+            post_save.disconnect(receiver, sender=Book)
+        assert saved == ["a", "b", "c", "d"]
+
+    @pytest.mark.usefixtures("db")
+    def test_multi_table_inheritance_saves_one_by_one(self):
+        author = Author.objects.create(name="author")
+
+        class Serializer(dt.ModelSerializer):
+            class Meta:
+                model = SpecialEdition
+                fields = ("id", "title", "author", "edition")
+                bulk_save = True
+
+        data = [{"title": "book%d" % i, "author": author.pk, "edition": "first"} for i in range(2)]
+        serializer = Serializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        books = serializer.save()
+        assert all(book.pk is not None for book in books)
+        assert list(SpecialEdition.objects.order_by("pk").values_list("title", "edition")) == [
+            ("book0", "first"),
+            ("book1", "first"),
+        ]
+        serializer = Serializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        assert len(async_to_sync(serializer.asave)()) == 2
+
+    @pytest.mark.usefixtures("db")
+    def test_primary_key_writes_save_one_by_one(self):
+        create_books(count=1)
+        books = list(Book.objects.order_by("pk"))
+
+        class Serializer(self.Serializer):
+            id = dt.IntField()
+
+        data = [{"id": book.pk, "title": "title%d" % i} for i, book in enumerate(books)]
+        serializer = Serializer(books, data=data, many=True, partial=True)
+        assert serializer.is_valid(), serializer.errors
+        serializer.save()
+        assert list(Book.objects.order_by("pk").values_list("title", flat=True)) == ["title0", "title1"]
+        serializer = Serializer(books, data=data, many=True, partial=True)
+        assert serializer.is_valid(), serializer.errors
+        async_to_sync(serializer.asave)()
+
+
+class TestRelatedObjectResolution:
+    def setup(self):
+        class Serializer(dt.ModelSerializer):
+            class Meta:
+                model = Book
+                fields = ("title", "author", "tags")
+
+        self.Serializer = Serializer
+
+    @pytest.mark.usefixtures("db")
+    def test_many_rows_single_query_per_field(self):
+        authors = [Author.objects.create(name="author%d" % i) for i in range(3)]
+        tags = [Tag.objects.create(name="tag%d" % i) for i in range(3)]
+        data = [
+            {"title": "book%d" % i, "author": str(author.pk), "tags": [tag.pk for tag in tags]}
+            for i, author in enumerate(authors)
+        ]
+        serializer = self.Serializer(data=data, many=True)
+        with CaptureQueriesContext(connection) as queries:
+            assert serializer.is_valid(), serializer.errors
+        assert len(queries) == 2
+        assert [row["author"] for row in serializer.validated_data] == authors
+        assert all(row["tags"] == tags for row in serializer.validated_data)
+
+    @pytest.mark.usefixtures("db")
+    def test_many_rows_missing_pk(self):
+        author = Author.objects.create(name="author")
+        data = [{"title": "a", "author": author.pk}, {"title": "b", "author": author.pk + 100}]
+        serializer = self.Serializer(data=data, many=True)
+        with CaptureQueriesContext(connection) as queries:
+            assert not serializer.is_valid()
+        assert len(queries) == 1
+        assert serializer.errors == {
+            1: {"author": ['Invalid pk "%d" - object does not exist.' % (author.pk + 100)]}
+        }
+
+    @pytest.mark.usefixtures("db")
+    def test_many_related_errors_by_position(self):
+        author = Author.objects.create(name="author")
+        tag = Tag.objects.create(name="tag")
+        serializer = self.Serializer(
+            data={"title": "a", "author": author.pk, "tags": [tag.pk, 999, "x"]}
+        )
+        with CaptureQueriesContext(connection) as queries:
+            assert not serializer.is_valid()
+        assert len(queries) == 2
+        assert serializer.errors == {
+            "tags": {
+                1: ['Invalid pk "999" - object does not exist.'],
+                2: ["Incorrect type. Expected pk value, received str."],
+            }
+        }
+
+
+class TestManyRelatedSerialization:
+    def setup(self):
+        class BookTagsSerializer(dt.ModelSerializer):
+            class Meta:
+                model = Book
+                fields = ("id", "tags")
+
+        class AuthorBooksSerializer(dt.ModelSerializer):
+            books = dt.ManyRelatedField()
+
+            class Meta:
+                model = Author
+                fields = ("id", "books")
+
+        self.BookTagsSerializer = BookTagsSerializer
+        self.AuthorBooksSerializer = AuthorBooksSerializer
+
+    @pytest.mark.usefixtures("db")
+    def test_single_uses_values_list(self):
+        create_books(count=1)
+        book = Book.objects.first()
+        with CaptureQueriesContext(connection) as queries:
+            data = self.BookTagsSerializer(book).data
+        assert data["tags"] == list(book.tags.values_list("pk", flat=True))
+        assert len(queries) == 1
+        assert '"tests_tag"."name"' not in queries[0]["sql"]
+
+    @pytest.mark.usefixtures("db")
+    def test_many_is_batched(self):
+        create_books(count=3)
+        Book.objects.create(title="untagged", author=Author.objects.first())
+        expected = [
+            {"id": book.pk, "tags": list(book.tags.values_list("pk", flat=True))}
+            for book in Book.objects.all()
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            data = self.BookTagsSerializer(Book.objects.all(), many=True).data
+        assert data == expected
+        assert len(queries) == 2
+        with CaptureQueriesContext(connection) as queries:
+            json_bytes = self.BookTagsSerializer(Book.objects.all(), many=True).json_bytes
+        assert json.loads(json_bytes) == expected
+        assert len(queries) == 2
+
+    @pytest.mark.usefixtures("db")
+    def test_many_reverse_foreign_key_is_batched(self):
+        create_books(count=3)
+        expected = [
+            {"id": author.pk, "books": list(author.books.values_list("pk", flat=True))}
+            for author in Author.objects.all()
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            data = self.AuthorBooksSerializer(Author.objects.all(), many=True).data
+        assert data == expected
+        assert len(queries) == 2
+
+    @pytest.mark.usefixtures("db")
+    def test_streaming_is_batched_per_chunk(self):
+        create_books(count=3)
+        serializer = self.BookTagsSerializer(Book.objects.all(), many=True)
+        expected = serializer.data
+        # One query for the rows and one for the tag pks of each of the two chunks.
+        with CaptureQueriesContext(connection) as queries:
+            assert list(serializer.iter_serialize(Book.objects.all(), chunk_size=4)) == expected
+        assert len(queries) == 3
+        with CaptureQueriesContext(connection) as queries:
+            chunks = list(serializer.stream_json(Book.objects.all(), chunk_size=4))
+        assert json.loads(b"".join(chunks)) == expected
+        assert len(queries) == 3
+
+    @pytest.mark.usefixtures("db")
+    def test_lazy_many_is_batched(self):
+        class LazyBookTagsSerializer(self.BookTagsSerializer):
+            class Meta(self.BookTagsSerializer.Meta):
+                lazy_data = True
+
+        create_books(count=3)
+        expected = self.BookTagsSerializer(Book.objects.all(), many=True).data
+        with CaptureQueriesContext(connection) as queries:
+            data = LazyBookTagsSerializer(Book.objects.all(), many=True).data
+            assert [row["id"] for row in data] == [row["id"] for row in expected]
+            assert len(queries) == 1
+            assert data[0]["tags"] == expected[0]["tags"]
+            assert data == expected
+        assert len(queries) == 2
+
+    @pytest.mark.usefixtures("db")
+    def test_lazy_nested_is_not_fetched(self):
+        class LazyBookSerializer(BookSerializer):
+            class Meta(BookSerializer.Meta):
+                lazy_data = True
+
+        create_books(count=1)
+        book = Book.objects.first()
+        with CaptureQueriesContext(connection) as queries:
+            data = LazyBookSerializer(book).data
+            assert data["title"] == book.title
+        assert len(queries) == 0
+        assert data["author"]["name"] == "author0"
+
+    @pytest.mark.usefixtures("db")
+    def test_many_uses_prefetch_cache(self):
+        create_books(count=3)
+        queryset = Book.objects.prefetch_related("tags")
+        expected = self.BookTagsSerializer(Book.objects.all(), many=True).data
+        with CaptureQueriesContext(connection) as queries:
+            data = self.BookTagsSerializer(queryset, many=True).data
+        assert data == expected
+        assert len(queries) == 2
+
+
+class TestValuesMode:
+    def setup(self):
+        class Serializer(dt.ModelSerializer):
+            author_name = dt.StrField(attr="author.name")
+
+            class Meta:
+                model = Book
+                fields = ("id", "title", "author", "author_name")
+                use_values_list = True
+
+        self.Serializer = Serializer
+
+    @pytest.mark.usefixtures("db")
+    def test_values_list(self):
+        create_books(count=2)
+        expected = [
+            {"id": book.pk, "title": book.title, "author": book.author_id, "author_name": book.author.name}
+            for book in Book.objects.all()
+        ]
+        with CaptureQueriesContext(connection) as queries:
+            data = self.Serializer(Book.objects.all(), many=True).data
+        assert data == expected
+        assert len(queries) == 1
+        assert '"tests_author"."name"' in queries[0]["sql"]
+        assert '"tests_book"."summary"' not in queries[0]["sql"]
+
+    @pytest.mark.usefixtures("db")
+    def test_only(self):
+        create_books(count=1)
+        serializer = self.Serializer(Book.objects.all(), many=True, only=("title",))
+        assert serializer.data == [{"title": "book0-0"}, {"title": "book0-1"}]
+
+    @pytest.mark.usefixtures("db")
+    def test_fallback_for_method_field(self):
+        create_books(count=1)
+
+        class Serializer(dt.ModelSerializer):
+            upper = dt.MethodField()
+
+            class Meta:
+                model = Book
+                fields = ("title",)
+
+            def get_upper(self, obj):
+                return obj.title.upper()
+
+        data = Serializer().serialize_values(Book.objects.all())
+        assert data == [
+            {"title": "book0-0", "upper": "BOOK0-0"},
+            {"title": "book0-1", "upper": "BOOK0-1"},
+        ]
+
+    @pytest.mark.usefixtures("db")
+    def test_nullable_foreign_key_path_needs_instances(self):
+        class Serializer(dt.ModelSerializer):
+            publisher_name = dt.StrField(attr="publisher.name", allow_null=True)
+
+            class Meta:
+                model = Author
+                fields = ("name",)
+
+        Author.objects.create(name="author")
+        assert Serializer().serialize_values(Author.objects.all()) == [
+            {"name": "author", "publisher_name": None}
+        ]
+
+
+class TestAsync:
+    def setup(self):
+        class BookTagsSerializer(dt.ModelSerializer):
+            class Meta:
+                model = Book
+                fields = ("id", "title", "author", "tags")
+
+        class AuthorBooksSerializer(dt.ModelSerializer):
+            books = dt.ManyRelatedField()
+
+            class Meta:
+                model = Author
+                fields = ("id", "books")
+
+        self.BookTagsSerializer = BookTagsSerializer
+        self.AuthorBooksSerializer = AuthorBooksSerializer
+
+    @pytest.mark.usefixtures("db")
+    def test_adata_many(self):
+        create_books(count=3)
+        for serializer_class, queryset in (
+            (BookSerializer, Book.objects.all()),
+            (AuthorWithBooksSerializer, Author.objects.all()),
+            (self.AuthorBooksSerializer, Author.objects.all()),
+            (BookSerializer, list(Book.objects.all())),
+        ):
+            expected = serializer_class(queryset, many=True).data
+            serializer = serializer_class(queryset, many=True)
+            assert async_to_sync(serializer.adata)() == expected
+            assert serializer.data == expected
+
+    @pytest.mark.usefixtures("db")
+    def test_adata_single(self):
+        create_books(count=1)
+        for serializer_class, instance in (
+            (BookSerializer, Book.objects.first()),
+            (AuthorWithBooksSerializer, Author.objects.first()),
+            (self.AuthorBooksSerializer, Author.objects.first()),
+        ):
+            expected = serializer_class(instance).data
+            instance = type(instance).objects.get(pk=instance.pk)
+            assert async_to_sync(serializer_class(instance).adata)() == expected
+
+    @pytest.mark.usefixtures("db")
+    def test_ais_valid(self):
+        author = Author.objects.create(name="author")
+        tag = Tag.objects.create(name="tag")
+        serializer = self.BookTagsSerializer(
+            data=[{"title": "a", "author": author.pk, "tags": [tag.pk]}, {"title": "b", "author": 999}],
+            many=True,
+        )
+        assert not async_to_sync(serializer.ais_valid)()
+        assert serializer.errors == {1: {"author": ['Invalid pk "999" - object does not exist.']}}
+
+        serializer = self.BookTagsSerializer(data={"title": "a", "author": author.pk, "tags": [tag.pk]})
+        assert async_to_sync(serializer.ais_valid)(), serializer.errors
+        assert serializer.validated_data == {"title": "a", "author": author, "tags": [tag]}
+
+    @pytest.mark.usefixtures("db")
+    def test_asave(self):
+        author = Author.objects.create(name="author")
+        tags = [Tag.objects.create(name="tag%d" % i) for i in range(2)]
+        serializer = self.BookTagsSerializer(data={"title": "a", "author": author.pk, "tags": [tags[0].pk]})
+        assert async_to_sync(serializer.ais_valid)(), serializer.errors
+        book = async_to_sync(serializer.asave)()
+        assert list(book.tags.all()) == [tags[0]]
+
+        serializer = self.BookTagsSerializer(book, data={"title": "b", "tags": [tags[1].pk]}, partial=True)
+        assert async_to_sync(serializer.ais_valid)(), serializer.errors
+        async_to_sync(serializer.asave)()
+        book.refresh_from_db()
+        assert book.title == "b"
+        assert list(book.tags.all()) == [tags[1]]
+
+    @pytest.mark.usefixtures("db")
+    def test_asave_many(self):
+        author = Author.objects.create(name="author")
+        tags = [Tag.objects.create(name="tag%d" % i) for i in range(2)]
+        data = [
+            {"title": "book%d" % i, "author": author.pk, "tags": [tag.pk for tag in tags[: i + 1]]}
+            for i in range(2)
+        ]
+        serializer = self.BookTagsSerializer(data=data, many=True)
+        assert async_to_sync(serializer.ais_valid)(), serializer.errors
+        books = async_to_sync(serializer.asave)()
+        assert [len(book.tags.all()) for book in books] == [1, 2]
+
+        data = [{"title": "title%d" % i, "tags": [tags[0].pk]} for i in range(2)]
+        serializer = self.BookTagsSerializer(Book.objects.order_by("pk"), data=data, many=True, partial=True)
+        assert async_to_sync(serializer.ais_valid)(), serializer.errors
+        async_to_sync(serializer.asave)()
+        assert list(Book.objects.order_by("pk").values_list("title", flat=True)) == ["title0", "title1"]
+        assert all(list(book.tags.all()) == [tags[0]] for book in Book.objects.all())
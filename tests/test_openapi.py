@@ -0,0 +1,161 @@
+import io
+import json
+
+import pytest
+from django.core.management import call_command
+from django.test.utils import override_settings
+from django.urls import path
+from rest_framework import generics
+
+import drf_turbo as dt
+from drf_turbo import openapi
+from drf_turbo.openapi import AutoSchema, SchemaGenerator
+from tests.models import Author, Book
+
+
+class AuthorSerializer(dt.ModelSerializer):
+    class Meta:
+        model = Author
+        fields = ("id", "name")
+
+
+class BookSerializer(dt.ModelSerializer):
+    author = AuthorSerializer()
+
+    class Meta:
+        model = Book
+        fields = ("id", "title", "author")
+
+
+class CountingSchema(AutoSchema):
+    built = []
+
+    def build_serializer_schema(self, serializer):
+        self.built.append(type(serializer))
+        return super().build_serializer_schema(serializer)
+
+
+class BookList(generics.ListCreateAPIView):
+    queryset = Book.objects.all()
+    serializer_class = BookSerializer
+    schema = CountingSchema()
+
+
+class BookDetail(generics.RetrieveUpdateDestroyAPIView):
+    queryset = Book.objects.all()
+    serializer_class = BookSerializer
+    schema = CountingSchema()
+
+
+patterns = [
+    path("books/", BookList.as_view()),
+    path("books/<int:pk>/", BookDetail.as_view()),
+]
+
+
+class TestSchemaCache:
+    def setup(self):
+        openapi._schemas.clear()
+        openapi._components.clear()
+        CountingSchema.built = []
+
+    def test_components_are_memoized(self):
+        schema = SchemaGenerator(patterns=patterns, title="Books").get_schema(public=True)
+        properties = schema["components"]["schemas"]["Book"]["properties"]
+        assert set(properties) == {"id", "title", "author"}
+        assert properties["author"]["type"] == "object"
+        assert set(properties["author"]["properties"]) == {"id", "name"}
+        assert CountingSchema.built == [BookSerializer, AuthorSerializer]
+
+    def test_selection_is_part_of_the_key(self):
+        schema = CountingSchema()
+        full = schema.map_serializer(BookSerializer())
+        assert schema.map_serializer(BookSerializer()) == full
+        assert CountingSchema.built == [BookSerializer, AuthorSerializer]
+        schema.map_serializer(BookSerializer(only=["title"]))
+        assert CountingSchema.built == [BookSerializer, AuthorSerializer, BookSerializer]
+
+    def test_memoized_schema_is_a_copy(self):
+        schema = CountingSchema()
+        schema.map_serializer(BookSerializer())["readOnly"] = True
+        assert "readOnly" not in schema.map_serializer(BookSerializer())
+
+    def test_schema_is_cached(self):
+        schema = SchemaGenerator(patterns=patterns, title="Books").get_schema(public=True)
+        assert SchemaGenerator(patterns=patterns, title="Books").get_schema(public=True) is schema
+        assert SchemaGenerator(patterns=patterns, title="Other").get_schema(public=True) is not schema
+
+    def test_fingerprint(self):
+        fingerprint = SchemaGenerator(patterns=patterns, title="Books").get_fingerprint()
+        assert SchemaGenerator(patterns=patterns, title="Books").get_fingerprint() == fingerprint
+        assert SchemaGenerator(patterns=patterns[:1], title="Books").get_fingerprint() != fingerprint
+
+    def test_fingerprint_covers_serializer_fields(self):
+        def make_patterns(required):
+            class TitleSerializer(dt.Serializer):
+                title = dt.StrField(required=required)
+
+            class View(generics.CreateAPIView):
+                serializer_class = TitleSerializer
+
+            return [path("titles/", View.as_view())]
+
+        fingerprint = SchemaGenerator(patterns=make_patterns(True)).get_fingerprint()
+        assert SchemaGenerator(patterns=make_patterns(True)).get_fingerprint() == fingerprint
+        assert SchemaGenerator(patterns=make_patterns(False)).get_fingerprint() != fingerprint
+
+    def test_fingerprint_covers_get_serializer_class(self):
+        def make_patterns(serializer_class):
+            class View(generics.ListAPIView):
+                queryset = Book.objects.all()
+
+                def get_serializer_class(self):
+                    return serializer_class
+
+            return [path("books/", View.as_view())]
+
+        fingerprint = SchemaGenerator(patterns=make_patterns(BookSerializer)).get_fingerprint()
+        assert SchemaGenerator(patterns=make_patterns(AuthorSerializer)).get_fingerprint() != fingerprint
+
+    def test_prerendered_schema(self, tmp_path):
+        schema_file = str(tmp_path / "schema.json")
+        with override_settings(DRF_TURBO_SCHEMA_FILE=schema_file, ROOT_URLCONF=__name__):
+            call_command("prerender_schema", title="Books", stdout=io.StringIO())
+            expected = json.loads(json.dumps(SchemaGenerator(title="Books").generate_schema(public=True)))
+            openapi._schemas.clear()
+            CountingSchema.built = []
+            assert SchemaGenerator(title="Books").get_schema(public=True) == expected
+            assert CountingSchema.built == []
+
+    def test_stale_prerendered_schema(self, tmp_path):
+        schema_file = str(tmp_path / "schema.json")
+        SchemaGenerator(patterns=patterns[:1], title="Books").write_schema(schema_file)
+        with override_settings(DRF_TURBO_SCHEMA_FILE=schema_file):
+            with pytest.warns(UserWarning):
+                schema = SchemaGenerator(patterns=patterns, title="Books").get_schema(public=True)
+        assert len(schema["paths"]) == 2
+
+
+urlpatterns = patterns
+
+
+class TestParallelSchema:
+    def setup(self):
+        openapi._components.clear()
+
+    def test_same_schema(self):
+        generator = SchemaGenerator(patterns=patterns, title="Books")
+        expected = generator.generate_schema(public=True)
+        schema = generator.generate_schema(public=True, workers=2)
+        assert json.dumps(schema, sort_keys=True, default=str) == json.dumps(
+            expected, sort_keys=True, default=str
+        )
+        assert list(schema["paths"]) == ["/books/", "/books/{id}/"]
+
+    def test_duplicate_operation_id(self):
+        generator = SchemaGenerator(
+            patterns=patterns + [path("other-books/", BookList.as_view())], title="Books"
+        )
+        with pytest.warns(UserWarning, match="duplicated operationId"):
+            schema = generator.generate_schema(public=True, workers=2)
+        assert list(schema["paths"]) == ["/books/", "/books/{id}/", "/other-books/"]
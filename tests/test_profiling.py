@@ -0,0 +1,180 @@
+import json
+
+import pytest
+
+import drf_turbo as dt
+from drf_turbo.profiling import NPlusOneDetector, NPlusOneError, NPlusOneWarning, Profiler
+from drf_turbo.serializer import set_profiler
+from tests.models import Author, Book, Publisher, Tag
+
+
+class AuthorSerializer(dt.ModelSerializer):
+    class Meta:
+        model = Author
+        fields = ("id", "name")
+
+
+class BookSerializer(dt.ModelSerializer):
+    author = AuthorSerializer()
+
+    class Meta:
+        model = Book
+        fields = ("id", "title", "author")
+
+
+class PublisherSerializer(dt.ModelSerializer):
+    class Meta:
+        model = Publisher
+        fields = ("id", "name")
+
+
+class AuthorWithPublisherSerializer(dt.ModelSerializer):
+    publisher = PublisherSerializer()
+
+    class Meta:
+        model = Author
+        fields = ("id", "name", "publisher")
+
+
+class BookWithPublisherSerializer(dt.ModelSerializer):
+    author = AuthorWithPublisherSerializer()
+    tag_count = dt.MethodField()
+
+    class Meta:
+        model = Book
+        fields = ("id", "title", "author", "tag_count")
+
+    def get_tag_count(self, obj):
+        return obj.tags.count()
+
+
+class TagSerializer(dt.ModelSerializer):
+    class Meta:
+        model = Tag
+        fields = ("id", "name")
+
+
+class BookWithTagsSerializer(dt.ModelSerializer):
+    tags = TagSerializer(many=True)
+
+    class Meta:
+        model = Book
+        fields = ("id", "tags")
+
+
+class TitleSerializer(dt.Serializer):
+    title = dt.StrField(max_length=5)
+    pages = dt.IntField(required=False)
+
+
+def create_books(count):
+    publisher = Publisher.objects.create(name="publisher")
+    author = Author.objects.create(name="author", publisher=publisher)
+    return [Book.objects.create(title="book %s" % i, author=author) for i in range(count)]
+
+
+@pytest.mark.usefixtures("db")
+class TestProfiler:
+    def test_serialize(self):
+        create_books(3)
+        with Profiler() as profiler:
+            data = BookSerializer(Book.objects.all(), many=True).data
+        stats = profiler.as_dict()
+        book = stats["tests.test_profiling.BookSerializer"]
+        assert book["title"]["serialize"]["calls"] == 3
+        assert book["title"]["serialize"]["queries"] == 0
+        # The author of each book is read with a query.
+        assert book["author"]["serialize"]["queries"] == 3
+        assert stats["tests.test_profiling.AuthorSerializer"]["name"]["serialize"]["queries"] == 0
+        assert book["author"]["serialize"]["time"] >= stats[
+            "tests.test_profiling.AuthorSerializer"
+        ]["name"]["serialize"]["time"]
+        assert stats["tests.test_profiling.AuthorSerializer"]["name"]["serialize"]["calls"] == 3
+        assert data[0]["author"]["name"] == "author"
+
+    def test_json_bytes(self):
+        create_books(2)
+        serializer = BookSerializer(Book.objects.select_related("author"), many=True)
+        expected = serializer.json_bytes
+        with Profiler() as profiler:
+            assert BookSerializer(Book.objects.select_related("author"), many=True).json_bytes == expected
+        book = profiler.as_dict()["tests.test_profiling.BookSerializer"]
+        assert book["id"]["serialize"]["calls"] == 2
+        assert book["author"]["serialize"]["queries"] == 0
+
+    def test_errors(self):
+        with Profiler() as profiler:
+            serializer = TitleSerializer(data={"title": "too long", "pages": 3})
+            assert not serializer.is_valid()
+            serializer = TitleSerializer(data=[{"title": "a"}, {"title": "too long"}], many=True)
+            assert not serializer.is_valid()
+        stats = profiler.as_dict()["tests.test_profiling.TitleSerializer"]
+        assert stats["title"]["deserialize"]["calls"] == 3
+        assert stats["title"]["deserialize"]["errors"] == 2
+        assert stats["pages"]["deserialize"]["errors"] == 0
+
+    def test_disabled(self):
+        profiler = Profiler()
+        with profiler:
+            pass
+        TitleSerializer({"title": "a"}).data
+        assert profiler.stats == {}
+        assert set_profiler(None) is None
+
+    def test_prometheus(self):
+        with Profiler() as profiler:
+            TitleSerializer({"title": "a", "pages": 1}).data
+        text = profiler.to_prometheus()
+        assert "# TYPE drf_turbo_field_calls_total counter" in text
+        assert (
+            'drf_turbo_field_calls_total{serializer="tests.test_profiling.TitleSerializer",'
+            'field="title",phase="serialize"} 1'
+        ) in text
+        assert 'drf_turbo_field_errors_total{serializer="tests.test_profiling.TitleSerializer",' in text
+        json.dumps(profiler.as_dict())
+
+
+@pytest.mark.usefixtures("db")
+class TestNPlusOneDetector:
+    def test_select_related(self):
+        create_books(3)
+        with pytest.raises(NPlusOneError) as exc_info:
+            with NPlusOneDetector():
+                BookSerializer(Book.objects.all(), many=True).data
+        message = str(exc_info.value)
+        assert message.startswith("BookSerializer.author made 3 queries for 3 rows of BookSerializer.")
+        assert "`.select_related('author')`" in message
+
+    def test_nested_path(self):
+        create_books(3)
+        queryset = Book.objects.select_related("author")
+        with pytest.raises(NPlusOneError, match=r"AuthorWithPublisherSerializer\.publisher made 3 queries"
+                           r".*select_related\('author__publisher'\)"):
+            with NPlusOneDetector():
+                BookWithPublisherSerializer(queryset, many=True, exclude=("tag_count",)).json_bytes
+
+    def test_prefetch_related(self):
+        create_books(2)
+        with pytest.warns(NPlusOneWarning, match=r"prefetch_related\('tags'\)"):
+            with NPlusOneDetector(action="warn") as detector:
+                BookWithTagsSerializer(Book.objects.all(), many=True).data
+        assert len(detector.reports) == 1
+
+    def test_method_field(self):
+        create_books(2)
+        queryset = Book.objects.select_related("author__publisher")
+        with pytest.raises(NPlusOneError, match=r"BookWithPublisherSerializer\.get_tag_count\(\)"):
+            with NPlusOneDetector():
+                BookWithPublisherSerializer(queryset, many=True).data
+
+    def test_optimized(self):
+        create_books(3)
+        with NPlusOneDetector() as detector:
+            BookWithPublisherSerializer(
+                BookWithPublisherSerializer.optimize_queryset(Book.objects.all()),
+                many=True,
+                exclude=("tag_count",),
+            ).data
+            BookWithTagsSerializer(Book.objects.prefetch_related("tags"), many=True).data
+            BookSerializer(Book.objects.first()).data
+        assert detector.reports == []
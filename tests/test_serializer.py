@@ -4,8 +4,10 @@ from collections import ChainMap
 from collections.abc import Mapping
 
 import pytest
+from asgiref.sync import async_to_sync
 
 import drf_turbo as dt
+from drf_turbo.encoder import encode_json
 from drf_turbo.exceptions import OnlyAndExcludeError
 
 
@@ -499,3 +501,444 @@ class TestSerializerValidationWithCompiledRegexField:
         assert serializer.is_valid()
         assert serializer.validated_data == {"name": "2"}
         assert serializer.errors == {}
+
+
+class TestSerializationPlan:
+    def test_many_uses_same_output_as_single(self):
+        class ExampleSerializer(dt.Serializer):
+            char = dt.StrField()
+            nested = dt.IntField(attr="sub.value")
+            doubled = dt.MethodField()
+
+            def get_doubled(self, obj):
+                return obj.integer * 2
+
+        objects = [
+            MockObject(char="a%d" % i, integer=i, sub={"value": i}) for i in range(3)
+        ]
+        many = ExampleSerializer(objects, many=True).data
+        assert many == [ExampleSerializer(obj).data for obj in objects]
+        assert many[2] == {"char": "a2", "nested": 2, "doubled": 4}
+
+    def test_related_field_reads_foreign_key_column(self):
+        class ExampleSerializer(dt.Serializer):
+            owner = dt.RelatedField()
+
+        instance = MockObject(owner_id=7)
+        assert ExampleSerializer(instance).data == {"owner": 7}
+
+    def test_callable_and_manager_values(self):
+        class Manager:
+            def all(self):
+                return ["a", "b"]
+
+        class ExampleSerializer(dt.Serializer):
+            upper = dt.StrField(call=True)
+            tags = dt.ArrayField(child=dt.StrField())
+
+        instance = MockObject(upper=lambda: "ABC", tags=Manager())
+        assert ExampleSerializer(instance).data == {"upper": "ABC", "tags": ["a", "b"]}
+
+
+class TestSharedFieldTable:
+    def setup(self):
+        class ExampleSerializer(dt.Serializer):
+            char = dt.StrField()
+            integer = dt.IntField()
+
+        class NestedSerializer(dt.Serializer):
+            foo = dt.StrField()
+            example = ExampleSerializer()
+
+        self.Serializer = ExampleSerializer
+        self.NestedSerializer = NestedSerializer
+
+    def test_fields_are_shared_between_instances(self):
+        first = self.Serializer()
+        second = self.Serializer()
+        assert first.fields["char"] is second.fields["char"]
+        assert first.fields["char"].field_name == "char"
+
+    def test_mutating_fields_does_not_leak(self):
+        serializer = self.Serializer({"char": "abc", "integer": 123})
+        serializer.fields.pop("integer")
+        assert "integer" not in serializer.fields
+        assert serializer.data == {"char": "abc"}
+        assert "integer" in self.Serializer().fields
+        assert self.Serializer({"char": "abc", "integer": 123}).data == {
+            "char": "abc",
+            "integer": 123,
+        }
+
+    def test_added_field_is_bound(self):
+        serializer = self.Serializer({"char": "abc", "integer": 123, "extra": "x"})
+        serializer.fields["extra"] = dt.StrField()
+        assert serializer.data == {"char": "abc", "integer": 123, "extra": "x"}
+        assert "extra" not in self.Serializer().fields
+
+    def test_nested_selection_does_not_leak(self):
+        instance = {"foo": "foo", "example": {"char": "abc", "integer": 123}}
+        selected = self.NestedSerializer(instance, only=("example__char",))
+        assert selected.data == {"example": {"char": "abc"}}
+        assert self.NestedSerializer(instance).data == instance
+
+    def test_nested_fields_do_not_leak(self):
+        instance = {"foo": "foo", "example": {"char": "abc", "integer": 123}}
+        serializer = self.NestedSerializer(instance)
+        serializer.fields["example"].fields.pop("integer")
+        assert serializer.fields["example"].root is serializer
+        assert serializer.data == {"foo": "foo", "example": {"char": "abc"}}
+        assert "integer" in self.NestedSerializer().fields["example"].fields
+        assert self.NestedSerializer(instance).data == instance
+
+    def test_mapping_api(self):
+        serializer = self.Serializer({"char": "abc", "integer": 123, "extra": "x", "other": "y"})
+        serializer.fields.update({"extra": dt.StrField()}, other=dt.StrField())
+        assert serializer.fields["extra"].root is serializer
+        assert serializer.fields.setdefault("char", dt.IntField()) is serializer.fields["char"]
+        assert serializer.data == {"char": "abc", "integer": 123, "extra": "x", "other": "y"}
+        assert serializer.fields.popitem()[0] == "other"
+        serializer.fields.clear()
+        assert len(serializer.fields) == 0
+        assert list(self.Serializer().fields) == ["char", "integer"]
+
+    def test_custom_field_is_bound_to_instance(self):
+        class PrefixField(dt.Field):
+            def serialize(self, value, context):
+                return self.root.context["prefix"] + value
+
+        class PrefixSerializer(dt.Serializer):
+            name = PrefixField()
+
+        assert PrefixSerializer({"name": "a"}, context={"prefix": "x"}).data == {"name": "xa"}
+        serializer = PrefixSerializer({"name": "a"}, context={"prefix": "y"})
+        assert serializer.fields["name"].root is serializer
+        assert serializer.data == {"name": "ya"}
+
+    def test_overridden_get_fields(self):
+        class DynamicSerializer(self.Serializer):
+            def get_fields(self):
+                fields = super().get_fields()
+                fields.pop("integer")
+                return fields
+
+        assert DynamicSerializer({"char": "abc", "integer": 1}).data == {"char": "abc"}
+
+
+class TestStreaming:
+    def setup(self):
+        class ExampleSerializer(dt.Serializer):
+            char = dt.StrField()
+            integer = dt.IntField()
+
+        class QuerySet:
+            _result_cache = None
+
+            def __init__(self, rows):
+                self.rows = rows
+                self.chunk_sizes = []
+
+            def __iter__(self):
+                raise AssertionError("queryset should be streamed")
+
+            def iterator(self, chunk_size):
+                self.chunk_sizes.append(chunk_size)
+                return iter(self.rows)
+
+        self.Serializer = ExampleSerializer
+        self.rows = [{"char": str(i), "integer": i} for i in range(5)]
+        self.QuerySet = QuerySet
+
+    def test_iter_serialize(self):
+        serializer = self.Serializer(self.rows, many=True)
+        assert list(serializer.iter_serialize()) == serializer.data
+
+    def test_iter_serialize_single(self):
+        serializer = self.Serializer(self.rows[0])
+        assert list(serializer.iter_serialize()) == [self.rows[0]]
+
+    def test_iter_serialize_uses_queryset_iterator(self):
+        queryset = self.QuerySet(self.rows)
+        serializer = self.Serializer(many=True)
+        assert list(serializer.iter_serialize(queryset, chunk_size=2)) == self.rows
+        assert queryset.chunk_sizes == [2]
+
+    def test_stream_json(self):
+        queryset = self.QuerySet(self.rows)
+        serializer = self.Serializer(queryset, many=True)
+        chunks = list(serializer.stream_json(chunk_size=2))
+        assert len(chunks) == 3
+        assert b"".join(chunks) == self.Serializer(self.rows, many=True).json_bytes
+
+    def test_stream_json_empty(self):
+        serializer = self.Serializer([], many=True)
+        assert b"".join(serializer.stream_json()) == b"[]"
+
+
+class TestLazyData:
+    def setup(self):
+        calls = []
+
+        class ExampleSerializer(dt.Serializer):
+            char = dt.StrField()
+            integer = dt.IntField()
+            optional = dt.StrField(required=False)
+            computed = dt.MethodField()
+
+            class Meta:
+                lazy_data = True
+
+            def get_computed(self, obj):
+                calls.append(obj)
+                return len(obj["char"])
+
+        self.calls = calls
+        self.Serializer = ExampleSerializer
+        self.instance = {"char": "abc", "integer": 1}
+        self.expected = {"char": "abc", "integer": 1, "computed": 3}
+
+    def test_fields_are_serialized_on_access(self):
+        data = self.Serializer(self.instance).data
+        assert isinstance(data, Mapping)
+        assert data["char"] == "abc"
+        assert self.calls == []
+        assert data["computed"] == 3
+        assert data["computed"] == 3
+        assert len(self.calls) == 1
+
+    def test_materialize(self):
+        serializer = self.Serializer(self.instance)
+        data = serializer.data
+        assert data is serializer.data
+        assert data == self.expected
+        assert dict(data) == self.expected
+        assert list(data) == ["char", "integer", "computed"]
+        assert len(self.calls) == 1
+
+    def test_skipped_field(self):
+        data = self.Serializer(self.instance).data
+        assert "optional" not in data
+        assert data.get("optional") is None
+        with pytest.raises(KeyError):
+            data["optional"]
+        with pytest.raises(KeyError):
+            data["unknown"]
+
+    def test_many(self):
+        data = self.Serializer([self.instance, {"char": "ab", "integer": 2}], many=True).data
+        assert [row["integer"] for row in data] == [1, 2]
+        assert self.calls == []
+        assert data[1] == {"char": "ab", "integer": 2, "computed": 2}
+
+    def test_render(self):
+        data = self.Serializer(self.instance).data
+        assert encode_json(data) == encode_json(self.expected)
+        assert pickle.loads(pickle.dumps(data)) == self.expected
+
+    def test_validated_data(self):
+        serializer = self.Serializer(data={"char": "abcd", "integer": "2"})
+        assert serializer.is_valid()
+        assert serializer.data == {"char": "abcd", "integer": 2, "computed": 4}
+
+
+class TestManyValidation:
+    def setup(self):
+        class ExampleSerializer(dt.Serializer):
+            char = dt.StrField()
+            integer = dt.IntField(required=False)
+            flag = dt.BoolField(default_value=False)
+
+            def validate_char(self, value):
+                if value == "bad":
+                    raise dt.ValidationError("Bad value.")
+                return value.upper()
+
+        self.Serializer = ExampleSerializer
+
+    def test_valid_rows(self):
+        data = [{"char": "a", "integer": 1, "flag": "true"}, {"char": "b"}]
+        serializer = self.Serializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data == [
+            {"char": "A", "integer": 1, "flag": True},
+            {"char": "B", "flag": False},
+        ]
+
+    def test_errors_keyed_by_row(self):
+        data = [
+            {"char": "a", "integer": 1},
+            {"char": "b", "integer": "x"},
+            "row",
+            {"integer": 2, "flag": "maybe"},
+            {"char": "bad"},
+        ]
+        serializer = self.Serializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == {
+            1: {"integer": ["A valid integer is required."]},
+            2: ["Invalid data type: str"],
+            3: {"char": ["This field is required."], "flag": ["Not a valid boolean."]},
+            4: {"char": ["Bad value."]},
+        }
+
+    def test_nested_serializer_rows(self):
+        class ParentSerializer(dt.Serializer):
+            child = self.Serializer()
+
+        data = [{"child": {"char": "a"}}, {"child": {"integer": 1}}]
+        serializer = ParentSerializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert serializer.errors == {1: {"child": {"char": ["This field is required."]}}}
+
+
+class TestValidationPlan:
+    def test_hooks_and_validators(self):
+        def positive(value):
+            if value <= 0:
+                raise dt.ValidationError("Must be positive.")
+
+        class ExampleSerializer(dt.Serializer):
+            name = dt.StrField(attr="title")
+            count = dt.IntField(validators=[positive])
+
+            def validate_title(self, value):
+                return value.title()
+
+        serializer = ExampleSerializer(data={"name": "a book", "count": 2})
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data == {"title": "A Book", "count": 2}
+        serializer = ExampleSerializer(data={"name": "a book", "count": 0})
+        assert not serializer.is_valid()
+        assert serializer.errors == {"count": ["Must be positive."]}
+
+    def test_custom_empty_value_handling(self):
+        class BlankIsEmptyField(dt.StrField):
+            def validate_empty_values(self, data):
+                if data == "":
+                    return (True, "empty")
+                return super().validate_empty_values(data)
+
+        class ExampleSerializer(dt.Serializer):
+            char = BlankIsEmptyField()
+
+        serializer = ExampleSerializer(data={"char": ""})
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data == {"char": "empty"}
+        serializer = ExampleSerializer(data=[{"char": ""}, {"char": "a"}], many=True)
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data == [{"char": "empty"}, {"char": "a"}]
+
+
+class TestErrorDetail:
+    def test_detail_is_normalized_once(self):
+        child = dt.ValidationError({"name": ["Too long.", 1]})
+        detail = child.detail
+        assert detail == {"name": ["Too long.", "1"]}
+        assert child.detail is detail
+        parent = dt.ValidationError({0: detail})
+        assert parent.detail[0] is detail
+        assert dt.ValidationError(parent.detail).detail is parent.detail
+
+    def test_detail_setter(self):
+        exc = dt.ValidationError("Invalid.")
+        assert exc.detail == ["Invalid."]
+        exc.detail = {"name": 1}
+        assert exc.detail == {"name": "1"}
+        assert str(exc) == "{'name': '1'}"
+
+    def test_error_detail(self):
+        field = dt.IntField(max_value=3)
+        assert field.error_detail("max_value", max_value=3) == field.raise_if_fail("max_value", max_value=3).detail
+
+    def test_errors_render_as_json(self):
+        class ExampleSerializer(dt.Serializer):
+            char = dt.StrField()
+            integer = dt.IntField()
+
+        serializer = ExampleSerializer(data=[{"integer": "x"}], many=True)
+        assert not serializer.is_valid()
+        assert encode_json(serializer.errors) == (
+            b'{"0":{"char":["This field is required."],"integer":["A valid integer is required."]}}'
+        )
+
+
+class TestMaxErrors:
+    def setup(self):
+        class ExampleSerializer(dt.Serializer):
+            char = dt.StrField(max_length=2)
+            integer = dt.IntField()
+
+            class Meta:
+                max_errors = 2
+
+        self.Serializer = ExampleSerializer
+
+    def test_single(self):
+        serializer = self.Serializer(data={"char": "abc", "integer": "x"})
+        assert not serializer.is_valid()
+        assert list(serializer.errors) == ["char", "integer"]
+
+        class FirstErrorSerializer(self.Serializer):
+            class Meta:
+                max_errors = 1
+
+        serializer = FirstErrorSerializer(data={"char": "abc", "integer": "x"})
+        assert not serializer.is_valid()
+        assert serializer.errors == {"char": ["Must have no more than 2 characters."]}
+
+    def test_many(self):
+        data = [{"char": "a", "integer": 1}] + [{"char": "abc", "integer": "x"}] * 5000
+        serializer = self.Serializer(data=data, many=True)
+        assert not serializer.is_valid()
+        assert list(serializer.errors) == [1, 2]
+        assert serializer.errors[1] == {
+            "char": ["Must have no more than 2 characters."],
+            "integer": ["A valid integer is required."],
+        }
+
+    def test_stops_early(self):
+        calls = []
+
+        class CountingField(dt.StrField):
+            def run_validation_many(self, values, context):
+                calls.append(len(values))
+                return super().run_validation_many(values, context)
+
+        class ExampleSerializer(dt.Serializer):
+            char = CountingField(max_length=2)
+
+            class Meta:
+                max_errors = 10
+
+        serializer = ExampleSerializer(data=[{"char": "abc"}] * 5000, many=True)
+        assert not serializer.is_valid()
+        assert len(serializer.errors) == 10
+        assert calls == [1000]
+
+    def test_valid(self):
+        data = [{"char": "a", "integer": i} for i in range(2500)]
+        serializer = self.Serializer(data=data, many=True)
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.validated_data == data
+
+
+class TestBaseSerializer:
+    def setup(self):
+        class UpperSerializer(dt.BaseSerializer):
+            def deserialize(self, data, context):
+                return {"name": data["name"].upper()}
+
+            def create(self, validated_data):
+                return validated_data
+
+        self.Serializer = UpperSerializer
+
+    def test_save(self):
+        serializer = self.Serializer(data={"name": "a"})
+        assert serializer.is_valid(), serializer.errors
+        assert serializer.save(extra=1) == {"name": "A", "extra": 1}
+
+    def test_asave(self):
+        serializer = self.Serializer(data={"name": "a"})
+        assert serializer.is_valid(), serializer.errors
+        assert async_to_sync(serializer.asave)() == {"name": "A"}